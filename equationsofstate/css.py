@@ -24,3 +24,12 @@ class CSS(EquationOfState):
 
     def sound_speed_squared_from(self, pressure: float) -> float:
         return self.sound_speed_squared
+
+    def energy_density_gradient_from(self, pressure: float) -> dict[str, float]:
+        return {
+            "transitional_density": 1.0,
+            "delta_epsilon": 1.0,
+            "sound_speed_squared": -(pressure - self.transitional_pressure)
+            / self.sound_speed_squared**2,
+            "transitional_pressure": -1 / self.sound_speed_squared,
+        }
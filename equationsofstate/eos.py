@@ -23,3 +23,13 @@ class EquationOfState(ABC):
         dedp: float = (en_dens_plus_h - en_dens_minus_h) / (2 * h)
 
         return 1 / dedp
+
+    def energy_density_gradient_from(self, pressure: float) -> dict[str, float]:
+        """Derivatives of the energy density w.r.t. the EOS parameters
+        at fixed pressure, keyed by parameter name.
+        Non-parametric EOSs have none."""
+        return {}
+
+    def discontinuity_pressures(self) -> tuple[float, ...]:
+        """Pressures in MeV/fm^3 at which the energy density may jump."""
+        return ()
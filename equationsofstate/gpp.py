@@ -2,7 +2,6 @@ from pathlib import Path
 from functools import lru_cache
 from dataclasses import dataclass, field
 import numpy as np
-import pandas as pd
 
 from ..star.conversionfactors import GCM3_TO_MEVFM3
 
@@ -80,6 +79,11 @@ class GPP(EquationOfState):
             + (1 + a) / (K * gamma) * ((p_in_gcm3 - Lambda) / K) ** (1 / gamma - 1)
         )
 
+    def discontinuity_pressures(self) -> tuple[float, ...]:
+        """Pressures at the dividing densities, where the SLy4 crust fit
+        has small jumps in the energy density."""
+        return tuple(p * GCM3_TO_MEVFM3 for p in self._coeffs[0] if p > 0)
+
 
 @lru_cache
 def coefficients_at_dividing_densities(eos: str) -> Coeffs:
@@ -111,8 +115,18 @@ def Sly4_crust() -> Coeffs:
     return (rho_crust, K_crust, gamma_crust, lambda_crust, a_crust)
 
 
+def crust_transition_pressure() -> float:
+    """Pressure in MeV/fm^3 below which every GPP EOS shares the SLy4 crust,
+    i.e. the pressure at the last dividing density of the crust."""
+    rho, k, gamma, lambda_ = [c[-1] for c in Sly4_crust()[:4]]
+    return (k * rho**gamma + lambda_) * GCM3_TO_MEVFM3
+
+
 def connect_crust_core(crust: Coeffs, eos: str) -> CrustCoreCoeffs:
     def read_crust_core_coeff() -> CrustCoreData:
+        # pandas is imported lazily, to keep worker start-up light
+        import pandas as pd
+
         path = Path.cwd() / "src" / "neutron_stars_computer" / "equationsofstate"
         path = path / "tabulated_eos/GPP/TableIII_Boyle.dat"
         df: pd.DataFrame = pd.read_csv(path, sep=" ")
@@ -1,12 +1,19 @@
 from dataclasses import dataclass
-from typing import Any
-import pandas as pd
+from typing import TYPE_CHECKING, Any, Iterable
+import numpy as np
 from scipy.interpolate import InterpolatedUnivariateSpline as Spline
 
 from .eos import EquationOfState
 
+if TYPE_CHECKING:
+    import pandas as pd
 
-def read_table(file_path: str) -> pd.DataFrame:
+Array = np.ndarray
+
+TABLE_COLUMNS: tuple[str, ...] = ("e", "cs2", "gamma")
+
+
+def read_table(file_path: str) -> "pd.DataFrame":
     """
     Read table contained in a .csv file whose path is specified in file_path.
     Table header must be like: e p n cs2 gamma (a single white space).
@@ -16,10 +23,12 @@ def read_table(file_path: str) -> pd.DataFrame:
         raise ValueError(
             "File format is not valid, must be .csv with values separated by a white space."
         )
+    import pandas as pd
+
     return pd.read_csv(file_path, sep=" ")
 
 
-def interpolate_table(df: pd.DataFrame) -> dict[str, Spline]:
+def interpolate_table(df: "pd.DataFrame") -> dict[str, Spline]:
     """
     Interpolate Equation Of State from data table.
     Pressure (p) and energy density (e) are expected to be in MeV fm^-3!
@@ -34,6 +43,24 @@ def interpolate_table(df: pd.DataFrame) -> dict[str, Spline]:
     return {col: Spline(df["p"], df[col], k=3) for col in cols}
 
 
+def tabulate_eos(eos: EquationOfState, pressures: Iterable[float]) -> Array:
+    """
+    Evaluates an Equation Of State on a pressure grid.
+    Returns an array of shape (len(TABLE_COLUMNS), len(pressures)),
+    with rows ordered as in TABLE_COLUMNS.
+    """
+    return np.array(
+        [
+            (
+                eos.energy_density_from(p),
+                eos.sound_speed_squared_from(p),
+                eos.adiabatic_index_from(p),
+            )
+            for p in pressures
+        ]
+    ).T
+
+
 @dataclass
 class RIPEOS(EquationOfState):
     """Read and InterPolate Equation Of State from .csv file."""
@@ -41,7 +68,8 @@ class RIPEOS(EquationOfState):
     file_path: str
 
     def __post_init__(self) -> None:
-        df: pd.DataFrame = read_table(self.file_path)
+        df: "pd.DataFrame" = read_table(self.file_path)
+        self.pressures: Array = df["p"].to_numpy()
         self.interpolations: dict[str, Any] = interpolate_table(df)
 
     def energy_density_from(self, pressure: float) -> float:
@@ -55,3 +83,28 @@ class RIPEOS(EquationOfState):
 
     def sound_speed_squared_from(self, pressure: float) -> float:
         return float(self.interpolations["cs2"](pressure))
+
+
+@dataclass
+class TabulatedEOS(EquationOfState):
+    """InterPolate Equation Of State from an in-memory table.
+    Rows of 'table' are ordered as in TABLE_COLUMNS and
+    sampled at 'pressures' [MeV/fm³]."""
+
+    pressures: Array
+    table: Array
+
+    def __post_init__(self) -> None:
+        self.interpolations: dict[str, Any] = {
+            col: Spline(self.pressures, values, k=3)
+            for col, values in zip(TABLE_COLUMNS, self.table)
+        }
+
+    def energy_density_from(self, pressure: float) -> float:
+        return float(self.interpolations["e"](pressure))
+
+    def adiabatic_index_from(self, pressure: float) -> float:
+        return float(self.interpolations["gamma"](pressure))
+
+    def sound_speed_squared_from(self, pressure: float) -> float:
+        return float(self.interpolations["cs2"](pressure))
@@ -18,3 +18,6 @@ class MasslessMITBM(EquationOfState):
 
     def sound_speed_squared_from(self, pressure: float) -> float:
         return 1 / 3
+
+    def energy_density_gradient_from(self, pressure: float) -> dict[str, float]:
+        return {"BAG_PRESS": 4.0}
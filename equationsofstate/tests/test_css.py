@@ -41,3 +41,15 @@ def test_delta_epsilon_positive(eos: CSS) -> None:
 
 def test_transitional_pressure_positive(eos: CSS) -> None:
     assert eos.transitional_pressure > 0, "Transitional pressure should be > 0"
+
+
+def test_energy_density_gradient_from(eos: CSS) -> None:
+    gradient = eos.energy_density_gradient_from(100.0)
+    h = 1e-6
+    eos.sound_speed_squared += h
+    e_plus = eos.energy_density_from(100.0)
+    eos.sound_speed_squared -= 2 * h
+    e_minus = eos.energy_density_from(100.0)
+    assert gradient["sound_speed_squared"] == pytest.approx(
+        (e_plus - e_minus) / (2 * h), rel=1e-6
+    )
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from ..interpolate import TabulatedEOS
+from ..massless_mit_bm import MasslessMITBM
+from ..weighted_ceft import blend_tables, weighted_eos
+
+
+@pytest.fixture
+def mixture() -> TabulatedEOS:
+    return weighted_eos(
+        [MasslessMITBM(BAG_PRESS=57), MasslessMITBM(BAG_PRESS=100)],
+        [0.25, 0.75],
+        pressures=np.geomspace(1, 500, 200),
+    )
+
+
+def test_weighted_eos_energy_density(mixture: TabulatedEOS) -> None:
+    expected = 3 * 30.0 + 4 * (0.25 * 57 + 0.75 * 100)
+    assert np.isclose(mixture.energy_density_from(30.0), expected)
+
+
+def test_weighted_eos_sound_speed_squared(mixture: TabulatedEOS) -> None:
+    assert np.isclose(mixture.sound_speed_squared_from(30.0), 1 / 3)
+
+
+def test_weighted_eos_weights_mismatch_raises_error() -> None:
+    with pytest.raises(ValueError):
+        weighted_eos([MasslessMITBM()], [0.5, 0.5], pressures=np.array([1.0, 2.0]))
+
+
+def test_blend_tables_batch() -> None:
+    tables = np.stack([np.ones((3, 10)), np.zeros((3, 10))])
+    weights = np.column_stack((np.linspace(0, 1, 4), 1 - np.linspace(0, 1, 4)))
+    blended = blend_tables(tables, weights)
+    assert blended.shape == (4, 3, 10)
+    assert np.allclose(blended[:, 0, 0], np.linspace(0, 1, 4))
+
+
+def test_weighted_eos_needs_pressures_for_untabulated_eos() -> None:
+    with pytest.raises(ValueError, match="MasslessMITBM"):
+        weighted_eos([MasslessMITBM(), MasslessMITBM(BAG_PRESS=100)], [0.5, 0.5])
+
+
+def test_weighted_eos_on_shared_grid(mixture: TabulatedEOS) -> None:
+    other = TabulatedEOS(mixture.pressures[::2], mixture.table[:, ::2])
+    assert np.array_equal(
+        weighted_eos([mixture, other], [0.5, 0.5]).pressures, mixture.pressures
+    )
@@ -1,39 +1,106 @@
-from dataclasses import dataclass
+from functools import lru_cache
+from dataclasses import InitVar, dataclass, field
 from pathlib import Path
+from typing import Iterable, Optional, Sequence
+import numpy as np
 
-from .interpolate import RIPEOS
+from .interpolate import RIPEOS, TabulatedEOS, tabulate_eos
 from .eos import EquationOfState
 
+Array = np.ndarray
+
+
+def blend_tables(tables: Array, weights: Array) -> Array:
+    """Blends EOS tables of shape (n_eos, n_columns, n_pressures) with
+    weights of shape (n_eos,) or (n_samples, n_eos) in a single operation.
+    Returns the blended table(s) with the leading n_eos axis contracted."""
+    return np.tensordot(weights, tables, axes=(-1, 0))
+
+
+def shared_pressure_grid(eoss: Sequence[EquationOfState]) -> Array:
+    """Union of the tabulated pressures of every EOS in 'eoss', which must
+    all be tabulated (RIPEOS or TabulatedEOS)."""
+    untabulated: list[str] = [
+        type(eos).__name__ for eos in eoss if not isinstance(eos, (RIPEOS, TabulatedEOS))
+    ]
+    if untabulated:
+        raise ValueError(
+            f"No tabulated pressures for {', '.join(untabulated)}: "
+            "pass the pressures explicitly."
+        )
+    return np.unique(np.concatenate([eos.pressures for eos in eoss]))  # type: ignore
+
+
+def weighted_eos(
+    eoss: Sequence[EquationOfState],
+    weights: Sequence[float],
+    pressures: Optional[Array] = None,
+) -> TabulatedEOS:
+    """Mixes N EOSs as sum_i weights[i] * eos_i, precomputed on a shared
+    pressure grid. 'pressures' defaults to the union of the EOS tables,
+    and is required unless every EOS is tabulated (RIPEOS, TabulatedEOS)."""
+    if len(eoss) != len(weights):
+        raise ValueError("There must be one weight per equation of state.")
+
+    grid: Array = shared_pressure_grid(eoss) if pressures is None else pressures
+    tables = np.stack([tabulate_eos(eos, grid) for eos in eoss])
+
+    return TabulatedEOS(grid, blend_tables(tables, np.asarray(weights)))
+
+
+@lru_cache
+def hebeler_tables() -> tuple[Array, Array]:
+    """Tabulates the stiff and soft cEFT EOSs of Hebeler et al. (2013)
+    on their shared pressure grid."""
+    path = (
+        Path.cwd()
+        / "src"
+        / "neutron_stars_computer"
+        / "equationsofstate"
+        / "tabulated_eos"
+        / "Ha_EOS"
+    )
+    eoss = [RIPEOS(str(path / f)) for f in ("Hebelerstiff.csv", "Hebelersoft.csv")]
+    pressures: Array = shared_pressure_grid(eoss)
+
+    return pressures, np.stack([tabulate_eos(eos, pressures) for eos in eoss])
+
 
 @dataclass()
 class WeightedCEFT(EquationOfState):
+    """Mixes the stiff (weight) and soft (1 - weight) cEFT EOSs.
+    The blended table is precomputed once, so each call costs a single spline.
+    'blended' (the already blended EOS, see from_weights) skips the blend."""
+
     weight: float
+    blended: InitVar[Optional[TabulatedEOS]] = None
+    _eos: TabulatedEOS = field(init=False, repr=False)
 
-    def __post_init__(self) -> None:
-        path = (
-            Path.cwd()
-            / "src"
-            / "neutron_stars_computer"
-            / "equationsofstate"
-            / "tabulated_eos"
-            / "Ha_EOS"
-        )
-        self._eos1 = RIPEOS(str(path / "Hebelerstiff.csv"))
-        self._eos2 = RIPEOS(str(path / "Hebelersoft.csv"))
+    def __post_init__(self, blended: Optional[TabulatedEOS]) -> None:
+        if blended is None:
+            pressures, tables = hebeler_tables()
+            blended = TabulatedEOS(
+                pressures, blend_tables(tables, np.array([self.weight, 1 - self.weight]))
+            )
+        self._eos = blended
+
+    @classmethod
+    def from_weights(cls, weights: Iterable[float]) -> list["WeightedCEFT"]:
+        """Builds a batch of WeightedCEFT, blending all tables at once."""
+        w = np.fromiter(weights, dtype=float)
+        pressures, tables = hebeler_tables()
+        blended: Array = blend_tables(tables, np.column_stack((w, 1 - w)))
+
+        return [
+            cls(float(wi), TabulatedEOS(pressures, table))
+            for wi, table in zip(w, blended)
+        ]
 
     def energy_density_from(self, pressure: float) -> float:
-        return self._eos1.energy_density_from(
-            pressure
-        ) * self.weight + self._eos2.energy_density_from(pressure) * (1 - self.weight)
+        return self._eos.energy_density_from(pressure)
 
     def adiabatic_index_from(self, pressure: float) -> float:
-        return self._eos1.adiabatic_index_from(
-            pressure
-        ) * self.weight + self._eos2.adiabatic_index_from(pressure) * (1 - self.weight)
+        return self._eos.adiabatic_index_from(pressure)
 
     def sound_speed_squared_from(self, pressure: float) -> float:
-        return self._eos1.sound_speed_squared_from(
-            pressure
-        ) * self.weight + self._eos2.sound_speed_squared_from(pressure) * (
-            1 - self.weight
-        )
+        return self._eos.sound_speed_squared_from(pressure)
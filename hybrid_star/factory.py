@@ -1,13 +1,12 @@
 from typing import Any
-from functools import partial
 from dataclasses import dataclass, field
 
 from ..star.structure import InternalProfiles, Star
-from ..star.stability import RadOscInput, solve_rad_osc
+from ..star.stability import RadOscInput, Stability
 from ..star.tov_solver import Array, TOVInput
 from ..star.factory import StarFactory, StarStabilityFactory
-from .stability import set_Lagragian_vars_at_interface
-from .structure import HybridStar, phase_splitting_interface
+from .stability import TwoSidedStability
+from .structure import HybridStar
 
 
 @dataclass(slots=True)
@@ -18,11 +17,8 @@ class HybridStarFactory:
     fac: StarFactory = field(init=False)
 
     def __post_init__(self) -> None:
-        self.tov_input.events = (
-            partial(
-                phase_splitting_interface,
-                self.tov_input.eos.transitional_pressure,  # type: ignore
-            ),
+        self.tov_input.interface_pressures = (
+            self.tov_input.eos.transitional_pressures  # type: ignore
         )
         self.fac = StarFactory(self.tov_input)
 
@@ -40,10 +36,13 @@ class HybridStarFactory:
         )
 
     def set_core_radius(self, tov_solution: Any) -> float:
-        return float(tov_solution.t_events[1][0])
+        """Radius of the outermost interface, zero if there is no core."""
+        core_radius: Array = tov_solution.t_events[-1]
+        return float(core_radius[0]) if core_radius.size else 0.0
 
     def set_core_mass(self, tov_solution: Any) -> float:
-        return float(tov_solution.y_events[1][0][1])
+        core: Array = tov_solution.y_events[-1]
+        return float(core[0][1]) if core.size else 0.0
 
     def set_internal_profiles(self) -> InternalProfiles:
         return self.fac.set_internal_profiles()
@@ -58,6 +57,11 @@ class HybridStarStabilityFactory(StarStabilityFactory):
 
     def __post_init__(self) -> None:
         self.star_fac = HybridStarFactory(self.central_ro_in.tov_input)
+        if len(self.star_fac.tov_input.interface_pressures) > 1:
+            raise ValueError(
+                "The radial oscillations of hybrid stars "
+                + "support a single phase transition."
+            )
 
     def create_star(self, central_pressure: float) -> Any:
         return super().create_star(central_pressure)
@@ -67,23 +71,25 @@ class HybridStarStabilityFactory(StarStabilityFactory):
         return eval_radius[eval_radius <= self.structure.core_radius]
 
     def set_eval_radius_upper(self) -> Array:
+        """Mantle grid, from the surface down to the interface."""
         eval_radius: Array = super().set_eval_radius()
-        return eval_radius[eval_radius >= self.structure.core_radius]
+        return eval_radius[eval_radius >= self.structure.core_radius][::-1]
 
     def set_rad_osc_input(
         self, eval_radius: Array, initial_integration_vector: tuple[float, float]
     ) -> RadOscInput:
-        """Set 2nd rad_osc_input in order to integrate
-        from the interface to the star' surface."""
-        rad_osc_input1: RadOscInput = super().set_rad_osc_input(
+        """Set the core rad_osc_input, integrated from the center to the interface,
+        and return the mantle one, integrated from the surface (where
+        Delta p = 0) to the interface. Both floor the pressure at the same
+        fraction of the central pressure, see RadOscInput.surface_pressure."""
+        self._core_rad_osc_input: RadOscInput = super().set_rad_osc_input(
             eval_radius, initial_integration_vector
         )
 
-        self._rad_osc_sol1 = solve_rad_osc(self.omega_squared_guess, rad_osc_input1)
-
         return super().set_rad_osc_input(
             eval_radius=self.set_eval_radius_upper(),
-            initial_integration_vector=set_Lagragian_vars_at_interface(
-                rad_osc_input1, self._rad_osc_sol1, self.conversion_speed
-            ),
+            initial_integration_vector=(self.central_ro_in.central_xi, 0.0),
         )
+
+    def set_stability(self) -> Stability:
+        return TwoSidedStability(self._core_rad_osc_input, self.conversion_speed)
@@ -10,6 +10,25 @@ class HybridEOS(EquationOfState):
     eos2: EquationOfState
     transitional_pressure: float
 
+    @property
+    def transitional_pressures(self) -> tuple[float, ...]:
+        """Transitional pressures of this and of any nested HybridEOS,
+        allowing several successive phase transitions."""
+        return tuple(
+            p
+            for eos in (self.eos1, self.eos2)
+            if isinstance(eos, HybridEOS)
+            for p in eos.transitional_pressures
+        ) + (self.transitional_pressure,)
+
+    def discontinuity_pressures(self) -> tuple[float, ...]:
+        p_t: float = self.transitional_pressure
+        return (
+            tuple(p for p in self.eos1.discontinuity_pressures() if p < p_t)
+            + (p_t,)
+            + tuple(p for p in self.eos2.discontinuity_pressures() if p > p_t)
+        )
+
     def energy_density_from(self, pressure: float) -> float:
         return (
             self.eos1.energy_density_from(pressure)
@@ -23,3 +42,24 @@ class HybridEOS(EquationOfState):
             if (pressure <= self.transitional_pressure)
             else self.eos2.adiabatic_index_from(pressure)
         )
+
+    def sound_speed_squared_from(self, pressure: float) -> float:
+        return (
+            self.eos1.sound_speed_squared_from(pressure)
+            if (pressure <= self.transitional_pressure)
+            else self.eos2.sound_speed_squared_from(pressure)
+        )
+
+    def energy_density_gradient_from(self, pressure: float) -> dict[str, float]:
+        """Gradient w.r.t. the parameters of both phases, keyed 'eos1.<name>'
+        and 'eos2.<name>', zero for the phase absent at this pressure, so that
+        the keys are the same at every pressure. The transitional pressure is
+        not a parameter."""
+        active: EquationOfState = (
+            self.eos1 if (pressure <= self.transitional_pressure) else self.eos2
+        )
+        return {
+            f"{phase}.{name}": value if eos is active else 0.0
+            for phase, eos in (("eos1", self.eos1), ("eos2", self.eos2))
+            for name, value in eos.energy_density_gradient_from(pressure).items()
+        }
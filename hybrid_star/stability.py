@@ -1,8 +1,12 @@
 from typing import Any
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.optimize import OptimizeResult
 
 from .hybrid_eos import HybridEOS
-from ..star.stability import RadOscInput
-from ..star.tov_solver import pressure_derivative
+from ..star.stability import RadOscInput, Stability, solve_rad_osc
+from ..star.tov_solver import pressure_derivative, time_metric_fn_derivative
 
 
 def set_Lagragian_vars_at_interface(
@@ -35,11 +39,69 @@ def rapid_conversion(Delta_p_plus: float, rad_osc_input: RadOscInput) -> float:
     e_minus: float = eos.energy_density_from(eos.transitional_pressure * (1 + 1e-5))
 
     # Compute pressure dervative before (minus) and after (plus) the interface
-    dpdr_plus: float = pressure_derivative(
-        core_radius, e_plus, eos.transitional_pressure, core_mass
-    )
-    dpdr_minus: float = pressure_derivative(
-        core_radius, e_minus, eos.transitional_pressure, core_mass
+    dvdr: float = time_metric_fn_derivative(
+        core_radius, eos.transitional_pressure, core_mass
     )
+    dpdr_plus: float = pressure_derivative(e_plus, eos.transitional_pressure, dvdr)
+    dpdr_minus: float = pressure_derivative(e_minus, eos.transitional_pressure, dvdr)
 
     return Delta_p_plus / core_radius * (1 / dpdr_plus - 1 / dpdr_minus)
+
+
+@dataclass
+class TwoSidedStability(Stability):
+    """Finds the eigenfrequency of a hybrid star by shooting from the center
+    (core branch) and from the surface (mantle branch) towards the interface.
+    For each omega_squared, the core solution crosses the interface through
+    the slow/rapid junction conditions and the residual is the Wronskian
+    of both branches at the interface, which vanishes when they match.
+    Only one interface (the outermost) is handled."""
+
+    core_rad_osc_input: RadOscInput
+    conversion_speed: str
+
+    def solve_branches(
+        self, w2: float, mantle_rad_osc_input: RadOscInput
+    ) -> tuple[Any, Any]:
+        return (
+            solve_rad_osc(w2, self.core_rad_osc_input, lean=True),
+            solve_rad_osc(w2, mantle_rad_osc_input, lean=True),
+        )
+
+    def interface_values(
+        self, core_sol: Any, mantle_sol: Any
+    ) -> tuple[float, float, float, float]:
+        """xi and Delta p of the core (after the junction conditions)
+        and of the mantle branches at the interface."""
+        xi_core, Delta_p_core = set_Lagragian_vars_at_interface(
+            self.core_rad_osc_input, core_sol, self.conversion_speed
+        )
+        xi_mantle, Delta_p_mantle = (float(y[-1]) for y in mantle_sol.y)
+
+        return (xi_core, Delta_p_core, xi_mantle, Delta_p_mantle)
+
+    def shooting_residual(self, w2: float, rad_osc_input: RadOscInput) -> float:
+        xi_core, Delta_p_core, xi_mantle, Delta_p_mantle = self.interface_values(
+            *self.solve_branches(w2, rad_osc_input)
+        )
+        return xi_core * Delta_p_mantle - Delta_p_core * xi_mantle
+
+    def set_eigenfunctions(self, w2: float, rad_osc_input: RadOscInput) -> None:
+        core_sol: Any = solve_rad_osc(w2, self.core_rad_osc_input)
+        mantle_sol: Any = solve_rad_osc(w2, rad_osc_input)
+        xi_core, _, xi_mantle, _ = self.interface_values(core_sol, mantle_sol)
+
+        self.rad_osc_sol = join_branches(core_sol, mantle_sol, xi_core / xi_mantle)
+
+
+def join_branches(core_sol: Any, mantle_sol: Any, scale: float) -> OptimizeResult:
+    """Joins the core and the (rescaled) mantle solutions from the center
+    to the surface. The interface appears on both sides, since xi may be
+    discontinuous there."""
+    return OptimizeResult(
+        t=np.concatenate((core_sol.t, mantle_sol.t[::-1])),
+        y=np.hstack((core_sol.y, scale * mantle_sol.y[:, ::-1])),
+        t_events=[np.concatenate((core_sol.t_events[0], mantle_sol.t_events[0]))],
+        nfev=core_sol.nfev + mantle_sol.nfev,
+        success=core_sol.success and mantle_sol.success,
+    )
@@ -0,0 +1,123 @@
+from dataclasses import asdict, dataclass, field, replace
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+from concurrent.futures import Future, ProcessPoolExecutor
+
+import numpy as np
+
+from ..equationsofstate.eos import EquationOfState
+from ..star.constellation import (
+    ExecutorFactory,
+    create_stellar_family,
+    stars_to_dataframe,
+)
+from ..star.factory import StarFactory
+from ..star.journal import JournaledFactory
+from ..star.structure import Star
+from ..star.tov_solver import Array, TOVInput
+from .factory import HybridStarFactory
+from .hybrid_eos import HybridEOS
+from .structure import HybridStar
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@dataclass
+class HybridSweep:
+    """Creates hybrid star families for several transitional pressures.
+    Stars with central pressure at or below the transitional pressure are
+    pure hadronic stars: they are solved only once, for the whole sweep,
+    and reused for every HybridEOS(eos1=tov_input.eos, eos2=qm_eos, p_t).
+    With a 'journal' path, every star is checkpointed there (see
+    star.journal), so a restarted sweep only solves the missing stars.
+    Stars are created with the executor made by 'executor', e.g. a
+    star.work_queue.WorkQueueExecutor to spread the sweep over a cluster."""
+
+    tov_input: TOVInput
+    qm_eos: EquationOfState
+    central_pressures: Array
+    journal: Optional[str] = None
+    executor: ExecutorFactory = ProcessPoolExecutor
+    hadronic_family: "pd.DataFrame" = field(init=False)
+    branch_points: dict[float, Star] = field(init=False, default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self.central_pressures = np.sort(np.asarray(self.central_pressures))
+        self.hadronic_family = create_stellar_family(
+            self.hadronic_factory(), self.central_pressures, self.executor
+        )
+
+    def journaled(self, fac: Any) -> Any:
+        return fac if self.journal is None else JournaledFactory(fac, self.journal)
+
+    def hadronic_factory(self) -> Any:
+        return self.journaled(StarFactory(self.tov_input))
+
+    def hybrid_factory(self, transitional_pressure: float) -> Any:
+        hybrid_eos = HybridEOS(self.tov_input.eos, self.qm_eos, transitional_pressure)
+        return self.journaled(
+            HybridStarFactory(replace(self.tov_input, eos=hybrid_eos, events=()))
+        )
+
+    def create_families(self, transitional_pressures: Iterable[float]) -> "pd.DataFrame":
+        """Creates the hybrid families, solving only the stars whose central
+        pressure is above each transitional pressure. The hadronic star at
+        p_c = p_t (the branch point) is solved once per transitional pressure.
+        Returns a single DataFrame with a 'transitional_pressure' column."""
+        import pandas as pd
+
+        hadronic_fac: Any = self.hadronic_factory()
+        hybrid_facs: dict[float, Any] = {
+            p_t: self.hybrid_factory(p_t) for p_t in transitional_pressures
+        }
+        with self.executor() as executor:
+            jobs: dict[float, tuple[Future, list[Future]]] = {
+                p_t: (
+                    executor.submit(hadronic_fac.create_star, p_t),
+                    [
+                        executor.submit(hybrid_fac.create_star, cp)
+                        for cp in self.central_pressures[self.central_pressures > p_t]
+                    ],
+                )
+                for p_t, hybrid_fac in hybrid_facs.items()
+            }
+
+        self.branch_points.update({p_t: f.result() for p_t, (f, _) in jobs.items()})
+
+        families: list[pd.DataFrame] = []
+        for p_t, (_, hybrid_futures) in jobs.items():
+            family: pd.DataFrame = stars_to_dataframe(
+                [
+                    *self.hadronic_stars_below(p_t),
+                    as_hybrid_star(self.branch_points[p_t]),
+                    *[f.result() for f in hybrid_futures],
+                ]
+            )
+            family["transitional_pressure"] = p_t
+            families.append(family)
+
+        return pd.concat(families, ignore_index=True)
+
+    def hadronic_stars_below(self, transitional_pressure: float) -> list[HybridStar]:
+        below: "pd.DataFrame" = self.hadronic_family[
+            self.hadronic_family["central_pressure"] < transitional_pressure
+        ]
+        return [
+            HybridStar(**row)  # type: ignore
+            for row in below.to_dict(orient="records")
+        ]
+
+    def hadronic_structure_at(self, transitional_pressure: float) -> dict[str, float]:
+        """Hadronic star at the onset of the hybrid branch, in the same format
+        as figures.eos.plotter.hadronic_structure_at (without interpolation)."""
+        branch_point = asdict(self.branch_points[transitional_pressure])
+        return {
+            key: float(value)
+            for key, value in branch_point.items()
+            if key != "central_pressure" and value is not None
+        }
+
+
+def as_hybrid_star(star: Star) -> HybridStar:
+    """A one-phase star seen as a hybrid star without quark core."""
+    return HybridStar(**asdict(star))
@@ -0,0 +1,46 @@
+import pytest
+from ...equationsofstate.massless_mit_bm import MasslessMITBM
+from ...star.tov_solver import TOVInput
+from ..factory import HybridStarFactory
+from ..hybrid_eos import HybridEOS
+from ..structure import HybridStar
+
+
+@pytest.fixture()
+def hybrid_eos() -> HybridEOS:
+    return HybridEOS(
+        eos1=MasslessMITBM(BAG_PRESS=57),
+        eos2=HybridEOS(MasslessMITBM(BAG_PRESS=70), MasslessMITBM(BAG_PRESS=80), 200),
+        transitional_pressure=100,
+    )
+
+
+@pytest.fixture()
+def fac(hybrid_eos: HybridEOS) -> HybridStarFactory:
+    return HybridStarFactory(TOVInput(hybrid_eos))
+
+
+def test_transitional_pressures(hybrid_eos: HybridEOS) -> None:
+    assert hybrid_eos.transitional_pressures == (200, 100)
+
+
+def test_no_core_below_transitional_pressure(fac: HybridStarFactory) -> None:
+    star: HybridStar = fac.create_star(central_pressure=50)
+    assert (star.core_radius == 0.0) & (star.core_mass == 0.0)
+
+
+def test_one_segment_per_phase(fac: HybridStarFactory) -> None:
+    fac.create_star(central_pressure=300)
+    assert len(fac.fac.tov_solution.segments_nfev) == 3
+
+
+def test_core_radius_inside_star(fac: HybridStarFactory) -> None:
+    star: HybridStar = fac.create_star(central_pressure=300)
+    assert 0 < star.core_radius < star.radius
+
+
+@pytest.mark.filterwarnings("error::RuntimeWarning")
+def test_restarted_segments_stay_inside_the_horizon(fac: HybridStarFactory) -> None:
+    # the first trial step after an interface used to reach 2m/r > 1
+    star: HybridStar = fac.create_star(central_pressure=300)
+    assert star.mass < star.radius / 2
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+from ...equationsofstate.gpp import GPP
+from ...equationsofstate.massless_mit_bm import MasslessMITBM
+from ...star.factory import StarStabilityFactory
+from ...star.stability import CentralRadOscInput
+from ...star.tov_solver import TOVInput
+from ..factory import HybridStarStabilityFactory
+from ..hybrid_eos import HybridEOS
+
+
+def hybrid_omega_squared(bag_press: float, conversion_speed: str) -> float:
+    hybrid_eos = HybridEOS(MasslessMITBM(57), MasslessMITBM(bag_press), 50)
+    fac = HybridStarStabilityFactory(
+        CentralRadOscInput(TOVInput(hybrid_eos)),
+        omega_squared_guess=-1e-3,
+        conversion_speed=conversion_speed,
+    )
+    return fac.create_star(central_pressure=100).omega_squared  # type: ignore
+
+
+@pytest.fixture()
+def one_phase_omega_squared() -> float:
+    fac = StarStabilityFactory(CentralRadOscInput(TOVInput(MasslessMITBM(57))), -1e-3)
+    return fac.create_star(central_pressure=100).omega_squared
+
+
+@pytest.mark.parametrize("conversion_speed", ["slow", "rapid"])
+def test_vanishing_jump_matches_one_phase_star(
+    one_phase_omega_squared: float, conversion_speed: str
+) -> None:
+    omega_squared = hybrid_omega_squared(57.0001, conversion_speed)
+    assert np.isclose(omega_squared, one_phase_omega_squared, rtol=1e-2)
+
+
+def test_rapid_conversion_is_less_stable() -> None:
+    assert hybrid_omega_squared(70, "rapid") < hybrid_omega_squared(70, "slow")
+
+
+@pytest.mark.filterwarnings("error::RuntimeWarning")
+@pytest.mark.parametrize("conversion_speed", ["slow", "rapid"])
+def test_crust_mantle_without_jump_matches_one_phase_star(
+    conversion_speed: str,
+) -> None:
+    """The mantle branch starts at the surface of the SLy4 crust, where the
+    pressure vanishes."""
+    hybrid_fac = HybridStarStabilityFactory(
+        CentralRadOscInput(TOVInput(HybridEOS(GPP("SLY4"), GPP("SLY4"), 100))),
+        omega_squared_guess=1e-4,
+        conversion_speed=conversion_speed,
+    )
+    fac = StarStabilityFactory(CentralRadOscInput(TOVInput(GPP("SLY4"))), 1e-4)
+
+    omega_squared = hybrid_fac.create_star(central_pressure=200).omega_squared
+    assert np.isclose(
+        omega_squared,  # type: ignore
+        fac.create_star(central_pressure=200).omega_squared,  # type: ignore
+        rtol=1e-2,
+    )
+
+
+def test_several_phase_transitions_are_rejected() -> None:
+    hybrid_eos = HybridEOS(
+        MasslessMITBM(57),
+        HybridEOS(MasslessMITBM(70), MasslessMITBM(80), 200),
+        100,
+    )
+    with pytest.raises(ValueError):
+        HybridStarStabilityFactory(
+            CentralRadOscInput(TOVInput(hybrid_eos)),
+            omega_squared_guess=-1e-3,
+            conversion_speed="slow",
+        )
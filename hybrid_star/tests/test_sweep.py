@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+from ...equationsofstate.massless_mit_bm import MasslessMITBM
+from ...star.constellation import create_stellar_family
+from ...star.structure import Star
+from ...star.tov_solver import TOVInput
+from ..factory import HybridStarFactory
+from ..hybrid_eos import HybridEOS
+from ..structure import HybridStar
+from ..sweep import HybridSweep, as_hybrid_star
+
+CENTRAL_PRESSURES = np.array([50.0, 80.0, 120.0, 200.0, 300.0])
+
+
+@pytest.fixture(scope="module")
+def sweep_families() -> pd.DataFrame:
+    sweep = HybridSweep(
+        TOVInput(MasslessMITBM(57)), MasslessMITBM(70), CENTRAL_PRESSURES
+    )
+    return sweep.create_families([100.0, 150.0])
+
+
+def test_as_hybrid_star_has_no_core() -> None:
+    hybrid_star: HybridStar = as_hybrid_star(Star(50.0, 11.7, 1.6))
+    assert (hybrid_star.core_radius == 0.0) & (hybrid_star.core_mass == 0.0)
+
+
+def test_as_hybrid_star_keeps_structure() -> None:
+    hybrid_star: HybridStar = as_hybrid_star(Star(50.0, 11.7, 1.6))
+    assert (hybrid_star.radius == 11.7) & (hybrid_star.mass == 1.6)
+
+
+@pytest.mark.parametrize("transitional_pressure", [100.0, 150.0])
+def test_sweep_matches_hybrid_star_family(
+    sweep_families: pd.DataFrame, transitional_pressure: float
+) -> None:
+    hybrid_eos = HybridEOS(MasslessMITBM(57), MasslessMITBM(70), transitional_pressure)
+    family: pd.DataFrame = create_stellar_family(
+        HybridStarFactory(TOVInput(hybrid_eos)),
+        np.union1d(CENTRAL_PRESSURES, [transitional_pressure]),
+    )
+    # the branch point is solved as a one-phase star by the sweep
+    swept: pd.DataFrame = sweep_families[
+        sweep_families["transitional_pressure"] == transitional_pressure
+    ].drop(columns="transitional_pressure")
+
+    pd.testing.assert_frame_equal(
+        swept.reset_index(drop=True), family, check_dtype=False, rtol=1e-6
+    )
@@ -1,4 +1,5 @@
-from icecream import ic
+from typing import TYPE_CHECKING
+
 from equationsofstate.massless_mit_bm import MasslessMITBM
 
 from hybrid_star.factory import HybridStarFactory, HybridStarStabilityFactory
@@ -10,10 +11,15 @@ from equationsofstate.bps_fit import BPS_fit
 from equationsofstate.eos import EquationOfState
 
 import numpy as np
-import pandas as pd
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def main() -> None:
+    # icecream is only needed to print the results
+    from icecream import ic
+
     eos: EquationOfState = BPS_fit()
     qm_eos: EquationOfState = MasslessMITBM()
     hybrid_eos: EquationOfState = HybridEOS(
@@ -32,7 +38,7 @@ def main() -> None:
         conversion_speed='slow'
     )
     # fac = HybridStarFactory(tov_input)
-    hybrid_stars: pd.DataFrame = create_stellar_family(
+    hybrid_stars: "pd.DataFrame" = create_stellar_family(
         fac,
         central_pressures
     )
@@ -0,0 +1,104 @@
+import os
+import asyncio
+from typing import Any, AsyncIterator, Iterable, Optional
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+import pandas as pd
+
+from .constellation import Factory, stars_to_dataframe
+
+MAX_PENDING: int = 2 * (os.cpu_count() or 1)
+
+_shared_executor: Optional[Executor] = None
+
+
+def shared_executor() -> Executor:
+    """Process pool shared by every coroutine that is not given an executor,
+    created on first use and kept for the lifetime of the process."""
+    global _shared_executor
+    if _shared_executor is None:
+        _shared_executor = ProcessPoolExecutor()
+    return _shared_executor
+
+
+async def create_star(
+    fac: Factory, central_pressure: float, executor: Optional[Executor] = None
+) -> Any:
+    """Creates a star/hybrid star (and its stability, with a stability
+    factory) on 'executor' without blocking the event loop.
+    Cancelling it cancels the star if it has not started yet."""
+    return await asyncio.get_running_loop().run_in_executor(
+        executor or shared_executor(), fac.create_star, central_pressure
+    )
+
+
+async def iterate_stars(
+    fac: Factory,
+    central_pressures: Iterable[float],
+    executor: Optional[Executor] = None,
+    max_pending: int = MAX_PENDING,
+) -> AsyncIterator[Any]:
+    """Yields the stars as they complete (not in order of central pressure).
+    At most 'max_pending' stars are submitted at a time, the next ones as
+    the consumer takes the completed stars, so a slow consumer holds back
+    the submissions. Closing the iterator (with aclose, or by cancelling
+    its consumer), or a failed star, cancels the stars that have not
+    started."""
+    stars = indexed_stars(fac, central_pressures, executor, max_pending)
+    try:
+        async for _, star in stars:
+            yield star
+    finally:
+        await stars.aclose()
+
+
+async def indexed_stars(
+    fac: Factory,
+    central_pressures: Iterable[float],
+    executor: Optional[Executor],
+    max_pending: int,
+) -> AsyncIterator[tuple[int, Any]]:
+    """(index of the central pressure, star) pairs, see iterate_stars."""
+    if max_pending < 1:
+        raise ValueError("max_pending must be positive.")
+
+    remaining = enumerate(central_pressures)
+    pending: dict[asyncio.Future, int] = {}
+    try:
+        while True:
+            for i, central_pressure in remaining:
+                future = asyncio.ensure_future(create_star(fac, central_pressure, executor))
+                pending[future] = i
+                if len(pending) >= max_pending:
+                    break
+            if not pending:
+                return
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                yield (pending.pop(future), future.result())
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def create_stellar_family(
+    fac: Factory,
+    central_pressures: Iterable[float],
+    executor: Optional[Executor] = None,
+    max_pending: int = MAX_PENDING,
+) -> pd.DataFrame:
+    """Awaitable create_stellar_family: families of several EOSs can be
+    awaited concurrently (e.g. with asyncio.gather) on the same executor.
+    Stars are submitted as by iterate_stars, so each family has at most
+    'max_pending' stars in the executor, and a failed star cancels the
+    others before its error is raised."""
+    central_pressures = list(central_pressures)
+    stars: list[Any] = [None] * len(central_pressures)
+    family = indexed_stars(fac, central_pressures, executor, max_pending)
+    try:
+        async for i, star in family:
+            stars[i] = star
+    finally:
+        await family.aclose()
+
+    return stars_to_dataframe(stars)
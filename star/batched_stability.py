@@ -0,0 +1,215 @@
+from dataclasses import dataclass
+from typing import Any, Iterable
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from scipy.integrate import solve_ivp
+from scipy.interpolate import CubicSpline
+
+from . import conversionfactors as cf
+from .constellation import stars_to_dataframe
+from .factory import StarStabilityFactory
+from .stability import (
+    CentralRadOscInput,
+    EigenfrequencyNotConvergedError,
+    RadialOscillationsIntegrationError,
+)
+from .structure import InternalProfiles, Star, interpol_tov
+from .tov_solver import SURFACE_PRESSURE_LEVEL, Array, IntegrationBudget, ivp_method
+
+COMMON_GRID_POINTS: int = 2000
+BATCH_SIZE: int = 64
+MAX_ITERATIONS: int = 50
+
+
+def common_grid(n_points: int = COMMON_GRID_POINTS) -> Array:
+    """Normalized radial coordinate s = (r - r_0)/(R - r_0) in [0, 1],
+    clustered towards the surface, where the coefficients vary fastest."""
+    return 1 - (1 - np.linspace(0, 1, n_points)) ** 2
+
+
+@dataclass
+class OscillationBackground:
+    """TOV backgrounds of a batch of one-phase stars, tabulated on the common
+    grid in s, so that the radial oscillation eqs. of the whole batch are
+    evaluated at once. Columns: r, v, m, p, e and log(gamma * p), the
+    logarithm keeping Delta p / (gamma * p) finite near the surface."""
+
+    profiles: list[InternalProfiles]
+    central_ro_in: CentralRadOscInput
+    grid: Array
+
+    def __post_init__(self) -> None:
+        self.table: Array = np.stack(
+            [self.tabulate(ip) for ip in self.profiles], axis=1
+        )
+        self.radial_intervals: Array = np.array(
+            [(ip.radial_coord[0], ip.radial_coord[-1]) for ip in self.profiles]
+        )
+        central_pressures = [float(ip.pressures[0]) for ip in self.profiles]
+        self.initial_integration_vectors: Array = np.array(
+            [self.central_ro_in.initial_integration_vector(p) for p in central_pressures]
+        )
+        # each batched RHS evaluation evaluates every star once
+        self.budget: IntegrationBudget = self.central_ro_in.budget()
+
+    def tabulate(self, profile: InternalProfiles) -> Array:
+        eos = self.central_ro_in.tov_input.eos
+        r0, radius = (profile.radial_coord[0], profile.radial_coord[-1])
+        r: Array = r0 + self.grid * (radius - r0)
+        v, m, p = (spl(r) for spl in interpol_tov(profile))
+        # the pressure spline may undershoot zero in the last TOV step
+        p = np.clip(p, SURFACE_PRESSURE_LEVEL * profile.pressures[0], None)
+        e = np.array([eos.energy_density_from(pi) for pi in p])
+        gamma_p = np.array([eos.adiabatic_index_from(pi) * pi for pi in p])
+
+        return np.column_stack((r, v, m, p, e, np.log(gamma_p)))
+
+    def integrate(
+        self, stars: Array, w2: Array, **solve_ivp_kwargs: Any
+    ) -> Any:
+        """Integrates the radial oscillation eqs. of the stars of index 'stars'
+        with the omega_squared 'w2' (one per star, indices may repeat), from
+        the center (s = 0) to the surface (s = 1)."""
+        n: int = len(stars)
+        background = CubicSpline(self.grid, self.table[:, stars, :], axis=0)
+        dr_ds: Array = np.diff(self.radial_intervals[stars], axis=1)[:, 0]
+
+        def rad_osc_eqs(s: float, y: Array) -> Array:
+            xi, Dp = (y[:n], y[n:])
+            r, v, m, p, e, log_gamma_p = background(s).T
+            gamma_p: Array = np.exp(log_gamma_p)
+
+            exp_2lamb: Array = 1 / (1 - 2 * m / r)
+            dvdr: Array = (4 * np.pi * r * p * cf.MEV_FM3_TO_KM_2 + m / r**2) * exp_2lamb
+
+            dxidr: Array = -(3 * xi + Dp / gamma_p) / r + dvdr * xi
+            dDpdr: Array = (
+                r
+                * (e + p)
+                * (
+                    exp_2lamb
+                    * (w2 * np.exp(-2 * v) - 8 * np.pi * p * cf.MEV_FM3_TO_KM_2)
+                    + dvdr * (dvdr + 4 / r)
+                )
+                * xi
+            )
+            dDpdr -= (
+                dvdr + 4 * np.pi * r * (e + p) * cf.MEV_FM3_TO_KM_2 * exp_2lamb
+            ) * Dp
+
+            return np.concatenate((dxidr, dDpdr)) * np.tile(dr_ds, 2)
+
+        # the step size is controlled by the RMS error over all the stars:
+        # dividing the tolerances by sqrt(n) bounds the RMS error of every
+        # star by the tolerances of a star integrated alone
+        tolerance_scale: float = 1 / np.sqrt(n)
+        sol: Any = solve_ivp(
+            self.budget.budgeted(rad_osc_eqs),
+            (self.grid[0], self.grid[-1]),
+            self.initial_integration_vectors[stars].T.ravel(),
+            **ivp_method(self.central_ro_in.method),
+            atol=self.central_ro_in.INT_ABS_TOL * tolerance_scale,
+            rtol=self.central_ro_in.INT_REL_TOL * tolerance_scale,
+            **solve_ivp_kwargs,
+        )
+        if not sol.success:
+            raise RadialOscillationsIntegrationError(sol.message)
+
+        return sol
+
+    def delta_p_at_surface(self, stars: Array, w2: Array) -> Array:
+        return self.integrate(stars, w2).y[len(stars) :, -1]
+
+    def modes(self, w2: Array) -> Array:
+        """Number of nodes of xi for every star of the batch."""
+        stars: Array = np.arange(len(self.profiles))
+        xi: Array = self.integrate(stars, w2, t_eval=self.grid).y[: len(stars)]
+        return np.count_nonzero(np.diff(np.sign(xi), axis=1), axis=1)
+
+    def eigenfrequencies(self, omega_squared_guesses: Array) -> Array:
+        """Secant iterations for the whole batch: each iteration is a single
+        integration of the stars that have not converged yet, which leave the
+        batch as they converge (same criterion as Stability.find_frequency)."""
+        n: int = len(self.profiles)
+        x0: Array = np.broadcast_to(omega_squared_guesses, (n,)).astype(float)
+        x1: Array = x0 + np.abs(x0) * 1e-3
+        stars: Array = np.arange(n)
+
+        # both initial omega_squared trials in a single integration
+        f: Array = self.delta_p_at_surface(np.r_[stars, stars], np.r_[x0, x1])
+        f0, f1 = (f[:n], f[n:])
+        roots: Array = np.full(n, np.nan)
+
+        for _ in range(MAX_ITERATIONS):
+            x2: Array = x1 - f1 * (x1 - x0) / (f1 - f0)
+            converged: Array = np.abs(x2 - x1) <= (
+                self.central_ro_in.ROOT_ABS_TOL
+                + self.central_ro_in.ROOT_REL_TOL * np.abs(x2)
+            )
+            roots[stars[converged]] = x2[converged]
+
+            keep: Array = ~converged
+            if not keep.any():
+                return roots
+            stars, x0, f0, x1 = (stars[keep], x1[keep], f1[keep], x2[keep])
+            f1 = self.delta_p_at_surface(stars, x1)
+
+        raise EigenfrequencyNotConvergedError("Delta p did not converge at the surface.")
+
+
+def structure_and_profiles(
+    fac: StarStabilityFactory, central_pressure: float
+) -> tuple[Star, InternalProfiles]:
+    star: Star = fac.star_fac.create_star(central_pressure)
+    return (star, fac.star_fac.set_internal_profiles())
+
+
+def batch_stability(
+    profiles: list[InternalProfiles],
+    central_ro_in: CentralRadOscInput,
+    omega_squared_guess: float,
+) -> tuple[Array, Array]:
+    """omega_squared and modes of a batch of stars."""
+    background = OscillationBackground(profiles, central_ro_in, common_grid())
+    omega_squared: Array = background.eigenfrequencies(np.array(omega_squared_guess))
+
+    return (omega_squared, background.modes(omega_squared))
+
+
+def create_stellar_family_batched(
+    fac: StarStabilityFactory,
+    central_pressures: Iterable[float],
+    batch_size: int = BATCH_SIZE,
+) -> pd.DataFrame:
+    """Creates a family of one-phase stars computing their eigenfrequencies in
+    batches of 'batch_size' stars, with a single vectorized integration of the
+    radial oscillation eqs. per secant iteration and batch."""
+    central_pressures = list(central_pressures)
+    with ProcessPoolExecutor() as executor:
+        structures = list(
+            executor.map(
+                structure_and_profiles, [fac] * len(central_pressures), central_pressures
+            )
+        )
+        batches = [
+            structures[i : i + batch_size]
+            for i in range(0, len(structures), batch_size)
+        ]
+        stabilities = list(
+            executor.map(
+                batch_stability,
+                [[ip for _, ip in batch] for batch in batches],
+                [fac.central_ro_in] * len(batches),
+                [fac.omega_squared_guess] * len(batches),
+            )
+        )
+
+    omega_squared: Array = np.concatenate([w2 for w2, _ in stabilities])
+    modes: Array = np.concatenate([mode for _, mode in stabilities])
+
+    return stars_to_dataframe(
+        Star(star.central_pressure, star.radius, star.mass, int(mode), float(w2))
+        for (star, _), mode, w2 in zip(structures, modes, omega_squared)
+    )
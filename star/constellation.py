@@ -1,8 +1,24 @@
-from dataclasses import asdict
-from typing import Any, Iterable, Protocol
-from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, Protocol
+from concurrent.futures import Executor, ProcessPoolExecutor
 
-import pandas as pd
+from .family import StellarFamily
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# e.g. ProcessPoolExecutor, preloaded_pool or a (partial of)
+# work_queue.WorkQueueExecutor
+ExecutorFactory = Callable[[], Executor]
+
+# imported once by the fork server, instead of by every worker
+PRELOAD_MODULES: tuple[str, ...] = (
+    "numpy",
+    "scipy.integrate",
+    "scipy.optimize",
+    "scipy.interpolate",
+    f"{__name__.rpartition('.')[0]}.factory",
+)
 
 
 class Factory(Protocol):
@@ -11,15 +27,56 @@ class Factory(Protocol):
 
 
 def create_stellar_family(
-    fac: Factory, central_pressures: Iterable[float]
-) -> pd.DataFrame:
+    fac: Factory,
+    central_pressures: Iterable[float],
+    executor: ExecutorFactory = ProcessPoolExecutor,
+) -> "pd.DataFrame":
     """Creates a list of stars/hybrid stars for a given EOS and
     array of central pressures."""
-    with ProcessPoolExecutor() as executor:
-        futures = [executor.submit(fac.create_star, cp) for cp in central_pressures]
+    return stars_to_dataframe(create_stars(fac, central_pressures, executor))
+
+
+def create_family(
+    fac: Factory,
+    central_pressures: Iterable[float],
+    executor: ExecutorFactory = ProcessPoolExecutor,
+) -> StellarFamily:
+    """Creates a StellarFamily (columnar arrays, lazy interpolants)
+    of stars/hybrid stars for a given EOS and array of central pressures."""
+    return StellarFamily.from_stars(create_stars(fac, central_pressures, executor))
+
+
+def create_stars(
+    fac: Factory,
+    central_pressures: Iterable[float],
+    executor: ExecutorFactory = ProcessPoolExecutor,
+) -> list[Any]:
+    """Creates the stars/hybrid stars in parallel, one task per star, with
+    the executor made by 'executor' (local processes by default)."""
+    with executor() as pool:
+        futures = [pool.submit(fac.create_star, cp) for cp in central_pressures]
+
+    return [f.result() for f in futures]
+
+
+def preloaded_pool(
+    max_workers: Optional[int] = None, preload: Iterable[str] = PRELOAD_MODULES
+) -> ProcessPoolExecutor:
+    """ProcessPoolExecutor whose workers are forked from a fork server that
+    has already imported the 'preload' modules, so that new workers start
+    without importing them again (and, unlike forking this process, without
+    inheriting its threads, e.g. those of a StarService or an event loop).
+    The preload only takes effect before the fork server is first started."""
+    context: Any = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(list(preload))
+
+    return ProcessPoolExecutor(max_workers, mp_context=context)
+
 
-    stars = pd.concat([pd.DataFrame(asdict(f.result()), index=[0]) for f in futures])
-    stars.reset_index(drop=True, inplace=True)
-    stars.dropna(axis=1, inplace=True)
+def stars_to_dataframe(stars: Iterable[Any]) -> "pd.DataFrame":
+    """Gathers stars/hybrid stars in a DataFrame, one row per star.
+    Columns missing for every star (e.g. mode without radial oscillations)
+    are left out; those missing for some stars are NaN."""
+    from .records import StarRecords
 
-    return stars
+    return StarRecords.from_stars(stars).to_dataframe(nullable=False, status=False)
@@ -0,0 +1,244 @@
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Iterable, Optional
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.linalg import cho_factor, cho_solve, solve_triangular
+from scipy.stats import qmc
+
+from .constellation import Factory
+from .tov_solver import Array
+
+EMULATED_OBSERVABLES: tuple[str, ...] = ("radius", "mass", "omega_squared")
+
+
+def squared_exponential(x1: Array, x2: Array, length_scale: float) -> Array:
+    """Kernel matrix between the rows of x1 and x2 (inputs in the unit cube)."""
+    squared_distances: Array = ((x1[:, None, :] - x2[None, :, :]) ** 2).sum(axis=-1)
+    return np.exp(-0.5 * squared_distances / length_scale**2)
+
+
+def reduced_variance(
+    x: Array, inputs: Array, length_scale: float, nugget: float
+) -> Array:
+    """Posterior variance at 'x' of a unit amplitude process conditioned on
+    'inputs'. It does not depend on the training values."""
+    kernel: Array = squared_exponential(inputs, inputs, length_scale)
+    lower: Array = np.linalg.cholesky(kernel + nugget * np.eye(len(inputs)))
+    v: Array = solve_triangular(lower, squared_exponential(inputs, x, length_scale), lower=True)
+
+    return np.clip(1 - np.sum(v**2, axis=0), 0, None)
+
+
+@dataclass
+class GaussianProcess:
+    """Gaussian process regression of standardized values on the unit cube.
+    The length scale minimizes the leave-one-out error (Rippa's formula),
+    and the amplitude is the maximum likelihood estimate, so the predicted
+    standard deviation is calibrated on the training data."""
+
+    inputs: Array
+    values: Array
+    LENGTH_SCALES: tuple[float, ...] = (0.05, 0.1, 0.2, 0.3, 0.5, 0.8, 1.2)
+    NUGGET: float = 1e-10
+
+    def __post_init__(self) -> None:
+        self.mean: float = float(self.values.mean())
+        self.scale: float = float(self.values.std()) or 1.0
+        y: Array = (self.values - self.mean) / self.scale
+
+        self.length_scale: float = min(
+            self.LENGTH_SCALES, key=lambda ls: self.leave_one_out_error(ls, y)
+        )
+        self.cholesky: Any = cho_factor(self.kernel(self.inputs), lower=True)
+        self.weights: Array = cho_solve(self.cholesky, y)
+        self.amplitude: float = float(y @ self.weights) / len(y)
+
+    def kernel(self, inputs: Array, length_scale: Optional[float] = None) -> Array:
+        k: Array = squared_exponential(
+            inputs, inputs, length_scale or self.length_scale
+        )
+        return k + self.NUGGET * np.eye(len(inputs))
+
+    def leave_one_out_error(self, length_scale: float, y: Array) -> float:
+        try:
+            inverse_kernel: Array = np.linalg.inv(self.kernel(self.inputs, length_scale))
+        except np.linalg.LinAlgError:
+            return np.inf
+        return float(np.sum((inverse_kernel @ y / np.diag(inverse_kernel)) ** 2))
+
+    def predict(self, inputs: Array) -> tuple[Array, Array]:
+        """Mean and standard deviation at 'inputs' (shape (n, n_dim))."""
+        k: Array = squared_exponential(inputs, self.inputs, self.length_scale)
+        v: Array = solve_triangular(self.cholesky[0], k.T, lower=True)
+        variance: Array = self.amplitude * np.clip(1 - np.sum(v**2, axis=0), 0, None)
+
+        return (self.mean + self.scale * k @ self.weights, self.scale * np.sqrt(variance))
+
+
+def solve_star(
+    make_factory: Callable[[Array], Factory], parameters: Array, central_pressure: float
+) -> dict[str, float]:
+    """Solves one star and returns its emulated observables (NaN if missing)."""
+    star: dict[str, Any] = asdict(
+        make_factory(parameters).create_star(central_pressure)
+    )
+    return {
+        obs: np.nan if star.get(obs) is None else float(star[obs])
+        for obs in EMULATED_OBSERVABLES
+    }
+
+
+@dataclass
+class Emulator:
+    """Emulates radius [km], mass [km] and omega_squared [km⁻²] of the star
+    built by make_factory(parameters).create_star(central_pressure) over a box
+    of EOS parameters (e.g. CSS or HybridEOS ones) and central pressures.
+    One Gaussian process per observable is trained on solver output; predictions
+    come with a standard deviation, and predict_or_solve falls back to the solver
+    where it is too large. make_factory must be a module level function, since
+    the training stars are solved in parallel."""
+
+    make_factory: Callable[[Array], Factory]
+    parameter_bounds: Array
+    central_pressure_bounds: tuple[float, float]
+    inputs: Array = field(default_factory=lambda: np.empty((0, 0)))
+    observables: dict[str, Array] = field(default_factory=dict)
+    processes: dict[str, GaussianProcess] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        self.parameter_bounds = np.atleast_2d(self.parameter_bounds).astype(float)
+        if np.any(self.parameter_bounds[:, 0] >= self.parameter_bounds[:, 1]):
+            raise ValueError("Each parameter bound must be (lower, upper).")
+        if len(self.inputs):
+            self.fit()
+
+    @property
+    def lower_bounds(self) -> Array:
+        return np.r_[self.parameter_bounds[:, 0], np.log(self.central_pressure_bounds[0])]
+
+    @property
+    def upper_bounds(self) -> Array:
+        return np.r_[self.parameter_bounds[:, 1], np.log(self.central_pressure_bounds[1])]
+
+    def to_unit_cube(self, parameters: Array, central_pressures: Array) -> Array:
+        x: Array = np.column_stack(
+            (np.atleast_2d(parameters), np.log(central_pressures))
+        )
+        return (x - self.lower_bounds) / (self.upper_bounds - self.lower_bounds)
+
+    def from_unit_cube(self, x: Array) -> tuple[Array, Array]:
+        x = self.lower_bounds + x * (self.upper_bounds - self.lower_bounds)
+        return (x[:, :-1], np.exp(x[:, -1]))
+
+    def train(self, n_samples: int, seed: Optional[int] = None) -> None:
+        """Solves stars at a Latin hypercube design and fits the emulator."""
+        design: Array = qmc.LatinHypercube(d=len(self.lower_bounds), seed=seed).random(
+            n_samples
+        )
+        self.add_samples(design)
+
+    def add_samples(self, x: Array) -> None:
+        """Solves stars at the unit cube points 'x' and refits."""
+        parameters, central_pressures = self.from_unit_cube(x)
+        with ProcessPoolExecutor() as executor:
+            futures = [
+                executor.submit(solve_star, self.make_factory, theta, pc)
+                for theta, pc in zip(parameters, central_pressures)
+            ]
+        solved: list[dict[str, float]] = [f.result() for f in futures]
+
+        self.inputs = np.vstack((self.inputs.reshape(-1, x.shape[1]), x))
+        for obs in EMULATED_OBSERVABLES:
+            new: Array = np.array([s[obs] for s in solved])
+            self.observables[obs] = np.r_[self.observables.get(obs, []), new]
+        self.fit()
+
+    def fit(self) -> None:
+        """Fits one Gaussian process per observable, skipping missing values."""
+        self.processes = {}
+        for obs, values in self.observables.items():
+            known: Array = np.isfinite(values)
+            if known.any():
+                self.processes[obs] = GaussianProcess(self.inputs[known], values[known])
+
+    def predict(
+        self, parameters: Array, central_pressures: Iterable[float]
+    ) -> dict[str, tuple[Array, Array]]:
+        """Mean and standard deviation of every observable for each row of
+        'parameters' (shape (n, n_params)) and central pressure."""
+        x: Array = self.to_unit_cube(
+            parameters, np.fromiter(central_pressures, dtype=float)
+        )
+        return {obs: gp.predict(x) for obs, gp in self.processes.items()}
+
+    def predict_or_solve(
+        self,
+        parameters: Array,
+        central_pressures: Iterable[float],
+        relative_tolerance: float = 1e-3,
+    ) -> dict[str, Array]:
+        """Emulated observables, replaced by solver output for the stars whose
+        standard deviation exceeds relative_tolerance * |mean| for any of them."""
+        central_pressures = np.fromiter(central_pressures, dtype=float)
+        parameters = np.atleast_2d(parameters)
+        predictions = self.predict(parameters, central_pressures)
+
+        results: dict[str, Array] = {obs: p[0] for obs, p in predictions.items()}
+        uncertain: Array = np.any(
+            [std > relative_tolerance * np.abs(mean) for mean, std in predictions.values()],
+            axis=0,
+        )
+        for i in np.flatnonzero(uncertain):
+            star = solve_star(self.make_factory, parameters[i], central_pressures[i])
+            for obs in results:
+                results[obs][i] = star[obs]
+
+        return results
+
+    def refine(
+        self, n_samples: int, n_candidates: int = 2000, seed: Optional[int] = None
+    ) -> None:
+        """Active learning: greedily places n_samples new stars where the
+        (standardized) variance summed over the observables is the largest.
+        The variance does not depend on the values, so the whole batch is
+        chosen before solving any star."""
+        candidates: Array = qmc.LatinHypercube(
+            d=len(self.lower_bounds), seed=seed
+        ).random(n_candidates)
+        chosen: list[int] = []
+
+        for _ in range(n_samples):
+            inputs: Array = np.vstack((self.inputs, candidates[chosen]))
+            score: Array = sum(  # type: ignore
+                gp.amplitude
+                * reduced_variance(candidates, inputs, gp.length_scale, gp.NUGGET)
+                for gp in self.processes.values()
+            )
+            score[chosen] = -np.inf
+            chosen.append(int(np.argmax(score)))
+
+        self.add_samples(candidates[chosen])
+
+    def save(self, path: str) -> None:
+        """Saves the training set; the fit is redone on load."""
+        np.savez(
+            path,
+            parameter_bounds=self.parameter_bounds,
+            central_pressure_bounds=np.array(self.central_pressure_bounds),
+            inputs=self.inputs,
+            **self.observables,
+        )
+
+    @classmethod
+    def load(cls, path: str, make_factory: Callable[[Array], Factory]) -> "Emulator":
+        with np.load(path) as data:
+            return cls(
+                make_factory,
+                data["parameter_bounds"],
+                tuple(data["central_pressure_bounds"]),
+                data["inputs"],
+                {obs: data[obs] for obs in EMULATED_OBSERVABLES if obs in data},
+            )
@@ -0,0 +1,131 @@
+import numpy as np
+from typing import Any
+from dataclasses import dataclass, field
+from scipy.integrate import solve_ivp
+from scipy.interpolate import RectBivariateSpline
+
+from ..equationsofstate.eos import EquationOfState
+from .tov_solver import (
+    Array,
+    BoundaryNotFoundError,
+    TOVIntegrationError,
+    mass_derivative,
+    pressure_derivative,
+    time_metric_fn_derivative,
+)
+
+MATCHING_PRESSURES: int = 8
+MATCHING_PRESSURE_DECADES: float = 8.0
+MATCHING_RELATIVE_TOLERANCE: float = 1e-6
+
+
+@dataclass
+class CrustEnvelope:
+    """Crust thickness [km], crust mass [km] and increment of the time metric
+    function across the crust, tabulated once per crust model as functions
+    of the radius and compactness (mass/radius) at the crust base, where
+    p = transition_pressure [MeV/fm³].
+    Pass it as TOVInput.envelope to stop the core integration at the crust
+    base and look up the rest of the star, e.g. for a GPP ensemble:
+    CrustEnvelope(GPP("SLY4"), crust_transition_pressure()).
+    The crust is integrated with tight tolerances, since the table is
+    built only once. The internal profiles then end at the crust base,
+    so the radial oscillations cannot be solved with an envelope."""
+
+    crust_eos: EquationOfState
+    transition_pressure: float
+    base_radii: Array = field(default_factory=lambda: np.geomspace(5.0, 25.0, 21))
+    base_compactness: Array = field(
+        default_factory=lambda: np.geomspace(0.02, 0.34, 25)
+    )
+    MAX_RADIUS: float = 1e5
+    RELATIVE_TOLERANCE: float = 1e-10
+    ABSOLUTE_TOLERANCE: list[float] = field(
+        default_factory=lambda: [1e-12, 1e-12, 1e-20]
+    )
+
+    def __post_init__(self) -> None:
+        table: Array = np.array(
+            [
+                [self.integrate_crust(r, c * r) for c in self.base_compactness]
+                for r in self.base_radii
+            ]
+        )
+        # all increments are positive and vary over decades: interpolate logs
+        self.interpolations: list[Any] = [
+            RectBivariateSpline(self.base_radii, self.base_compactness, np.log(col))
+            for col in np.moveaxis(table, -1, 0)
+        ]
+
+    def integrate_crust(
+        self, base_radius: float, base_mass: float
+    ) -> tuple[float, float, float]:
+        """Integrates the TOV eqs. from the crust base to the surface.
+        Returns the crust thickness, mass and time metric function increment."""
+        eos: EquationOfState = self.crust_eos
+
+        def tov_equations(r: float, y: Array) -> tuple[float, float, float]:
+            v, m, p = y
+            e: float = eos.energy_density_from(pressure=p)
+
+            dvdr: float = time_metric_fn_derivative(r, p, m)
+            return (dvdr, mass_derivative(r, e), pressure_derivative(e, p, dvdr))
+
+        def boundary_event(r: float, y: Array) -> float:
+            return y[2]
+
+        boundary_event.terminal = True  # type: ignore
+        boundary_event.direction = -1  # type: ignore
+
+        crust: Any = solve_ivp(
+            tov_equations,
+            (base_radius, self.MAX_RADIUS),
+            (0.0, base_mass, self.transition_pressure),
+            method="DOP853",
+            rtol=self.RELATIVE_TOLERANCE,
+            atol=self.ABSOLUTE_TOLERANCE,
+            events=boundary_event,
+        )
+
+        if not crust.success:
+            raise TOVIntegrationError(
+                "The integration of the crust was not successfull..."
+            )
+        if crust.status != 1:
+            raise BoundaryNotFoundError("The crust's boundary was not reached.")
+
+        radius: float = float(crust.t_events[0][0])
+        v, mass, _ = crust.y_events[0][0]
+
+        return (radius - base_radius, float(mass) - base_mass, float(v))
+
+    def matches(self, eos: EquationOfState) -> bool:
+        """Whether 'eos' has the energy density of the crust EOS below the
+        transition pressure, at MATCHING_PRESSURES pressures spanning
+        MATCHING_PRESSURE_DECADES decades below it."""
+        pressures: Array = self.transition_pressure * np.logspace(
+            -MATCHING_PRESSURE_DECADES, 0, MATCHING_PRESSURES, endpoint=False
+        )
+        return bool(
+            np.allclose(
+                [eos.energy_density_from(p) for p in pressures],
+                [self.crust_eos.energy_density_from(p) for p in pressures],
+                rtol=MATCHING_RELATIVE_TOLERANCE,
+            )
+        )
+
+    def covers(self, radius: float, mass: float) -> bool:
+        """Whether the crust base (radius, mass) lies inside the table."""
+        return bool(
+            (self.base_radii[0] <= radius <= self.base_radii[-1])
+            & (self.base_compactness[0] <= mass / radius <= self.base_compactness[-1])
+        )
+
+    def crust_from(self, radius: float, mass: float) -> tuple[float, float, float]:
+        """Crust thickness, mass and time metric function increment
+        for a crust base at (radius, mass)."""
+        thickness, crust_mass, dv = (
+            float(np.exp(interpolation(radius, mass / radius)[0, 0]))
+            for interpolation in self.interpolations
+        )
+        return (thickness, crust_mass, dv)
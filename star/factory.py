@@ -3,7 +3,13 @@ import numpy as np
 from typing import Any
 from dataclasses import dataclass, field
 
-from .tov_solver import Array, TOVInput, solve_tov
+from .tov_solver import (
+    SURFACE_PRESSURE_LEVEL,
+    Array,
+    IntegrationBudget,
+    TOVInput,
+    solve_tov,
+)
 from .stability import CentralRadOscInput, RadOscInput, Stability
 from .structure import InternalProfiles, Star, interpol_tov, tov_coeffs
 
@@ -43,6 +49,7 @@ class StarStabilityFactory:
         self.structure: Any = self.star_fac.create_star(central_pressure)
         print(self.structure)
         self.ip: InternalProfiles = self.star_fac.set_internal_profiles()
+        self.budget: IntegrationBudget = self.central_ro_in.budget()
 
         initial_integration_vector: tuple[float, float] = (
             self.central_ro_in.central_xi,
@@ -53,7 +60,7 @@ class StarStabilityFactory:
         rad_osc_input: RadOscInput = self.set_rad_osc_input(
             eval_radius, initial_integration_vector
         )
-        self.stability = Stability()
+        self.stability = self.set_stability()
         self.stability.find_frequency(
             rad_osc_input,
             self.omega_squared_guess,
@@ -70,6 +77,9 @@ class StarStabilityFactory:
     def set_eval_radius(self) -> Array:
         return self.ip.radial_coord
 
+    def set_stability(self) -> Stability:
+        return Stability()
+
     def set_rad_osc_input(
         self, eval_radius: Array, initial_integration_vector: tuple[float, float]
     ) -> RadOscInput:
@@ -86,6 +96,10 @@ class StarStabilityFactory:
             INT_REL_TOL=self.central_ro_in.INT_REL_TOL,
             ROOT_ABS_TOL=self.central_ro_in.ROOT_ABS_TOL,
             ROOT_REL_TOL=self.central_ro_in.ROOT_REL_TOL,
+            method=self.central_ro_in.method,
+            budget=self.budget,
+            # as in the sensitivities, relative to the central pressure
+            surface_pressure=SURFACE_PRESSURE_LEVEL * float(self.ip.pressures[0]),
         )
 
     def set_internal_profiles(self) -> InternalProfiles:
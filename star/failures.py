@@ -0,0 +1,29 @@
+from typing import Optional
+
+from .stability import (
+    EigenfrequencyNotConvergedError,
+    RadialOscillationsIntegrationError,
+)
+from .tov_solver import (
+    BoundaryNotFoundError,
+    IntegrationBudgetExceededError,
+    TOVIntegrationError,
+)
+
+# checked in order; invalid inputs (any other ValueError) are not failures
+FAILURE_REASONS: tuple[tuple[type, str], ...] = (
+    (IntegrationBudgetExceededError, "timed_out"),
+    (TOVIntegrationError, "tov_integration"),
+    (BoundaryNotFoundError, "boundary_not_found"),
+    (RadialOscillationsIntegrationError, "radial_oscillations"),
+    (ArithmeticError, "arithmetic"),
+    (EigenfrequencyNotConvergedError, "not_converged"),
+)
+
+
+def failure_reason(error: Exception) -> Optional[str]:
+    """Reason code of a star's failure, None if it is not a solver failure."""
+    return next(
+        (reason for err_type, reason in FAILURE_REASONS if isinstance(error, err_type)),
+        None,
+    )
@@ -0,0 +1,126 @@
+import numpy as np
+from typing import TYPE_CHECKING, Any, Iterable
+from dataclasses import asdict, dataclass, field
+from scipy.interpolate import PchipInterpolator
+
+from .tov_solver import Array
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@dataclass
+class StellarFamily:
+    """Family of stars/hybrid stars stored as columnar arrays sorted by
+    central pressure. Interpolants are built lazily, on the first query,
+    and cached. Missing values (e.g. omega_squared of a failed star) are NaN."""
+
+    columns: dict[str, Array]
+    _interpolants: dict[tuple[str, str], Any] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        order: Array = np.argsort(self.columns["central_pressure"], kind="stable")
+        self.columns = {
+            key: np.ascontiguousarray(np.asarray(col, dtype=float)[order])
+            for key, col in self.columns.items()
+        }
+
+    @classmethod
+    def from_stars(cls, stars: Iterable[Any]) -> "StellarFamily":
+        records: list[dict[str, Any]] = [asdict(star) for star in stars]
+        keys: list[str] = [
+            key for key in records[0] if any(r[key] is not None for r in records)
+        ]
+        return cls(
+            {
+                key: np.array([np.nan if r[key] is None else r[key] for r in records])
+                for key in keys
+            }
+        )
+
+    @classmethod
+    def from_dataframe(cls, df: "pd.DataFrame") -> "StellarFamily":
+        return cls({str(key): df[key].to_numpy() for key in df.columns})
+
+    def to_dataframe(self) -> "pd.DataFrame":
+        import pandas as pd
+
+        return pd.DataFrame(self.columns)
+
+    def __len__(self) -> int:
+        return len(self.columns["central_pressure"])
+
+    def __getitem__(self, key: str) -> Array:
+        return self.columns[key]
+
+    @property
+    def stable(self) -> Array:
+        """Stable-branch mask: omega_squared > 0 if radial oscillations were
+        computed, otherwise the turning-point criterion dM/dp_c > 0."""
+        if "omega_squared" in self.columns:
+            return self.columns["omega_squared"] > 0
+        return np.gradient(self["mass"], self["central_pressure"]) > 0
+
+    @property
+    def maximum_mass(self) -> tuple[float, float]:
+        """Maximum mass and its central pressure, refined with the
+        M(log p_c) interpolant around the largest tabulated mass."""
+        i: int = int(np.nanargmax(self["mass"]))
+        if i in (0, len(self) - 1):
+            return (float(self["mass"][i]), float(self["central_pressure"][i]))
+
+        log_pc: Array = np.log(self["central_pressure"][i - 1 : i + 2])
+        fine_log_pc: Array = np.linspace(log_pc[0], log_pc[-1], 201)
+        fine_mass: Array = self.interpolant("log_central_pressure", "mass")(fine_log_pc)
+        j: int = int(np.argmax(fine_mass))
+
+        return (float(fine_mass[j]), float(np.exp(fine_log_pc[j])))
+
+    def interpolant(self, x: str, y: str) -> Any:
+        """Monotone cubic interpolant of y(x), cached. x may be
+        'log_central_pressure', or 'mass' (restricted to the stable branch
+        below the maximum mass, where it is single valued)."""
+        if (x, y) not in self._interpolants:
+            if x == "log_central_pressure":
+                mask: Array = np.isfinite(self[y])
+                xs: Array = np.log(self["central_pressure"][mask])
+                ys: Array = self[y][mask]
+            elif x == "mass":
+                xs, ys = self.stable_branch(y)
+            else:
+                raise ValueError("Interpolants are built in log_central_pressure or mass.")
+            self._interpolants[(x, y)] = PchipInterpolator(xs, ys, extrapolate=False)
+
+        return self._interpolants[(x, y)]
+
+    def stable_branch(self, y: str) -> tuple[Array, Array]:
+        """(mass, y) along the stable branch leading to the maximum mass,
+        keeping only strictly increasing masses."""
+        i_max: int = int(np.nanargmax(self["mass"]))
+        mask: Array = self.stable[: i_max + 1] & np.isfinite(self[y][: i_max + 1])
+        masses: Array = self["mass"][: i_max + 1][mask]
+        ys: Array = self[y][: i_max + 1][mask]
+        increasing: Array = masses > np.maximum.accumulate(np.r_[-np.inf, masses[:-1]])
+
+        return (masses[increasing], ys[increasing])
+
+    def at_mass(self, y: str, masses: Iterable[float]) -> Array:
+        """Column y on the stable branch at the given masses [km].
+        NaN above the maximum mass or below the lightest star."""
+        return self.interpolant("mass", y)(np.fromiter(masses, dtype=float))
+
+    def radius_at(self, masses: Iterable[float]) -> Array:
+        return self.at_mass("radius", masses)
+
+    def at_central_pressure(
+        self, central_pressures: Iterable[float]
+    ) -> dict[str, Array]:
+        """Every column interpolated at the given central pressures."""
+        log_pc: Array = np.log(np.fromiter(central_pressures, dtype=float))
+        return {
+            key: self.interpolant("log_central_pressure", key)(log_pc)
+            for key in self.columns
+            if key != "central_pressure"
+        }
@@ -0,0 +1,143 @@
+import functools
+import numpy as np
+import pandas as pd
+from typing import Iterable, Optional
+from dataclasses import dataclass
+from scipy.interpolate import InterpolatedUnivariateSpline as Spline
+
+from ..equationsofstate.css import CSS
+from ..equationsofstate.eos import EquationOfState
+from ..equationsofstate.massless_mit_bm import MasslessMITBM
+from .constellation import create_stellar_family, stars_to_dataframe
+from .factory import StarFactory, StarStabilityFactory
+from .stability import CentralRadOscInput
+from .structure import Star
+from .tov_solver import Array, TOVInput
+
+REFERENCE_ENERGY_SCALE: float = 228.0
+REDUCED_CENTRAL_PRESSURES: tuple[float, ...] = tuple(np.geomspace(1e-3, 1e2, 300))
+
+
+def homology_parameters(eos: EquationOfState) -> tuple[float, float]:
+    """Sound speed squared and energy scale e_0 [MeV/fm³] of an EOS of the form
+    e = e_0 + p/cs2, whose TOV solutions are homologous under e_0 -> s e_0:
+    p -> s p, e -> s e, r -> r/sqrt(s), m -> m/sqrt(s), omega² -> s omega²."""
+    if isinstance(eos, MasslessMITBM):
+        return (1 / 3, 4 * eos.BAG_PRESS)
+    if isinstance(eos, CSS):
+        energy_scale: float = eos.transitional_density + eos.delta_epsilon
+        energy_scale -= eos.transitional_pressure / eos.sound_speed_squared
+        if energy_scale <= 0:
+            raise ValueError("CSS family is homologous only for e(p=0) > 0.")
+        return (eos.sound_speed_squared, energy_scale)
+
+    raise ValueError(f"{type(eos).__name__} has no homologous families.")
+
+
+def rescale(family: pd.DataFrame, scale: float) -> pd.DataFrame:
+    """Maps a family computed with energy scale e_0 to energy scale scale*e_0."""
+    rescaled: pd.DataFrame = family.copy()
+    rescaled["central_pressure"] *= scale
+    rescaled["radius"] /= np.sqrt(scale)
+    rescaled["mass"] /= np.sqrt(scale)
+    if "omega_squared" in rescaled:
+        rescaled["omega_squared"] *= scale
+
+    return rescaled
+
+
+@dataclass
+class HomologousFamily:
+    """Family of self-bound stars of e = e_0 + p/cs2, computed once
+    at REFERENCE_ENERGY_SCALE and mapped to any e_0 without ODE solves."""
+
+    sound_speed_squared: float
+    family: pd.DataFrame
+
+    def rescaled(self, energy_scale: float) -> pd.DataFrame:
+        """The whole cached family for energy scale e_0 [MeV/fm³]."""
+        return rescale(self.family, energy_scale / REFERENCE_ENERGY_SCALE)
+
+    def stars_at(
+        self, energy_scale: float, central_pressures: Iterable[float]
+    ) -> pd.DataFrame:
+        """Stars for energy scale e_0 [MeV/fm³] at the given central pressures,
+        interpolating the cached family in log(central pressure)."""
+        scale: float = energy_scale / REFERENCE_ENERGY_SCALE
+        log_pc: Array = np.log(np.fromiter(central_pressures, dtype=float) / scale)
+        log_pc_ref: Array = np.log(self.family["central_pressure"].to_numpy())
+
+        if (log_pc.min() < log_pc_ref[0]) or (log_pc.max() > log_pc_ref[-1]):
+            raise ValueError("Central pressures outside of the homologous family.")
+
+        stars = pd.DataFrame({"central_pressure": np.exp(log_pc)})
+        for col in self.family.columns.drop(["central_pressure", "mode"], errors="ignore"):
+            stars[col] = Spline(log_pc_ref, self.family[col])(log_pc)
+        if "mode" in self.family:
+            nearest = np.abs(log_pc[:, None] - log_pc_ref[None, :]).argmin(axis=1)
+            stars["mode"] = self.family["mode"].to_numpy()[nearest]
+
+        return rescale(stars, scale)
+
+
+@functools.lru_cache
+def homologous_family(
+    sound_speed_squared: float,
+    omega_squared_guess: Optional[float] = None,
+    reduced_central_pressures: tuple[float, ...] = REDUCED_CENTRAL_PRESSURES,
+) -> HomologousFamily:
+    """Computes (once per sound speed squared) the family at the reference
+    energy scale, for central pressures p_c/e_0 in 'reduced_central_pressures'.
+    Radial oscillations are solved only if omega_squared_guess is given
+    (in km⁻², at the reference energy scale, for the lowest central
+    pressure), see continued_stars."""
+    eos = CSS(REFERENCE_ENERGY_SCALE, 0.0, sound_speed_squared, 0.0)
+    tov_input = TOVInput(eos)
+    central_pressures: Array = REFERENCE_ENERGY_SCALE * np.sort(
+        reduced_central_pressures
+    )
+
+    if omega_squared_guess is None:
+        family: pd.DataFrame = create_stellar_family(
+            StarFactory(tov_input), central_pressures
+        )
+    else:
+        fac = StarStabilityFactory(CentralRadOscInput(tov_input), omega_squared_guess)
+        family = stars_to_dataframe(continued_stars(fac, central_pressures))
+
+    return HomologousFamily(sound_speed_squared, family)
+
+
+def continued_stars(
+    fac: StarStabilityFactory, central_pressures: Iterable[float]
+) -> list[Star]:
+    """Creates the stars one after the other, by increasing central pressure,
+    starting the eigenfrequency search of each star from the eigenfrequency
+    of the previous one, so that the same mode is followed over decades
+    of central pressure."""
+    stars: list[Star] = []
+    for central_pressure in sorted(central_pressures):
+        star: Star = fac.create_star(central_pressure)
+        fac.omega_squared_guess = star.omega_squared  # type: ignore
+        stars.append(star)
+
+    return stars
+
+
+def create_homologous_family(
+    eos: EquationOfState,
+    central_pressures: Optional[Iterable[float]] = None,
+    omega_squared_guess: Optional[float] = None,
+) -> pd.DataFrame:
+    """Family of stars of a MasslessMITBM or CSS EOS obtained by rescaling
+    the cached homologous family: the whole cached family if no central
+    pressures are given, otherwise interpolated at 'central_pressures'."""
+    sound_speed_squared, energy_scale = homology_parameters(eos)
+    homologous: HomologousFamily = homologous_family(
+        sound_speed_squared, omega_squared_guess
+    )
+
+    if central_pressures is None:
+        return homologous.rescaled(energy_scale)
+
+    return homologous.stars_at(energy_scale, central_pressures)
@@ -0,0 +1,138 @@
+import os
+import json
+import hashlib
+import functools
+import importlib
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
+from typing import Any, Optional
+
+import numpy as np
+
+from ..equationsofstate.interpolate import RIPEOS
+
+
+def canonical(obj: Any) -> Any:
+    """Description of a factory (or of its inputs) that is stable across runs:
+    dataclasses by their init fields, other objects (e.g. CSS) by their
+    attributes, arrays by their content, RIPEOSs by the content of their
+    table file and functions by their qualified name, instead of their
+    memory address or path."""
+    if isinstance(obj, RIPEOS):
+        with open(obj.file_path, "rb") as table:
+            return ("RIPEOS", hashlib.sha256(table.read()).hexdigest())
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return (
+            type(obj).__name__,
+            tuple((f.name, canonical(getattr(obj, f.name))) for f in fields(obj) if f.init),
+        )
+    if isinstance(obj, functools.partial):
+        return ("partial", canonical(obj.func), canonical(obj.args))
+    if isinstance(obj, (list, tuple)):
+        return tuple(canonical(item) for item in obj)
+    if isinstance(obj, np.ndarray):
+        return ("array", obj.shape, hashlib.sha256(obj.tobytes()).hexdigest())
+    if isinstance(obj, dict):
+        return tuple(sorted((str(key), canonical(value)) for key, value in obj.items()))
+    if callable(obj):
+        return getattr(obj, "__qualname__", type(obj).__name__)
+    if hasattr(obj, "__dict__"):
+        return (type(obj).__name__, canonical(vars(obj)))
+
+    return repr(obj)
+
+
+def fingerprint(fac: Any) -> str:
+    """Key of a factory in the journal: its class, EOS, TOVInput settings
+    and, if any, radial oscillation settings."""
+    return hashlib.sha256(repr(canonical(fac)).encode()).hexdigest()[:16]
+
+
+def append_to_journal(
+    path: str,
+    key: str,
+    central_pressure: float,
+    star: Any = None,
+    failure: Optional[str] = None,
+) -> None:
+    """Appends one record (one JSON line) and flushes it to disk, so that it
+    survives the job being killed. Lines are written in a single append,
+    so several processes can share the journal. If the journal ends with a
+    line torn by a killed job, the record starts on a new line."""
+    record: dict[str, Any] = {
+        "key": key,
+        "central_pressure": float(central_pressure),
+        "star_type": None if star is None else star_type(star),
+        "star": None if star is None else asdict(star),
+        "failure": failure,
+    }
+    line: bytes = (json.dumps(record, default=float) + "\n").encode()
+    fd: int = os.open(path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        size: int = os.fstat(fd).st_size
+        if size and (os.pread(fd, 1, size - 1) != b"\n"):
+            line = b"\n" + line
+        os.write(fd, line)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def read_journal(path: str, key: str) -> dict[float, Any]:
+    """Stars completed by the factory of fingerprint 'key', by central pressure.
+    Failed stars are left out, so they are recomputed; a truncated last
+    line (the job was killed while writing it) is ignored."""
+    completed: dict[float, Any] = {}
+    if not os.path.exists(path):
+        return completed
+
+    with open(path) as journal:
+        for line in journal:
+            try:
+                record: dict[str, Any] = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if (record["key"] == key) and (record["star"] is not None):
+                completed[record["central_pressure"]] = star_from_record(record)
+
+    return completed
+
+
+def star_type(star: Any) -> str:
+    return f"{type(star).__module__}:{type(star).__qualname__}"
+
+
+def star_from_record(record: dict[str, Any]) -> Any:
+    module, name = record["star_type"].split(":")
+    return getattr(importlib.import_module(module), name)(**record["star"])
+
+
+@dataclass
+class JournaledFactory:
+    """Wraps a factory so that its stars are checkpointed in the journal at
+    'path' (JSON lines), keyed by (fingerprint of the factory, central
+    pressure). Stars already in the journal are returned without solving
+    them again, so a restarted create_stellar_family (or sweep) only solves
+    the missing or failed stars. The journal is read once, on creation."""
+
+    fac: Any
+    path: str
+    key: str = field(init=False)
+    completed: dict[float, Any] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.key = fingerprint(self.fac)
+        self.completed = read_journal(self.path, self.key)
+
+    def create_star(self, central_pressure: float) -> Any:
+        if central_pressure in self.completed:
+            return self.completed[central_pressure]
+        try:
+            star: Any = self.fac.create_star(central_pressure)
+        except Exception as error:
+            append_to_journal(
+                self.path, self.key, central_pressure, failure=type(error).__name__
+            )
+            raise
+        append_to_journal(self.path, self.key, central_pressure, star)
+
+        return star
@@ -0,0 +1,158 @@
+import math
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
+
+import numpy as np
+
+from .failures import FAILURE_REASONS
+from .tov_solver import Array
+
+# fields of Star and HybridStar, in order
+FIELDS: dict[str, np.dtype] = {
+    "central_pressure": np.dtype(np.float64),
+    "radius": np.dtype(np.float64),
+    "mass": np.dtype(np.float64),
+    "mode": np.dtype(np.int64),
+    "omega_squared": np.dtype(np.float64),
+    "core_radius": np.dtype(np.float64),
+    "core_mass": np.dtype(np.float64),
+}
+STATUSES: tuple[str, ...] = ("ok", *(reason for _, reason in FAILURE_REASONS))
+INITIAL_CAPACITY: int = 1024
+GROWTH_FACTOR: int = 2
+
+
+@dataclass
+class StarRecords:
+    """Records of stars/hybrid stars with a fixed schema (FIELDS), stored as
+    one array per field (struct of arrays) with an explicit missing-value
+    mask per field, and a status code per record (index in STATUSES, e.g.
+    a failed star has status 'not_converged' and every field but its
+    central pressure missing). Missing floats are also NaN in the values.
+    Appending is amortized O(1): the arrays grow geometrically."""
+
+    capacity: int = INITIAL_CAPACITY
+
+    def __post_init__(self) -> None:
+        if self.capacity < 1:
+            raise ValueError("capacity must be positive.")
+        self.size: int = 0
+        self.values: dict[str, Array] = {
+            name: np.empty(self.capacity, dtype) for name, dtype in FIELDS.items()
+        }
+        self.missing: dict[str, Array] = {
+            name: np.empty(self.capacity, bool) for name in FIELDS
+        }
+        self.status: Array = np.empty(self.capacity, np.int8)
+
+    @classmethod
+    def from_stars(cls, stars: Iterable[Any]) -> "StarRecords":
+        records = cls()
+        for star in stars:
+            records.append(star)
+        return records
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, name: str) -> Array:
+        """Values of a field (a view, NaN or undefined where missing)."""
+        return self.values[name][: self.size]
+
+    def mask(self, name: str) -> Array:
+        """Missing-value mask of a field (a view)."""
+        return self.missing[name][: self.size]
+
+    def statuses(self) -> Array:
+        return np.array(STATUSES)[self.status[: self.size]]
+
+    @property
+    def nbytes(self) -> int:
+        arrays: list[Array] = [*self.values.values(), *self.missing.values()]
+        return sum(arr.nbytes for arr in arrays) + self.status.nbytes
+
+    def append(
+        self,
+        star: Any = None,
+        central_pressure: Optional[float] = None,
+        status: str = "ok",
+    ) -> None:
+        """Appends a star, or a failed star (star=None) of the given central
+        pressure and status."""
+        if status not in STATUSES:
+            raise ValueError(f"status must be one of {STATUSES}.")
+        if (star is None) and (central_pressure is None):
+            raise ValueError("A failed star needs its central pressure.")
+        if self.size == self.capacity:
+            self.grow()
+
+        i: int = self.size
+        for name, dtype in FIELDS.items():
+            value: Any = (
+                getattr(star, name, None)
+                if star is not None
+                else (central_pressure if name == "central_pressure" else None)
+            )
+            is_missing: bool = (value is None) or (
+                dtype.kind == "f" and math.isnan(value)
+            )
+            self.missing[name][i] = is_missing
+            if is_missing:
+                value = np.nan if dtype.kind == "f" else 0
+            self.values[name][i] = value
+        self.status[i] = STATUSES.index(status)
+        self.size += 1
+
+    def grow(self) -> None:
+        self.capacity *= GROWTH_FACTOR
+        for arrays in (self.values, self.missing):
+            for name, arr in arrays.items():
+                arrays[name] = np.resize(arr, self.capacity)
+        self.status = np.resize(self.status, self.capacity)
+
+    def present(self) -> list[str]:
+        """Fields that are not missing for every record."""
+        return [name for name in FIELDS if not self.mask(name).all()]
+
+    def to_dataframe(self, nullable: bool = True, status: bool = True) -> Any:
+        """DataFrame of the fields present in any record (and 'status').
+        'nullable' columns are pandas masked arrays on the values and masks,
+        without copies; otherwise missing values are NaN (mode is float if
+        any is missing), which copies only the mode column."""
+        import pandas as pd
+
+        columns: dict[str, Any] = {}
+        for name in self.present():
+            values, mask = (self[name], self.mask(name))
+            if nullable:
+                columns[name] = (
+                    pd.arrays.FloatingArray(values, mask)
+                    if FIELDS[name].kind == "f"
+                    else pd.arrays.IntegerArray(values, mask)
+                )
+            else:
+                columns[name] = (
+                    np.where(mask, np.nan, values)
+                    if (FIELDS[name].kind != "f") and mask.any()
+                    else values
+                )
+        if status:
+            columns["status"] = pd.Categorical.from_codes(
+                self.status[: self.size], categories=STATUSES
+            )
+
+        return pd.DataFrame(columns, copy=False)
+
+    def to_arrow(self) -> Any:
+        """pyarrow Table of the fields present in any record (and 'status'),
+        with the masks as validity bitmaps. Unlike to_dataframe, it copies
+        the values and packs the masks into bitmaps. Requires pyarrow."""
+        import pyarrow as pa
+
+        columns: dict[str, Any] = {
+            name: pa.array(self[name], mask=self.mask(name)) for name in self.present()
+        }
+        columns["status"] = pa.DictionaryArray.from_arrays(
+            self.status[: self.size], list(STATUSES)
+        )
+        return pa.table(columns)
@@ -0,0 +1,229 @@
+import time
+from dataclasses import asdict, replace
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional
+from concurrent.futures import ProcessPoolExecutor, wait
+
+import numpy as np
+
+from .constellation import ExecutorFactory, Factory
+from .failures import failure_reason
+from .journal import append_to_journal, fingerprint, read_journal
+from .tov_solver import TOVInput
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+Retry = Callable[[Any], Optional[Any]]
+
+RELAXATION_FACTOR: float = 10.0
+MAX_RADIUS_FACTOR: float = 10.0
+STIFF_TOLERANCE_FACTOR: float = 1e-3
+
+
+def try_create_star(
+    fac: Factory,
+    central_pressure: float,
+    deadline: Optional[float] = None,
+    journal: Optional[tuple[str, str]] = None,
+) -> tuple[Any, Optional[str]]:
+    """(star, None) or (None, reason code) if the solvers failed.
+    Any other exception is raised, since it is not a numerical failure.
+    With a 'deadline' (time.time() of the family), the wall time budgets of
+    the star are capped by the time left, so that it stops by itself.
+    With a 'journal' (path, key), the outcome is appended to it."""
+    result: tuple[Any, Optional[str]] = (None, "timed_out")
+    time_left: float = np.inf if deadline is None else deadline - time.time()
+    if time_left > 0:
+        if deadline is not None:
+            fac = with_wall_time_cap(fac, time_left)
+        try:
+            result = (fac.create_star(central_pressure), None)
+        except Exception as error:
+            reason: Optional[str] = failure_reason(error)
+            if reason is None:
+                raise
+            result = (None, reason)
+
+    if journal is not None:
+        append_to_journal(*journal, central_pressure, *result)
+    return result
+
+
+def with_inputs(
+    fac: Any, tov_changes: dict[str, Any], rad_osc_changes: dict[str, Any]
+) -> Any:
+    """Copy of a StarFactory, HybridStarFactory or of their stability
+    counterparts with the changed TOVInput fields, and CentralRadOscInput
+    fields if it solves radial oscillations."""
+    if not hasattr(fac, "central_ro_in"):
+        return replace(fac, tov_input=replace(fac.tov_input, **tov_changes))
+
+    tov_input: TOVInput = replace(fac.central_ro_in.tov_input, **tov_changes)
+    return replace(
+        fac,
+        central_ro_in=replace(fac.central_ro_in, tov_input=tov_input, **rad_osc_changes),
+    )
+
+
+def tov_input_of(fac: Any) -> TOVInput:
+    return fac.central_ro_in.tov_input if hasattr(fac, "central_ro_in") else fac.tov_input
+
+
+def scaled_rad_osc_tolerances(fac: Any, factor: float) -> dict[str, float]:
+    if not hasattr(fac, "central_ro_in"):
+        return {}
+    return {
+        "INT_ABS_TOL": fac.central_ro_in.INT_ABS_TOL * factor,
+        "INT_REL_TOL": fac.central_ro_in.INT_REL_TOL * factor,
+    }
+
+
+def with_wall_time_cap(fac: Any, wall_time: float) -> Any:
+    """Copy of the factory whose TOV and radial oscillation wall time
+    budgets are at most 'wall_time' [s]."""
+
+    def capped(max_wall_time: Optional[float]) -> float:
+        return wall_time if max_wall_time is None else min(max_wall_time, wall_time)
+
+    rad_osc_changes: dict[str, Any] = (
+        {"MAX_WALL_TIME": capped(fac.central_ro_in.MAX_WALL_TIME)}
+        if hasattr(fac, "central_ro_in")
+        else {}
+    )
+    return with_inputs(
+        fac, {"MAX_WALL_TIME": capped(tov_input_of(fac).MAX_WALL_TIME)}, rad_osc_changes
+    )
+
+
+def relax_tolerances(fac: Any) -> Any:
+    """TOV and radial oscillation tolerances RELAXATION_FACTOR times larger."""
+    tov_input: TOVInput = tov_input_of(fac)
+    return with_inputs(
+        fac,
+        {
+            "RELATIVE_TOLERANCE": tov_input.RELATIVE_TOLERANCE * RELAXATION_FACTOR,
+            "ABSOLUTE_TOLERANCE": [
+                tol * RELAXATION_FACTOR for tol in tov_input.ABSOLUTE_TOLERANCE
+            ],
+        },
+        scaled_rad_osc_tolerances(fac, RELAXATION_FACTOR),
+    )
+
+
+def larger_max_radius(fac: Any) -> Any:
+    """MAX_RADIUS_FACTOR times larger TOVInput.MAX_RADIUS."""
+    return with_inputs(
+        fac, {"MAX_RADIUS": tov_input_of(fac).MAX_RADIUS * MAX_RADIUS_FACTOR}, {}
+    )
+
+
+def stiff_method(fac: Any) -> Any:
+    """LSODA ("auto") for the TOV and radial oscillation eqs.; the radial
+    oscillation tolerances are STIFF_TOLERANCE_FACTOR times smaller, since
+    DOP853's defaults are too loose for the lower order methods."""
+    rad_osc_changes: dict[str, Any] = scaled_rad_osc_tolerances(
+        fac, STIFF_TOLERANCE_FACTOR
+    )
+    if rad_osc_changes:
+        rad_osc_changes["method"] = "auto"
+
+    return with_inputs(fac, {"method": "auto"}, rad_osc_changes)
+
+
+def flipped_omega_squared_guess(fac: Any) -> Optional[Any]:
+    """Seeds the eigenfrequency search with -omega_squared_guess,
+    i.e. on the other side of the stability threshold.
+    None (not applicable) without radial oscillations."""
+    if getattr(fac, "omega_squared_guess", None) is None:
+        return None
+
+    return replace(fac, omega_squared_guess=-fac.omega_squared_guess)
+
+
+RETRY_LADDER: tuple[Retry, ...] = (
+    relax_tolerances,
+    larger_max_radius,
+    stiff_method,
+    flipped_omega_squared_guess,
+)
+
+
+def create_stellar_family_with_retries(
+    fac: Factory,
+    central_pressures: Iterable[float],
+    retries: Iterable[Retry] = RETRY_LADDER,
+    deadline: Optional[float] = None,
+    journal: Optional[str] = None,
+    executor: ExecutorFactory = ProcessPoolExecutor,
+) -> "pd.DataFrame":
+    """Creates a family of stars/hybrid stars, one row per central pressure,
+    without aborting it when some stars fail. Failed stars are rerun with
+    each step of the retry ladder in turn, each applied to the original
+    factory, until they succeed; a step returning None is skipped.
+    Retries must be module level functions (or partials), since stars are
+    created in parallel. Adds the columns 'failure' (reason code of the
+    last attempt, see failures.FAILURE_REASONS, missing on success) and 'retries'
+    (number of ladder steps tried); stars that never succeed are NaN.
+    With a 'deadline' [s] for the whole family, the running stars stop
+    cooperatively when it passes (their wall time budgets are capped by the
+    time left), the outstanding ones are cancelled, no more retries are
+    run, and all of them are reported as 'timed_out'.
+    With a 'journal' path, every attempt is checkpointed as it completes
+    (see star.journal), under the fingerprint of 'fac' even for retries,
+    and the stars already completed in the journal are not solved again.
+    Stars are created with the executor made by 'executor'."""
+    central_pressures = list(central_pressures)
+    deadline_at: Optional[float] = None if deadline is None else time.time() + deadline
+    journal_key: Optional[tuple[str, str]] = (
+        None if journal is None else (journal, fingerprint(fac))
+    )
+    completed: dict[float, Any] = {} if journal_key is None else read_journal(*journal_key)
+    stars: list[Any] = [completed.get(pc) for pc in central_pressures]
+    failures: list[Optional[str]] = [None] * len(central_pressures)
+    attempts: list[int] = [0] * len(central_pressures)
+
+    with executor() as pool:
+
+        def run(fac: Any, indices: list[int]) -> None:
+            futures = [
+                pool.submit(
+                    try_create_star, fac, central_pressures[i], deadline_at, journal_key
+                )
+                for i in indices
+            ]
+            time_left: Optional[float] = (
+                None if deadline_at is None else max(deadline_at - time.time(), 0.0)
+            )
+            for future in wait(futures, timeout=time_left).not_done:
+                future.cancel()
+            for i, future in zip(indices, futures):
+                stars[i], failures[i] = (
+                    (None, "timed_out") if future.cancelled() else future.result()
+                )
+
+        run(fac, [i for i, star in enumerate(stars) if star is None])
+
+        for retry in retries:
+            if (deadline_at is not None) and (time.time() >= deadline_at):
+                break
+            failed: list[int] = [i for i, star in enumerate(stars) if star is None]
+            retry_fac: Optional[Any] = retry(fac) if failed else None
+            if retry_fac is None:
+                continue
+            for i in failed:
+                attempts[i] += 1
+            run(retry_fac, failed)
+
+    import pandas as pd
+
+    df = pd.DataFrame(
+        [
+            {"central_pressure": pc} if star is None else asdict(star)
+            for pc, star in zip(central_pressures, stars)
+        ]
+    )
+    df.dropna(axis=1, how="all", inplace=True)
+    df["failure"] = failures
+    df["retries"] = attempts
+
+    return df
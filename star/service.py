@@ -0,0 +1,219 @@
+import json
+import threading
+import urllib.request
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Hashable, Iterable, Optional
+from concurrent.futures import Future, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+
+from .constellation import ExecutorFactory, Factory
+from .target_mass import star_with_mass
+
+CACHE_SIZE: int = 4096
+DEFAULT_ADDRESS: tuple[str, int] = ("127.0.0.1", 8765)
+METHODS: tuple[str, ...] = (
+    "factories",
+    "create_star",
+    "create_stellar_family",
+    "star_with_mass",
+)
+
+
+class ServiceError(Exception):
+    pass
+
+
+@dataclass
+class StarService:
+    """Long-running service creating the stars of named factories on a warm
+    executor (kept for the lifetime of the service). Solved stars are kept
+    in a least recently used cache of 'cache_size' stars, keyed by
+    (factory name, registration, query, value), and concurrent requests for
+    the same star (e.g. overlapping families of the same EOS) share a single
+    solve. Replacing a factory never serves the stars of the previous one,
+    even those still being solved.
+    Served over HTTP (JSON-RPC 2.0) with 'serve', see ServiceClient."""
+
+    factories: dict[str, Factory]
+    executor: ExecutorFactory = ProcessPoolExecutor
+    cache_size: int = CACHE_SIZE
+    cache: "OrderedDict[Hashable, Any]" = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        self.pool = self.executor()
+        self.lock = threading.Lock()
+        self.in_flight: dict[Hashable, Future] = {}
+        # registration number of each factory, part of the keys of its stars
+        self.generations: dict[str, int] = {name: 0 for name in self.factories}
+        self.hits: int = 0
+
+    def __enter__(self) -> "StarService":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.pool.shutdown(cancel_futures=True)
+
+    def register(self, name: str, fac: Factory) -> None:
+        """Adds (or replaces) a factory, dropping its cached stars and
+        detaching the requests in flight from the new registration."""
+        with self.lock:
+            self.factories[name] = fac
+            self.generations[name] = self.generations.get(name, -1) + 1
+            for stars in (self.cache, self.in_flight):
+                for key in [key for key in stars if key[0] == name]:
+                    del stars[key]
+
+    def factory(self, name: str) -> tuple[Factory, int]:
+        """Factory registered as 'name', and its registration number."""
+        with self.lock:
+            if name not in self.factories:
+                raise ServiceError(f"Unknown factory '{name}'.")
+            return (self.factories[name], self.generations[name])
+
+    def star_future(
+        self, key: tuple[str, int, str, float], fn: Callable[..., Any], *args: Any
+    ) -> Future:
+        """Cached star, star being solved, or a new solve of fn(*args)."""
+        with self.lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                self.hits += 1
+                future: Future = Future()
+                future.set_result(self.cache[key])
+                return future
+            if key in self.in_flight:
+                self.hits += 1
+                return self.in_flight[key]
+
+            future = self.pool.submit(fn, *args)
+            self.in_flight[key] = future
+        future.add_done_callback(lambda f: self.store(key, f))
+
+        return future
+
+    def store(self, key: tuple[str, int, str, float], future: Future) -> None:
+        with self.lock:
+            if self.in_flight.get(key) is future:
+                del self.in_flight[key]
+            stale: bool = key[1] != self.generations.get(key[0])
+            if stale or future.cancelled() or (future.exception() is not None):
+                return
+            self.cache[key] = future.result()
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+
+    def create_star(self, name: str, central_pressure: float) -> Any:
+        return self.create_stars(name, [central_pressure])[0]
+
+    def create_stars(self, name: str, central_pressures: Iterable[float]) -> list[Any]:
+        fac, generation = self.factory(name)
+        futures = [
+            self.star_future(
+                (name, generation, "central_pressure", float(pc)), fac.create_star, pc
+            )
+            for pc in central_pressures
+        ]
+        return [f.result() for f in futures]
+
+    def star_with_mass(self, name: str, target_mass: float) -> Any:
+        fac, generation = self.factory(name)
+        key = (name, generation, "mass", float(target_mass))
+        return self.star_future(key, star_with_mass, fac, target_mass).result()
+
+    def call(self, method: str, params: dict[str, Any]) -> Any:
+        """JSON compatible result of a JSON-RPC method (see METHODS)."""
+        if method not in METHODS:
+            raise ServiceError(f"Unknown method '{method}'.")
+        if method == "factories":
+            return list(self.factories)
+        if method == "create_star":
+            return asdict(self.create_star(params["name"], params["central_pressure"]))
+        if method == "star_with_mass":
+            return asdict(self.star_with_mass(params["name"], params["target_mass"]))
+
+        return [
+            asdict(star)
+            for star in self.create_stars(params["name"], params["central_pressures"])
+        ]
+
+    def serve(self, address: tuple[str, int] = DEFAULT_ADDRESS) -> ThreadingHTTPServer:
+        """HTTP server of the service (not started: call its serve_forever,
+        e.g. in a thread). Binding to port 0 picks a free port."""
+        server = ThreadingHTTPServer(address, JSONRPCHandler)
+        server.service = self  # type: ignore
+        return server
+
+
+class JSONRPCHandler(BaseHTTPRequestHandler):
+    def do_POST(self) -> None:
+        request: dict[str, Any] = {}
+        try:
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            result: Any = self.server.service.call(  # type: ignore
+                request["method"], request.get("params", {})
+            )
+            response: dict[str, Any] = {"result": result}
+        except Exception as error:
+            response = {"error": {"code": -32000, "message": f"{type(error).__name__}: {error}"}}
+
+        body: bytes = json.dumps(
+            {"jsonrpc": "2.0", "id": request.get("id"), **response}, default=float
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@dataclass
+class ServiceClient:
+    """Client of a StarService served at 'url', e.g. from a notebook."""
+
+    url: str = f"http://{DEFAULT_ADDRESS[0]}:{DEFAULT_ADDRESS[1]}"
+    timeout: Optional[float] = None
+
+    def call(self, method: str, **params: Any) -> Any:
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps(
+                {"jsonrpc": "2.0", "id": 0, "method": method, "params": params}
+            ).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            reply: dict[str, Any] = json.loads(response.read())
+        if "error" in reply:
+            raise ServiceError(reply["error"]["message"])
+
+        return reply["result"]
+
+    def factories(self) -> list[str]:
+        return self.call("factories")
+
+    def create_star(self, name: str, central_pressure: float) -> dict[str, Any]:
+        return self.call("create_star", name=name, central_pressure=central_pressure)
+
+    def create_stellar_family(
+        self, name: str, central_pressures: Iterable[float]
+    ) -> pd.DataFrame:
+        stars: list[dict[str, Any]] = self.call(
+            "create_stellar_family",
+            name=name,
+            central_pressures=[float(pc) for pc in central_pressures],
+        )
+        return pd.DataFrame(stars).dropna(axis=1, how="all")
+
+    def star_with_mass(self, name: str, target_mass: float) -> dict[str, Any]:
+        return self.call("star_with_mass", name=name, target_mass=target_mass)
@@ -0,0 +1,197 @@
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator, Optional
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from ..equationsofstate.interpolate import (
+    RIPEOS,
+    TABLE_COLUMNS,
+    TabulatedEOS,
+    read_table,
+)
+from .constellation import Factory
+from .structure import PROFILE_COLUMNS, InternalProfiles
+from .tov_solver import Array
+
+PROFILE_CAPACITY: int = 4096
+
+# shared memory blocks attached by this process, and the EOSs built on them
+_attached: dict[str, SharedMemory] = {}
+_attached_eoss: dict[str, "SharedTabulatedEOS"] = {}
+
+
+def attach(name: str, shape: tuple[int, ...]) -> Array:
+    """Array on the shared memory block 'name', attached once per process."""
+    if name not in _attached:
+        _attached[name] = SharedMemory(name=name)
+    return np.ndarray(shape, dtype=float, buffer=_attached[name].buf)
+
+
+def detach(name: str) -> None:
+    """Forgets the block 'name' and the EOS built on it, and unmaps it."""
+    _attached_eoss.pop(name, None)
+    shm: Optional[SharedMemory] = _attached.pop(name, None)
+    if shm is not None:
+        shm.close()
+
+
+def allocate(shape: tuple[int, ...]) -> tuple[SharedMemory, Array]:
+    shm = SharedMemory(create=True, size=max(int(np.prod(shape)) * 8, 1))
+    return (shm, np.ndarray(shape, dtype=float, buffer=shm.buf))
+
+
+@dataclass
+class SharedTabulatedEOS(TabulatedEOS):
+    """TabulatedEOS whose table lives in a shared memory block. It is pickled
+    as the block's name, so submitting stars does not copy the table (nor its
+    splines) to the workers: each worker attaches the block and builds the
+    splines once, on the first star. Created with 'published_eos'."""
+
+    # not an init field, so that journal fingerprints do not depend on it
+    name: str = field(default="", init=False)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (attached_tabulated_eos, (self.name, len(self.pressures)))
+
+
+def shared_tabulated_eos(data: Array, name: str) -> SharedTabulatedEOS:
+    eos = SharedTabulatedEOS(data[0], data[1:])
+    eos.name = name
+    return eos
+
+
+def attached_tabulated_eos(name: str, n_pressures: int) -> SharedTabulatedEOS:
+    if name not in _attached_eoss:
+        data: Array = attach(name, (1 + len(TABLE_COLUMNS), n_pressures))
+        _attached_eoss[name] = shared_tabulated_eos(data, name)
+    return _attached_eoss[name]
+
+
+@contextmanager
+def published_eos(eos: Any) -> Iterator[SharedTabulatedEOS]:
+    """Publishes the table of a TabulatedEOS (or of a RIPEOS, read again from
+    its file) in shared memory, for the duration of the context.
+    The shared EOS can be used as any other EOS, e.g. inside a HybridEOS."""
+    if isinstance(eos, RIPEOS):
+        df = read_table(eos.file_path)
+        eos = TabulatedEOS(df["p"].to_numpy(), df[list(TABLE_COLUMNS)].to_numpy().T)
+    if not isinstance(eos, TabulatedEOS):
+        raise ValueError("Only tabulated EOSs (TabulatedEOS, RIPEOS) can be published.")
+
+    shm, data = allocate((1 + len(TABLE_COLUMNS), len(eos.pressures)))
+    data[0], data[1:] = (eos.pressures, eos.table)
+    try:
+        yield shared_tabulated_eos(data, shm.name)
+    finally:
+        del data
+        detach(shm.name)
+        shm.close()
+        shm.unlink()
+
+
+@dataclass
+class SharedProfiles:
+    """Preallocated shared memory buffer for the internal profiles of
+    'n_stars' stars, up to 'max_points' radial points each, with columns
+    ordered as in PROFILE_COLUMNS. Workers write into their slot instead of returning the
+    profiles, and 'profile' copies them out of the buffer, so they outlive it.
+    It is pickled as the block's name; only its creator unlinks the block
+    (on close, or at the end of a with statement)."""
+
+    n_stars: int
+    max_points: int = PROFILE_CAPACITY
+    name: str = ""
+    _shm: Optional[SharedMemory] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.max_points < len(PROFILE_COLUMNS):
+            raise ValueError(f"max_points must be at least {len(PROFILE_COLUMNS)}.")
+        shape: tuple[int, int, int] = (
+            self.n_stars,
+            len(PROFILE_COLUMNS) + 1,
+            self.max_points,
+        )
+        if self.name:
+            self.buffer: Array = attach(self.name, shape)
+        else:
+            self._shm, self.buffer = allocate(shape)
+            self.name = self._shm.name
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (SharedProfiles, (self.n_stars, self.max_points, self.name))
+
+    def __enter__(self) -> "SharedProfiles":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._shm is not None:
+            del self.buffer
+            detach(self.name)
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def write(self, slot: int, profile: InternalProfiles) -> bool:
+        """Writes the profile in its slot, False if it does not fit."""
+        columns: list[Optional[Array]] = [getattr(profile, col) for col in PROFILE_COLUMNS]
+        if max(len(values) for values in columns if values is not None) > self.max_points:
+            return False
+        for row, values in enumerate(columns):
+            # the last row holds the length of each column, -1 if it is None
+            self.buffer[slot, -1, row] = -1 if values is None else len(values)
+            if values is not None:
+                self.buffer[slot, row, : len(values)] = values
+        return True
+
+    def profile(self, slot: int) -> InternalProfiles:
+        profile: InternalProfiles = object.__new__(InternalProfiles)
+        # time_metric_fn is already corrected, so __post_init__ is skipped
+        for row, col in enumerate(PROFILE_COLUMNS):
+            n_points = int(self.buffer[slot, -1, row])
+            values: Optional[Array] = (
+                None if n_points < 0 else self.buffer[slot, row, :n_points].copy()
+            )
+            setattr(profile, col, values)
+        return profile
+
+
+def create_star_into(
+    fac: Factory, central_pressure: float, profiles: SharedProfiles, slot: int
+) -> tuple[Any, Optional[InternalProfiles]]:
+    """Creates a star and writes its internal profiles into 'profiles'.
+    The profiles are only returned (pickled) if they do not fit the buffer."""
+    star: Any = fac.create_star(central_pressure)
+    profile: InternalProfiles = fac.set_internal_profiles()  # type: ignore
+    return (star, None if profiles.write(slot, profile) else profile)
+
+
+def create_stars_with_profiles(
+    fac: Factory, central_pressures: Iterable[float], profiles: SharedProfiles
+) -> tuple[list[Any], list[InternalProfiles]]:
+    """Creates the stars in parallel, as create_stars, together with their
+    internal profiles, returned through the shared buffer 'profiles'
+    (one slot per star, in order) instead of being pickled."""
+    central_pressures = list(central_pressures)
+    if len(central_pressures) > profiles.n_stars:
+        raise ValueError("There must be a profile slot for each star.")
+
+    with ProcessPoolExecutor() as executor:
+        futures = [
+            executor.submit(create_star_into, fac, cp, profiles, slot)
+            for slot, cp in enumerate(central_pressures)
+        ]
+    results = [f.result() for f in futures]
+
+    return (
+        [star for star, _ in results],
+        [
+            profiles.profile(slot) if profile is None else profile
+            for slot, (_, profile) in enumerate(results)
+        ],
+    )
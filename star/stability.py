@@ -1,17 +1,30 @@
 import numpy as np
-from typing import Any, Callable
-from dataclasses import dataclass
+from typing import Any, Callable, Optional
+from dataclasses import dataclass, field
 from scipy.integrate import solve_ivp
 from scipy.optimize import root_scalar, RootResults
 
 from . import conversionfactors as cf
-from .tov_solver import radial_metric_fn, time_metric_fn_derivative, TOVInput, Array
+from .tov_solver import (
+    INTEGRATION_METHODS,
+    IntegrationBudget,
+    check_budget,
+    radial_metric_fn,
+    time_metric_fn_derivative,
+    ivp_method,
+    TOVInput,
+    Array,
+)
 
 
 class RadialOscillationsIntegrationError(Exception):
     pass
 
 
+class EigenfrequencyNotConvergedError(ValueError):
+    pass
+
+
 @dataclass(slots=True)
 class RadOscInput:
     """Necessary inputs to solve the TOV eqs. and
@@ -27,16 +40,28 @@ class RadOscInput:
     INT_REL_TOL: float
     ROOT_ABS_TOL: float
     ROOT_REL_TOL: float
+    method: str = "DOP853"
+    budget: IntegrationBudget = field(default_factory=IntegrationBudget)
+    # floor of the pressure near the surface, where Dp / (gamma * p) is singular
+    surface_pressure: float = 0.0
 
 
-def solve_rad_osc(w2: float, rad_osc_input: RadOscInput) -> Any:
+def solve_rad_osc(w2: float, rad_osc_input: RadOscInput, lean: bool = False) -> Any:
     """Solves the radial oscillation eqs. in the
-    Gondek, Haensel and Zdunik (1997) formalism."""
+    Gondek, Haensel and Zdunik (1997) formalism.
+    Every RHS evaluation is charged to rad_osc_input.budget.
+    In lean mode, used while searching for the eigenfrequency, the solution
+    is kept only at the integration steps (the last one being the end of the
+    radial interval): there is no evaluation on the TOV grid,
+    no dense output and no node counting."""
     tov_input: TOVInput = rad_osc_input.tov_input
+    # the pressure spline may reach zero before the surface: it is floored
+    # at rad_osc_input.surface_pressure, also when shooting from the surface
+    surface_level: float = rad_osc_input.surface_pressure
 
-    def rad_osc_eqs(r: float, y: Array, w2: float) -> tuple[float, float]:
-        """Radial oscillation eqs. System of differential equations for the
-        Lagragian variables \\xi and \\Delta p.
+    def rad_osc_matrix(r: float, y: Array, w2: float) -> Array:
+        """Radial oscillation eqs. are linear, d(xi, Dp)/dr = A(r) (xi, Dp),
+        so the coefficient matrix A is also their Jacobian.
         ------------------------------
         Units:
         -------
@@ -44,9 +69,8 @@ def solve_rad_osc(w2: float, rad_osc_input: RadOscInput) -> Any:
         Dp: Delta p in MeV/fm³.
         w2: omega_squared in km⁻².
         """
-        xi, Dp = y  # floats
-
         v, m, p = rad_osc_input.tov_spline(r)  # floats
+        p = max(p, surface_level)
 
         e: float = tov_input.eos.energy_density_from(pressure=p)
         gamma: float = tov_input.eos.adiabatic_index_from(pressure=p)
@@ -54,8 +78,9 @@ def solve_rad_osc(w2: float, rad_osc_input: RadOscInput) -> Any:
         lamb: float = radial_metric_fn(radius=r, mass=m)
         dvdr: float = time_metric_fn_derivative(r, p, m)
 
-        dxidr: float = -(3 * xi + Dp / (p * gamma)) / r + dvdr * xi
-        dDpdr: float = (
+        dxidr_dxi: float = -3 / r + dvdr
+        dxidr_dDp: float = -1 / (r * p * gamma)
+        dDpdr_dxi: float = (
             r
             * (e + p)
             * (
@@ -63,24 +88,39 @@ def solve_rad_osc(w2: float, rad_osc_input: RadOscInput) -> Any:
                 * (w2 * np.exp(-2 * v) - 8 * np.pi * p * cf.MEV_FM3_TO_KM_2)
                 + dvdr * (dvdr + 4 / r)
             )
-            * xi
         )
-        dDpdr -= (
+        dDpdr_dDp: float = -(
             dvdr + 4 * np.pi * r * (e + p) * cf.MEV_FM3_TO_KM_2 * np.exp(2 * lamb)
-        ) * Dp
+        )
 
-        return (dxidr, dDpdr)
+        return np.array([[dxidr_dxi, dxidr_dDp], [dDpdr_dxi, dDpdr_dDp]])
+
+    def rad_osc_eqs(r: float, y: Array, w2: float) -> Array:
+        """Radial oscillation eqs. System of differential equations for the
+        Lagragian variables \\xi and \\Delta p."""
+        return rad_osc_matrix(r, y, w2) @ y
 
     def nodes(r: float, y: Array, w2: float) -> float:
         """Computes how many times xi(r) is zero."""
         return y[0]
 
+    if lean:
+        return solve_ivp(
+            rad_osc_input.budget.budgeted(rad_osc_eqs),
+            y0=rad_osc_input.initial_integration_vector,
+            t_span=rad_osc_input.radial_interval,
+            **ivp_method(rad_osc_input.method, rad_osc_matrix),
+            args=(w2,),
+            atol=rad_osc_input.INT_ABS_TOL,
+            rtol=rad_osc_input.INT_REL_TOL,
+        )
+
     return solve_ivp(
-        rad_osc_eqs,
+        rad_osc_input.budget.budgeted(rad_osc_eqs),
         y0=rad_osc_input.initial_integration_vector,
         t_span=rad_osc_input.radial_interval,
         t_eval=rad_osc_input.eval_radius,
-        method="DOP853",
+        **ivp_method(rad_osc_input.method, rad_osc_matrix),
         args=(w2,),
         dense_output=True,
         atol=rad_osc_input.INT_ABS_TOL,
@@ -99,7 +139,7 @@ class Stability:
         """Finds the frequency that satisfies \\Delta p (r=R) ~ 0."""
         w2: float = omega_squared_guess
         self._find_eigenfrequency = root_scalar(
-            self.delta_p_at_surface,
+            self.shooting_residual,
             method="secant",
             x0=w2,
             x1=w2 + np.abs(w2) * 1e-3,
@@ -109,13 +149,23 @@ class Stability:
         )
 
         if not self._find_eigenfrequency.converged:
-            raise ValueError("Delta p did not converge at the surface.")
+            raise EigenfrequencyNotConvergedError("Delta p did not converge at the surface.")
+
+        self.set_eigenfunctions(self._find_eigenfrequency.root, rad_osc_input)
 
         return self._find_eigenfrequency
 
+    def shooting_residual(self, w2: float, rad_osc_input: RadOscInput) -> float:
+        """Function of omega_squared whose root is the eigenfrequency."""
+        return self.delta_p_at_surface(w2, rad_osc_input)
+
     def delta_p_at_surface(self, w2: float, rad_osc_input: RadOscInput) -> float:
+        return float(solve_rad_osc(w2, rad_osc_input, lean=True).y[1][-1])
+
+    def set_eigenfunctions(self, w2: float, rad_osc_input: RadOscInput) -> None:
+        """Solves the eigenfunctions on the TOV grid, counting their nodes,
+        once the eigenfrequency is found."""
         self.rad_osc_sol: Any = solve_rad_osc(w2, rad_osc_input)
-        return float(self.rad_osc_sol.y[1][-1])
 
     @property
     def omega_squared(self) -> float:
@@ -136,6 +186,23 @@ class CentralRadOscInput:
     INT_REL_TOL: float = 1e-3
     ROOT_ABS_TOL: float = 1e-15
     ROOT_REL_TOL: float = 2e-6
+    method: str = "DOP853"
+    MAX_WALL_TIME: Optional[float] = None
+    MAX_RHS_EVALUATIONS: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.method not in INTEGRATION_METHODS:
+            raise ValueError(f"Integration method must be one of {INTEGRATION_METHODS}.")
+        check_budget(self.MAX_WALL_TIME, self.MAX_RHS_EVALUATIONS)
+        if self.tov_input.envelope is not None:
+            # the profiles would end at the crust base, where Delta p = 0
+            # would be imposed instead of at the surface
+            raise ValueError("Radial oscillations need the crust: remove the envelope.")
+
+    def budget(self) -> IntegrationBudget:
+        """New budget for the eigenfrequency search of a star, shared by all
+        its radial oscillation integrations."""
+        return IntegrationBudget(self.MAX_WALL_TIME, self.MAX_RHS_EVALUATIONS)
 
     def central_delta_p(self, central_pressure: float) -> float:
         central_gamma = self.tov_input.eos.adiabatic_index_from(central_pressure)
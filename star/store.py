@@ -0,0 +1,191 @@
+import os
+import json
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Any, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .conversionfactors import M_SUN_IN_KM
+from .family import StellarFamily
+from .structure import PROFILE_COLUMNS, InternalProfiles
+from .tov_solver import Array
+
+INDEX_FILE: str = "index.jsonl"
+STARS_FILE: str = "stars.npz"
+PROFILES_FILE: str = "profiles.npz"
+CANONICAL_MASS: float = 1.4  # [M_sun]
+
+Parameter = Union[float, int, str]
+
+
+def partition_of(parameters: dict[str, Parameter]) -> str:
+    """Directory of a family, e.g. "eos='SLY4'/transitional_pressure=100.0"."""
+    parts: list[str] = [f"{key}={value!r}" for key, value in sorted(parameters.items())]
+    if any(os.sep in part for part in parts):
+        raise ValueError("EOS parameters cannot contain path separators.")
+    return os.path.join(*parts)
+
+
+def summarize(family: StellarFamily) -> dict[str, float]:
+    """Family-level observables and the range of every column, used to
+    select partitions without loading them: M_max [M_sun], R_1_4 [km]
+    (radius of the 1.4 M_sun star on the stable branch, NaN if there is
+    none) and '<column>_min', '<column>_max' in the units of the column."""
+    summary: dict[str, float] = {
+        "n_stars": len(family),
+        "M_max": family.maximum_mass[0] / M_SUN_IN_KM,
+    }
+    try:
+        summary["R_1_4"] = float(family.radius_at([CANONICAL_MASS * M_SUN_IN_KM])[0])
+    except ValueError:
+        summary["R_1_4"] = np.nan
+    for key, col in family.columns.items():
+        finite: Array = col[np.isfinite(col)]
+        summary[f"{key}_min"] = float(finite.min()) if len(finite) else np.nan
+        summary[f"{key}_max"] = float(finite.max()) if len(finite) else np.nan
+
+    return summary
+
+
+@dataclass
+class ResultStore:
+    """Directory of families (and ensembles of families) partitioned by EOS
+    parameters. Each partition holds its stars as compressed columns
+    (stars.npz) and, optionally, the internal profiles of its stars
+    concatenated per column (profiles.npz, with the offset of each star).
+    An append-only index (index.jsonl) holds, for every partition, its EOS
+    parameters and summary (see summarize): queries are evaluated on the
+    index first, and only the selected partitions (and columns) are read.
+    Writing a partition again replaces it."""
+
+    path: str
+
+    def __post_init__(self) -> None:
+        Path(self.path).mkdir(parents=True, exist_ok=True)
+
+    def write_family(
+        self,
+        parameters: dict[str, Parameter],
+        family: StellarFamily,
+        profiles: Optional[list[InternalProfiles]] = None,
+    ) -> str:
+        """Writes a family (and the profiles of its stars, by increasing
+        central pressure, as the family) under the partition of 'parameters', and returns the partition."""
+        partition: str = partition_of(parameters)
+        directory = Path(self.path) / partition
+        directory.mkdir(parents=True, exist_ok=True)
+
+        np.savez_compressed(directory / STARS_FILE, **family.columns)
+        if profiles is not None:
+            if len(profiles) != len(family):
+                raise ValueError("There must be one profile per star.")
+            np.savez_compressed(directory / PROFILES_FILE, **chunked_profiles(profiles))
+
+        record: dict[str, Any] = {
+            "partition": partition,
+            **parameters,
+            **summarize(family),
+        }
+        with open(Path(self.path) / INDEX_FILE, "a") as index:
+            index.write(json.dumps(record) + "\n")
+
+        return partition
+
+    def index(self) -> pd.DataFrame:
+        """One row per partition (the last written one)."""
+        path = Path(self.path) / INDEX_FILE
+        if not path.exists():
+            return pd.DataFrame(columns=["partition"])
+        with open(path) as index:
+            records: list[dict[str, Any]] = [json.loads(line) for line in index]
+
+        df = pd.DataFrame(records)
+        return df.drop_duplicates("partition", keep="last").reset_index(drop=True)
+
+    def partitions(self, where: Optional[str] = None) -> pd.DataFrame:
+        """Rows of the index satisfying 'where' (a DataFrame.query expression
+        on EOS parameters and summaries), e.g. "M_max > 2.0 and R_1_4 < 13"."""
+        index: pd.DataFrame = self.index()
+        return index if where is None else index.query(where)
+
+    def family(
+        self, partition: str, columns: Optional[list[str]] = None
+    ) -> StellarFamily:
+        """Family of a partition; only 'columns' are decompressed, if given."""
+        with np.load(Path(self.path) / partition / STARS_FILE) as stars:
+            keys: list[str] = list(stars.keys()) if columns is None else columns
+            return StellarFamily({key: stars[key] for key in keys})
+
+    def profiles(self, partition: str) -> list[InternalProfiles]:
+        with np.load(Path(self.path) / partition / PROFILES_FILE) as chunks:
+            return unchunked_profiles({key: chunks[key] for key in chunks.keys()})
+
+    def select(
+        self,
+        where: Optional[str] = None,
+        stars_where: Optional[str] = None,
+        columns: Optional[list[str]] = None,
+    ) -> pd.DataFrame:
+        """Stars of the partitions satisfying 'where', with their EOS
+        parameters as columns, filtered by 'stars_where' (a DataFrame.query
+        expression on star columns, e.g. "mass > 2.5 and radius < 12").
+        'columns' restricts the star columns read (central_pressure is
+        always read), which must include those used in 'stars_where'."""
+        if columns is not None and "central_pressure" not in columns:
+            columns = ["central_pressure", *columns]
+        selected: pd.DataFrame = self.partitions(where)
+        parameters: list[str] = [
+            key
+            for key in selected.columns
+            if key == "partition" or key in self.parameter_names(selected)
+        ]
+
+        frames: list[pd.DataFrame] = []
+        for row in selected[parameters].to_dict(orient="records"):
+            stars: pd.DataFrame = self.family(row["partition"], columns).to_dataframe()
+            if stars_where is not None:
+                stars = stars.query(stars_where)
+            frames.append(stars.assign(**row))
+
+        if not frames:
+            return pd.DataFrame(columns=parameters)
+        return pd.concat(frames, ignore_index=True)
+
+    @staticmethod
+    def parameter_names(index: pd.DataFrame) -> set[str]:
+        return {
+            part.split("=")[0]
+            for partition in index["partition"]
+            for part in partition.split(os.sep)
+        }
+
+
+def chunked_profiles(profiles: list[InternalProfiles]) -> dict[str, Array]:
+    """Columns of the profiles concatenated over stars, with the offsets
+    of each star ('<column>_offsets'); missing columns have no points."""
+    chunks: dict[str, Array] = {}
+    for col in PROFILE_COLUMNS:
+        values: list[Array] = [
+            np.empty(0) if getattr(ip, col) is None else np.asarray(getattr(ip, col))
+            for ip in profiles
+        ]
+        chunks[col] = np.concatenate(values)
+        chunks[f"{col}_offsets"] = np.cumsum([0, *[len(v) for v in values]])
+
+    return chunks
+
+
+def unchunked_profiles(chunks: dict[str, Array]) -> list[InternalProfiles]:
+    n_stars: int = len(chunks["radial_coord_offsets"]) - 1
+    profiles: list[InternalProfiles] = []
+    for i in range(n_stars):
+        profile: InternalProfiles = object.__new__(InternalProfiles)
+        # time_metric_fn was stored corrected, so __post_init__ is skipped
+        for col in PROFILE_COLUMNS:
+            start, end = chunks[f"{col}_offsets"][i : i + 2]
+            setattr(profile, col, chunks[col][start:end] if end > start else None)
+        profiles.append(profile)
+
+    return profiles
@@ -5,6 +5,16 @@ from scipy.interpolate import InterpolatedUnivariateSpline as Spline
 
 from .tov_solver import radial_metric_fn, Array
 
+# fields of InternalProfiles, in order
+PROFILE_COLUMNS: tuple[str, ...] = (
+    "radial_coord",
+    "time_metric_fn",
+    "masses",
+    "pressures",
+    "xi",
+    "Delta_p",
+)
+
 
 @dataclass(slots=True)
 class InternalProfiles:
@@ -0,0 +1,175 @@
+from dataclasses import replace
+from typing import Any, Iterable, Optional
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from scipy.optimize import brentq, minimize_scalar
+
+from .constellation import Factory, stars_to_dataframe
+from .tov_solver import (
+    BoundaryNotFoundError,
+    TOVInput,
+    TOVIntegrationError,
+    solve_tov,
+)
+
+DEFAULT_CENTRAL_PRESSURE_GUESS: float = 100.0
+CENTRAL_PRESSURE_BOUNDS: tuple[float, float] = (1.0, 1e4)
+LOG_CENTRAL_PRESSURE_TOLERANCE: float = 1e-10
+INITIAL_SECANT_STEP: float = 0.1
+MAX_LOG_STEP: float = 0.5
+MAX_ITERATIONS: int = 30
+
+
+class MaximumMassExceededError(ValueError):
+    pass
+
+
+def solve_for_mass(
+    fac: Factory,
+    target_masses: Iterable[float],
+    central_pressure_guesses: Optional[Iterable[float]] = None,
+    central_pressure_bounds: tuple[float, float] = CENTRAL_PRESSURE_BOUNDS,
+) -> pd.DataFrame:
+    """Creates the stars/hybrid stars with the given masses [km], one row per
+    target mass, solving for the central pressure instead of building a family.
+    'central_pressure_guesses' [MeV/fm³] warm-start the search, e.g. with the
+    central pressures found for a nearby EOS. Targets above the maximum mass
+    raise a MaximumMassExceededError."""
+    target_masses = list(target_masses)
+    guesses: list[float] = (
+        [DEFAULT_CENTRAL_PRESSURE_GUESS] * len(target_masses)
+        if central_pressure_guesses is None
+        else list(central_pressure_guesses)
+    )
+    if len(guesses) != len(target_masses):
+        raise ValueError("There must be one central pressure guess per target mass.")
+
+    with ProcessPoolExecutor() as executor:
+        futures = [
+            executor.submit(star_with_mass, fac, m, guess, central_pressure_bounds)
+            for m, guess in zip(target_masses, guesses)
+        ]
+
+    return stars_to_dataframe(f.result() for f in futures)
+
+
+def star_with_mass(
+    fac: Factory,
+    target_mass: float,
+    central_pressure_guess: float = DEFAULT_CENTRAL_PRESSURE_GUESS,
+    central_pressure_bounds: tuple[float, float] = CENTRAL_PRESSURE_BOUNDS,
+) -> Any:
+    """Creates the star/hybrid star of mass 'target_mass' [km]. The central
+    pressure is found from the TOV solutions alone, so that radial
+    oscillations (if any) are solved only once, for the final star."""
+    central_pressure: float = central_pressure_for_mass(
+        structure_tov_input(fac),
+        target_mass,
+        central_pressure_guess,
+        central_pressure_bounds,
+    )
+    return fac.create_star(central_pressure)
+
+
+def structure_tov_input(fac: Any) -> TOVInput:
+    """TOVInput of a StarFactory, HybridStarFactory or of their stability
+    counterparts (whose structure is created by 'star_fac')."""
+    return getattr(fac, "star_fac", fac).tov_input
+
+
+def central_pressure_for_mass(
+    tov_input: TOVInput,
+    target_mass: float,
+    central_pressure_guess: float = DEFAULT_CENTRAL_PRESSURE_GUESS,
+    central_pressure_bounds: tuple[float, float] = CENTRAL_PRESSURE_BOUNDS,
+) -> float:
+    """Central pressure [MeV/fm³] of the stable star of mass 'target_mass' [km].
+    Iterates in log(central pressure), within the bounds and with steps of at
+    most MAX_LOG_STEP, with Newton's method
+    if the TOVInput computes sensitivities, otherwise with the secant method,
+    up to the relative tolerance of the TOV solutions.
+    If an iterate lands where dM/dp_c <= 0 (beyond the maximum mass), or the
+    iteration fails, the maximum mass is located and the target is either
+    rejected or bracketed on the stable branch."""
+    gradients: dict[float, float] = {}
+    # tighter than the TOV solutions, the iteration would chase their noise
+    mass_tolerance: float = tov_input.RELATIVE_TOLERANCE * target_mass
+
+    def mass_residual(log_pc: float) -> float:
+        tov_solution: Any = solve_tov(tov_input, float(np.exp(log_pc)))
+        if tov_input.sensitivities:
+            gradients[log_pc] = tov_solution.mass_gradient[0] * np.exp(log_pc)
+        return float(tov_solution.y_events[0][0][1]) - target_mass
+
+    lower, upper = np.log(central_pressure_bounds)
+
+    def iterate(x_prev: float) -> Optional[float]:
+        """Safeguarded Newton/secant iteration, None if it fails."""
+        r_prev: float = mass_residual(x_prev)
+        x, r = (x_prev, r_prev)
+        if not tov_input.sensitivities:
+            x = x_prev - INITIAL_SECANT_STEP * np.sign(r_prev)
+            r = mass_residual(x)
+
+        for _ in range(MAX_ITERATIONS):
+            if abs(r) <= mass_tolerance:
+                return x
+            slope: float = (
+                gradients[x] if tov_input.sensitivities else (r - r_prev) / (x - x_prev)
+            )
+            if slope <= 0:
+                return None
+            step: float = float(np.clip(-r / slope, -MAX_LOG_STEP, MAX_LOG_STEP))
+            x_next: float = float(np.clip(x + step, lower, upper))
+            if x_next == x:
+                return None
+            x_prev, r_prev = (x, r)
+            x, r = (x_next, mass_residual(x_next))
+
+        return None
+
+    try:
+        log_pc: Optional[float] = iterate(float(np.log(central_pressure_guess)))
+    except (TOVIntegrationError, BoundaryNotFoundError, ArithmeticError, ValueError):
+        log_pc = None
+    if log_pc is not None:
+        return float(np.exp(log_pc))
+
+    max_mass, log_pc_max = maximum_mass(tov_input, central_pressure_bounds)
+    if target_mass > max_mass:
+        raise MaximumMassExceededError(
+            f"The target mass ({target_mass} km) is above "
+            + f"the maximum mass ({max_mass} km)."
+        )
+    if mass_residual(lower) > 0:
+        raise ValueError(
+            "The target mass is below the mass of the star "
+            + "at the lowest central pressure."
+        )
+
+    return float(
+        np.exp(
+            brentq(mass_residual, lower, log_pc_max, xtol=LOG_CENTRAL_PRESSURE_TOLERANCE)
+        )
+    )
+
+
+def maximum_mass(
+    tov_input: TOVInput,
+    central_pressure_bounds: tuple[float, float] = CENTRAL_PRESSURE_BOUNDS,
+) -> tuple[float, float]:
+    """Maximum mass [km] and its log(central pressure) within the bounds."""
+    tov_input = replace(tov_input, sensitivities=False)
+
+    def minus_mass(log_pc: float) -> float:
+        return -float(solve_tov(tov_input, float(np.exp(log_pc))).y_events[0][0][1])
+
+    sol: Any = minimize_scalar(
+        minus_mass,
+        bounds=tuple(np.log(central_pressure_bounds)),
+        method="bounded",
+        options={"xatol": 1e-5},
+    )
+    return (-float(sol.fun), float(sol.x))
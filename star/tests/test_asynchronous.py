@@ -0,0 +1,95 @@
+import time
+import asyncio
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+import pytest
+from ...equationsofstate.massless_mit_bm import MasslessMITBM
+from ..asynchronous import create_stellar_family, iterate_stars
+from ..constellation import create_stellar_family as create_stellar_family_sync
+from ..factory import StarFactory
+from ..tov_solver import TOVInput
+
+
+@dataclass
+class SlowFactory:
+    fac: StarFactory
+    delay: float = 0.2
+
+    def create_star(self, central_pressure: float) -> Any:
+        time.sleep(self.delay)
+        return self.fac.create_star(central_pressure)
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    """One thread executor keeping the futures of its submissions."""
+
+    def __init__(self) -> None:
+        super().__init__(max_workers=1)
+        self.submitted: list[Future] = []
+
+    def submit(self, fn: Any, /, *args: Any, **kwargs: Any) -> Future:
+        future: Future = super().submit(fn, *args, **kwargs)
+        self.submitted.append(future)
+        return future
+
+
+@pytest.fixture()
+def facs() -> list[StarFactory]:
+    return [StarFactory(TOVInput(MasslessMITBM(b))) for b in (57, 60)]
+
+
+def test_concurrent_families(facs: list[StarFactory]) -> None:
+    central_pressures = [100.0, 300.0, 500.0]
+
+    async def families() -> list:
+        with ProcessPoolExecutor() as executor:
+            return await asyncio.gather(
+                *[create_stellar_family(fac, central_pressures, executor) for fac in facs]
+            )
+
+    for fac, family in zip(facs, asyncio.run(families())):
+        assert family.equals(create_stellar_family_sync(fac, central_pressures))
+
+
+def test_iterate_stars_with_backpressure(facs: list[StarFactory]) -> None:
+    central_pressures = [100.0, 200.0, 300.0, 400.0]
+
+    async def stars() -> list:
+        return [
+            star async for star in iterate_stars(facs[0], central_pressures, max_pending=2)
+        ]
+
+    assert sorted(star.central_pressure for star in asyncio.run(stars())) == (
+        central_pressures
+    )
+
+
+def test_closing_the_iterator_cancels_pending_stars(facs: list[StarFactory]) -> None:
+    async def first_star(executor: RecordingExecutor) -> float:
+        stars = iterate_stars(SlowFactory(facs[0]), [100.0] * 50, executor, max_pending=4)
+        star = await stars.__anext__()
+        await stars.aclose()
+        return star.central_pressure
+
+    with RecordingExecutor() as executor:
+        assert asyncio.run(first_star(executor)) == 100.0
+
+    # one star done, at most one running
+    assert len(executor.submitted) == 4
+    assert sum(future.cancelled() for future in executor.submitted) >= 2
+
+
+def test_failed_star_cancels_the_family(facs: list[StarFactory]) -> None:
+    central_pressures = [-1.0] + [100.0] * 20
+
+    with RecordingExecutor() as executor:
+        with pytest.raises(ValueError):
+            asyncio.run(
+                create_stellar_family(
+                    SlowFactory(facs[0]), central_pressures, executor, max_pending=4
+                )
+            )
+
+    assert len(executor.submitted) == 4
+    assert sum(future.cancelled() for future in executor.submitted) >= 2
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from ...equationsofstate.massless_mit_bm import MasslessMITBM
+from ..batched_stability import (
+    OscillationBackground,
+    batch_stability,
+    common_grid,
+    create_stellar_family_batched,
+    structure_and_profiles,
+)
+from ..factory import StarStabilityFactory
+from ..stability import CentralRadOscInput
+from ..tov_solver import TOVInput
+
+CENTRAL_PRESSURES = (50.0, 100.0, 300.0, 800.0)
+
+
+@pytest.fixture()
+def fac() -> StarStabilityFactory:
+    return StarStabilityFactory(CentralRadOscInput(TOVInput(MasslessMITBM(57))), -1e-3)
+
+
+def test_batch_matches_star_by_star(fac: StarStabilityFactory) -> None:
+    stars = [fac.create_star(pc) for pc in CENTRAL_PRESSURES]
+    profiles = [structure_and_profiles(fac, pc)[1] for pc in CENTRAL_PRESSURES]
+    omega_squared, modes = batch_stability(profiles, fac.central_ro_in, -1e-3)
+
+    expected = np.array([star.omega_squared for star in stars])
+    assert np.allclose(omega_squared, expected, rtol=1e-3)
+    assert np.array_equal(modes, [star.mode for star in stars])
+
+
+def test_stars_leave_the_batch_as_they_converge(fac: StarStabilityFactory) -> None:
+    profiles = [structure_and_profiles(fac, pc)[1] for pc in CENTRAL_PRESSURES]
+    background = OscillationBackground(profiles, fac.central_ro_in, common_grid())
+    omega_squared = background.eigenfrequencies(np.array(-1e-3))
+
+    stars = np.arange(len(profiles))
+    assert np.allclose(
+        background.delta_p_at_surface(stars, omega_squared),
+        0,
+        atol=1e-6 * np.abs(background.initial_integration_vectors[:, 1]).max(),
+    )
+
+
+def test_family_in_batches(fac: StarStabilityFactory) -> None:
+    df = create_stellar_family_batched(fac, CENTRAL_PRESSURES, batch_size=3)
+    assert list(df.columns) == [
+        "central_pressure",
+        "radius",
+        "mass",
+        "mode",
+        "omega_squared",
+    ]
+    assert np.array_equal(df["central_pressure"], CENTRAL_PRESSURES)
+    assert (df["omega_squared"].iloc[:2] > 0).all()
+
+
+def test_star_alone_matches_star_in_batch(fac: StarStabilityFactory) -> None:
+    profiles = [structure_and_profiles(fac, pc)[1] for pc in CENTRAL_PRESSURES]
+    batched, _ = batch_stability(profiles, fac.central_ro_in, -1e-3)
+    alone = [batch_stability([ip], fac.central_ro_in, -1e-3)[0][0] for ip in profiles]
+    # up to the integration tolerances, whichever stars share the batch
+    assert np.allclose(batched, alone, rtol=1e-3, atol=1e-4 * np.abs(alone).max())
@@ -0,0 +1,46 @@
+import time
+import pytest
+from ...equationsofstate.gpp import GPP
+from ...equationsofstate.massless_mit_bm import MasslessMITBM
+from ..factory import StarStabilityFactory
+from ..stability import CentralRadOscInput
+from ..tov_solver import (
+    IntegrationBudget,
+    IntegrationBudgetExceededError,
+    TOVInput,
+    solve_tov,
+)
+
+
+def test_invalid_budgets() -> None:
+    with pytest.raises(ValueError):
+        assert TOVInput(MasslessMITBM(), MAX_WALL_TIME=0.0)
+    with pytest.raises(ValueError):
+        assert CentralRadOscInput(TOVInput(MasslessMITBM()), MAX_RHS_EVALUATIONS=0)
+
+
+def test_wall_time_budget() -> None:
+    budget = IntegrationBudget(MAX_WALL_TIME=1e-3)
+    budget.charge()
+    time.sleep(2e-3)
+    with pytest.raises(IntegrationBudgetExceededError):
+        budget.charge()
+
+
+def test_unlimited_budget_keeps_the_rhs() -> None:
+    assert IntegrationBudget().budgeted(abs) is abs
+
+
+@pytest.mark.parametrize("formulation", ["radius", "enthalpy"])
+def test_tov_rhs_evaluations_budget(formulation: str) -> None:
+    tov_input = TOVInput(GPP("SLY4"), formulation=formulation, MAX_RHS_EVALUATIONS=100)
+    with pytest.raises(IntegrationBudgetExceededError):
+        solve_tov(tov_input, 100.0)
+
+
+def test_radial_oscillations_budget_is_per_star() -> None:
+    central_ro_in = CentralRadOscInput(TOVInput(MasslessMITBM()), MAX_RHS_EVALUATIONS=200)
+    fac = StarStabilityFactory(central_ro_in, -1e-3)
+    with pytest.raises(IntegrationBudgetExceededError):
+        fac.create_star(100.0)
+    assert fac.budget.rhs_evaluations == 201
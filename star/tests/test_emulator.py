@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from ...equationsofstate.massless_mit_bm import MasslessMITBM
+from ..emulator import Emulator, GaussianProcess
+from ..factory import StarFactory
+from ..tov_solver import Array, TOVInput
+
+
+def bag_model_factory(parameters: Array) -> StarFactory:
+    return StarFactory(TOVInput(MasslessMITBM(BAG_PRESS=parameters[0])))
+
+
+@pytest.fixture(scope="module")
+def emulator() -> Emulator:
+    emulator = Emulator(bag_model_factory, np.array([[50.0, 80.0]]), (50.0, 500.0))
+    emulator.train(40, seed=0)
+    return emulator
+
+
+def test_gaussian_process_interpolates() -> None:
+    x = np.linspace(0, 1, 15)[:, None]
+    gp = GaussianProcess(x, np.sin(3 * x[:, 0]))
+    mean, std = gp.predict(np.array([[0.5]]))
+    assert np.isclose(mean[0], np.sin(1.5), atol=1e-4) & (std[0] < 1e-3)
+
+
+def test_emulator_prediction(emulator: Emulator) -> None:
+    star = bag_model_factory(np.array([60.0])).create_star(200.0)
+    prediction = emulator.predict(np.array([[60.0]]), [200.0])
+    mean, std = prediction["mass"]
+    assert np.isclose(mean[0], star.mass, rtol=1e-3)
+    assert "omega_squared" not in prediction
+
+
+def test_predict_or_solve_falls_back_to_solver(emulator: Emulator) -> None:
+    star = bag_model_factory(np.array([60.0])).create_star(200.0)
+    results = emulator.predict_or_solve(np.array([[60.0]]), [200.0], 0.0)
+    assert results["radius"][0] == star.radius
+
+
+def test_refine_adds_samples(emulator: Emulator) -> None:
+    n_inputs = len(emulator.inputs)
+    emulator.refine(4, n_candidates=200, seed=1)
+    assert len(emulator.inputs) == n_inputs + 4
+
+
+def test_save_and_load(emulator: Emulator, tmp_path) -> None:
+    emulator.save(str(tmp_path / "emulator.npz"))
+    loaded = Emulator.load(str(tmp_path / "emulator.npz"), bag_model_factory)
+    x = (np.array([[65.0]]), [300.0])
+    assert np.allclose(loaded.predict(*x)["mass"], emulator.predict(*x)["mass"])
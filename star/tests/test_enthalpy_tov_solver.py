@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+from typing import Any
+from scipy.optimize import brentq
+from ...equationsofstate.gpp import GPP
+from ...equationsofstate.interpolate import TabulatedEOS, tabulate_eos
+from ...equationsofstate.massless_mit_bm import MasslessMITBM
+from ...equationsofstate.eos import EquationOfState
+from ..tov_solver import TOVInput, pseudo_enthalpies, solve_tov
+
+
+@pytest.fixture()
+def eos() -> EquationOfState:
+    return MasslessMITBM()
+
+
+@pytest.fixture()
+def central_pressure() -> float:
+    return 300.
+
+
+def test_invalid_formulation_tov_input(eos: EquationOfState) -> None:
+    with pytest.raises(ValueError):
+        assert TOVInput(eos, formulation="density")
+
+
+def test_pseudo_enthalpies_massless_mit_bm(eos: MasslessMITBM) -> None:
+    # h(p) = ln[(4p + 4B)/(4B)]/4 for e = 3p + 4B
+    h = pseudo_enthalpies(eos, [57., 300.])
+    assert np.allclose(h, np.log(1 + np.array([57., 300.]) / 57.) / 4)
+
+
+@pytest.fixture()
+def tov_solution(eos: EquationOfState, central_pressure: float) -> Any:
+    return solve_tov(TOVInput(eos, formulation="enthalpy"), central_pressure)
+
+
+def test_solve_tov_enthalpy_surface_pressure(tov_solution: Any) -> None:
+    pressure = tov_solution.y[2]
+    assert np.isclose(pressure[-1], 0, atol=1e-5)
+
+
+def test_solve_tov_enthalpy_matches_radius_formulation(
+    eos: EquationOfState, tov_solution: Any, central_pressure: float
+) -> None:
+    radius_solution = solve_tov(TOVInput(eos), central_pressure)
+    assert np.isclose(
+        tov_solution.t_events[0][0], radius_solution.t_events[0][0], rtol=1e-5
+    ) & np.isclose(
+        tov_solution.y_events[0][0][1], radius_solution.y_events[0][0][1], rtol=1e-5
+    )
+
+
+def test_enthalpy_solution_has_no_dense_output(tov_solution: Any) -> None:
+    assert tov_solution.sol is None
+
+
+@pytest.fixture(scope="module")
+def sly4_table() -> TabulatedEOS:
+    pressures = np.geomspace(1e-10, 2000, 400)
+    return TabulatedEOS(pressures, tabulate_eos(GPP("SLY4"), pressures))
+
+
+def test_pseudo_enthalpies_start_at_lowest_tabulated_pressure(
+    sly4_table: TabulatedEOS,
+) -> None:
+    lowest: float = sly4_table.pressures[0]
+    assert np.isclose(pseudo_enthalpies(sly4_table, [lowest])[0], 0.0)
+
+
+@pytest.mark.parametrize("central_pressure", [50.0, 500.0])
+def test_sly4_enthalpy_matches_radius_formulation(central_pressure: float) -> None:
+    eos = GPP("SLY4")
+    enthalpy_solution = solve_tov(TOVInput(eos, formulation="enthalpy"), central_pressure)
+    radius_solution = solve_tov(TOVInput(eos), central_pressure)
+    assert np.isclose(
+        enthalpy_solution.t_events[0][0], radius_solution.t_events[0][0], rtol=1e-4
+    ) & np.isclose(
+        enthalpy_solution.y_events[0][0][1],
+        radius_solution.y_events[0][0][1],
+        rtol=1e-4,
+    )
+
+
+def test_tabulated_enthalpy_surface_is_lowest_tabulated_pressure(
+    sly4_table: TabulatedEOS,
+) -> None:
+    enthalpy_solution = solve_tov(TOVInput(sly4_table, formulation="enthalpy"), 50.0)
+    radius_solution = solve_tov(TOVInput(sly4_table), 50.0)
+    lowest_pressure_radius: float = brentq(
+        lambda r: radius_solution.sol(r)[2] - sly4_table.pressures[0],
+        10.0,
+        radius_solution.t_events[0][0],
+    )
+    assert np.isclose(enthalpy_solution.t_events[0][0], lowest_pressure_radius, rtol=1e-4)
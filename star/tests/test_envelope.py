@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+from ...equationsofstate.gpp import GPP, crust_transition_pressure
+from ...equationsofstate.massless_mit_bm import MasslessMITBM
+from ..envelope import CrustEnvelope
+from ..stability import CentralRadOscInput
+from ..tov_solver import TOVInput, solve_tov
+
+
+@pytest.fixture(scope="module")
+def envelope() -> CrustEnvelope:
+    return CrustEnvelope(
+        MasslessMITBM(),
+        transition_pressure=10.0,
+        base_radii=np.linspace(8.0, 12.0, 9),
+        base_compactness=np.linspace(0.1, 0.3, 9),
+    )
+
+
+@pytest.fixture(scope="module")
+def sly4_envelope() -> CrustEnvelope:
+    return CrustEnvelope(
+        GPP("SLY4"),
+        crust_transition_pressure(),
+        base_radii=np.linspace(10.0, 14.0, 5),
+        base_compactness=np.linspace(0.1, 0.3, 5),
+    )
+
+
+def test_invalid_enthalpy_formulation_with_envelope(envelope: CrustEnvelope) -> None:
+    with pytest.raises(ValueError):
+        assert TOVInput(MasslessMITBM(), formulation="enthalpy", envelope=envelope)
+
+
+def test_invalid_crust_eos(sly4_envelope: CrustEnvelope) -> None:
+    with pytest.raises(ValueError):
+        assert TOVInput(MasslessMITBM(), envelope=sly4_envelope)
+
+
+def test_invalid_radial_oscillations_with_envelope(envelope: CrustEnvelope) -> None:
+    with pytest.raises(ValueError):
+        assert CentralRadOscInput(TOVInput(MasslessMITBM(), envelope=envelope))
+
+
+def test_envelope_covers(envelope: CrustEnvelope) -> None:
+    assert envelope.covers(10.0, 2.0) & (not envelope.covers(10.0, 0.5))
+
+
+def test_crust_from_matches_integration(envelope: CrustEnvelope) -> None:
+    assert np.allclose(
+        envelope.crust_from(10.1, 2.1), envelope.integrate_crust(10.1, 2.1), rtol=1e-3
+    )
+
+
+def test_solve_tov_with_envelope(envelope: CrustEnvelope) -> None:
+    eos = MasslessMITBM()
+    sol = solve_tov(TOVInput(eos, envelope=envelope), 300.0)
+    ref = solve_tov(TOVInput(eos), 300.0)
+    assert np.isclose(sol.t_events[0][0], ref.t_events[0][0], rtol=1e-4) & np.isclose(
+        sol.y_events[0][0][1], ref.y_events[0][0][1], rtol=1e-4
+    )
+
+
+@pytest.mark.parametrize("eos", ["SLY4", "H4"])
+def test_solve_tov_with_sly4_crust(sly4_envelope: CrustEnvelope, eos: str) -> None:
+    sol = solve_tov(TOVInput(GPP(eos), envelope=sly4_envelope), 150.0)
+    ref = solve_tov(TOVInput(GPP(eos)), 150.0)
+    assert np.isclose(sol.t_events[0][0], ref.t_events[0][0], rtol=1e-4) & np.isclose(
+        sol.y_events[0][0][1], ref.y_events[0][0][1], rtol=1e-4
+    )
+    # the crust takes about half of the RHS evaluations
+    assert sol.nfev < 0.6 * ref.nfev
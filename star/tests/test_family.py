@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+from ...equationsofstate.gpp import GPP
+from ..constellation import create_stellar_family, preloaded_pool
+from ..factory import StarFactory
+from ..family import StellarFamily
+from ..tov_solver import TOVInput
+
+
+@pytest.fixture(scope="module")
+def family() -> StellarFamily:
+    central_pressures = np.geomspace(10, 2000, 40)
+    df = create_stellar_family(StarFactory(TOVInput(GPP("SLY4"))), central_pressures)
+    return StellarFamily.from_dataframe(df.iloc[::-1])
+
+
+def test_columns_are_sorted_by_central_pressure(family: StellarFamily) -> None:
+    assert np.all(np.diff(family["central_pressure"]) > 0)
+
+
+def test_dataframe_round_trip(family: StellarFamily) -> None:
+    df = family.to_dataframe()
+    assert isinstance(df, pd.DataFrame) & (len(df) == len(family))
+
+
+def test_maximum_mass(family: StellarFamily) -> None:
+    max_mass, central_pressure = family.maximum_mass
+    assert max_mass >= family["mass"].max()
+    assert not family.stable[family["central_pressure"] > central_pressure * 1.1].any()
+
+
+def test_radius_at_mass(family: StellarFamily) -> None:
+    star = StarFactory(TOVInput(GPP("SLY4"))).create_star(100.0)
+    radii = family.radius_at([star.mass, 2 * family.maximum_mass[0]])
+    assert np.isclose(radii[0], star.radius, rtol=1e-3) & np.isnan(radii[1])
+
+
+def test_from_stars_fills_missing_values() -> None:
+    stars = [StarFactory(TOVInput(GPP("SLY4"))).create_star(p) for p in (50, 100)]
+    family = StellarFamily.from_stars(stars)
+    assert np.all(np.isfinite(family["mass"])) & ("omega_squared" not in family.columns)
+
+
+def test_family_on_preloaded_pool() -> None:
+    fac = StarFactory(TOVInput(GPP("SLY4")))
+    central_pressures = [100.0, 500.0]
+
+    assert create_stellar_family(fac, central_pressures, preloaded_pool).equals(
+        create_stellar_family(fac, central_pressures)
+    )
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+from ...equationsofstate.css import CSS
+from ...equationsofstate.massless_mit_bm import MasslessMITBM
+from ..factory import StarFactory
+from ..homology import homologous_family, homology_parameters, rescale
+from ..tov_solver import TOVInput
+
+
+def test_homology_parameters_massless_mit_bm() -> None:
+    assert homology_parameters(MasslessMITBM(BAG_PRESS=57)) == (1 / 3, 228)
+
+
+def test_homology_parameters_css() -> None:
+    eos = CSS(400, 100, 0.5, 20)
+    assert homology_parameters(eos) == (0.5, 460)
+
+
+def test_homology_parameters_invalid_eos() -> None:
+    with pytest.raises(ValueError):
+        assert homology_parameters(CSS(10, 0, 0.5, 20))
+
+
+def test_rescale() -> None:
+    family = pd.DataFrame({"central_pressure": [1.0], "radius": [10.0], "mass": [2.0]})
+    rescaled = rescale(family, 4.0)
+    assert np.allclose(rescaled.iloc[0], [4.0, 5.0, 1.0])
+
+
+def test_homologous_family_matches_tov_solution() -> None:
+    homologous = homologous_family(1 / 3, None, tuple(np.geomspace(0.01, 3.0, 30)))
+    stars = homologous.stars_at(4 * 80, [100.0])
+    star = StarFactory(TOVInput(MasslessMITBM(BAG_PRESS=80))).create_star(100.0)
+    assert np.isclose(stars["radius"].iloc[0], star.radius, rtol=1e-4) & np.isclose(
+        stars["mass"].iloc[0], star.mass, rtol=1e-4
+    )
+
+
+def test_homologous_family_follows_fundamental_mode() -> None:
+    homologous = homologous_family(1 / 3, 1e-3, tuple(np.geomspace(1e-3, 30.0, 20)))
+    assert (homologous.family["mode"] == 0).all() & (
+        np.diff(homologous.family["omega_squared"]) < 0
+    ).all()
@@ -0,0 +1,81 @@
+import functools
+import numpy as np
+import pandas as pd
+import pytest
+from ...equationsofstate.css import CSS
+from ...equationsofstate.gpp import GPP
+from ...equationsofstate.interpolate import RIPEOS
+from ...equationsofstate.massless_mit_bm import MasslessMITBM
+from ..factory import StarFactory
+from ..journal import JournaledFactory, fingerprint, read_journal
+from ..retry import create_stellar_family_with_retries
+from ..tov_solver import BoundaryNotFoundError, TOVInput, interface_event
+
+
+@pytest.fixture()
+def fac() -> StarFactory:
+    # the lightest star does not fit in MAX_RADIUS
+    return StarFactory(TOVInput(GPP("SLY4"), MAX_RADIUS=11.0))
+
+
+def test_fingerprint() -> None:
+    event = functools.partial(interface_event, 10.0)
+    fac = StarFactory(TOVInput(MasslessMITBM(), events=(event,)))
+
+    assert fingerprint(fac) == fingerprint(
+        StarFactory(TOVInput(MasslessMITBM(), events=(event,)))
+    )
+    assert fingerprint(fac) != fingerprint(StarFactory(TOVInput(MasslessMITBM(60))))
+    assert fingerprint(StarFactory(TOVInput(CSS(400, 100, 0.5, 20)))) == fingerprint(
+        StarFactory(TOVInput(CSS(400, 100, 0.5, 20)))
+    )
+    assert fingerprint(fac) != fingerprint(
+        StarFactory(TOVInput(MasslessMITBM(), events=(event,), RELATIVE_TOLERANCE=1e-8))
+    )
+
+
+def test_table_files_are_fingerprinted_by_content(tmp_path) -> None:
+    p = np.geomspace(1.0, 100.0, 5)
+    table = pd.DataFrame({"e": 3 * p + 10, "p": p, "cs2": [1 / 3] * 5, "gamma": p})
+    for name in ("a.csv", "b.csv"):
+        table.to_csv(tmp_path / name, sep=" ", index=False)
+    table.assign(e=4 * p + 10).to_csv(tmp_path / "c.csv", sep=" ", index=False)
+
+    def key(name: str) -> str:
+        return fingerprint(StarFactory(TOVInput(RIPEOS(str(tmp_path / name)))))
+
+    assert key("a.csv") == key("b.csv")
+    assert key("a.csv") != key("c.csv")
+
+
+def test_journaled_stars_are_not_solved_again(fac: StarFactory, tmp_path) -> None:
+    path = str(tmp_path / "journal.jsonl")
+    star = JournaledFactory(fac, path).create_star(800.0)
+    with pytest.raises(BoundaryNotFoundError):
+        JournaledFactory(fac, path).create_star(30.0)
+    with open(path, "a") as journal:
+        journal.write('{"key": "trunc')
+
+    restarted = JournaledFactory(fac, path)
+    assert list(restarted.completed) == [800.0]
+    assert restarted.create_star(800.0) == star
+
+
+def test_family_resumes_from_the_journal(fac: StarFactory, tmp_path) -> None:
+    path = str(tmp_path / "journal.jsonl")
+    first = create_stellar_family_with_retries(fac, (30.0, 800.0), (), journal=path)
+    resumed = create_stellar_family_with_retries(fac, (30.0, 800.0), (), journal=path)
+
+    with open(path) as journal:
+        assert len(journal.readlines()) == 3
+    assert first.equals(resumed)
+    assert list(read_journal(path, fingerprint(fac))) == [800.0]
+
+
+def test_family_resumes_after_a_torn_write(fac: StarFactory, tmp_path) -> None:
+    path = str(tmp_path / "journal.jsonl")
+    with open(path, "w") as journal:
+        journal.write('{"key": "trunc')
+    create_stellar_family_with_retries(fac, (800.0,), (), journal=path)
+
+    assert list(read_journal(path, fingerprint(fac))) == [800.0]
@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+from ...equationsofstate.massless_mit_bm import MasslessMITBM
+from ..factory import StarStabilityFactory
+from ..stability import CentralRadOscInput, solve_rad_osc
+from ..tov_solver import TOVInput
+
+
+@pytest.fixture()
+def fac() -> StarStabilityFactory:
+    fac = StarStabilityFactory(CentralRadOscInput(TOVInput(MasslessMITBM(57))), -1e-3)
+    fac.create_star(central_pressure=100)
+    return fac
+
+
+def test_lean_surface_value_matches_full_solution(fac: StarStabilityFactory) -> None:
+    rad_osc_input = fac.set_rad_osc_input(
+        fac.set_eval_radius(), fac.central_ro_in.initial_integration_vector(100)
+    )
+    lean = solve_rad_osc(1e-3, rad_osc_input, lean=True)
+    full = solve_rad_osc(1e-3, rad_osc_input)
+    assert np.isclose(lean.y[1][-1], full.y[1][-1], rtol=1e-12)
+    assert (lean.sol is None) & (lean.t_events is None)
+
+
+def test_eigenfunctions_on_tov_grid(fac: StarStabilityFactory) -> None:
+    sol = fac.stability.rad_osc_sol
+    assert np.array_equal(sol.t, fac.set_eval_radius())
+    assert fac.stability.mode == 0
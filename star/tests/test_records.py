@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+from ...hybrid_star.structure import HybridStar
+from ..constellation import stars_to_dataframe
+from ..records import STATUSES, StarRecords
+from ..structure import Star
+
+
+@pytest.fixture()
+def records() -> StarRecords:
+    records = StarRecords(capacity=2)
+    records.append(Star(10.0, 12.0, 1.5))
+    records.append(Star(20.0, 11.0, 2.0, mode=0, omega_squared=0.1))
+    records.append(central_pressure=30.0, status="not_converged")
+    return records
+
+
+def test_missing_values_are_masked(records: StarRecords) -> None:
+    assert len(records) == 3
+    assert records.capacity == 4
+    assert list(records.mask("mode")) == [True, False, True]
+    assert np.isnan(records["radius"][2])
+    assert list(records.statuses()) == ["ok", "ok", "not_converged"]
+    assert records.present() == [
+        "central_pressure",
+        "radius",
+        "mass",
+        "mode",
+        "omega_squared",
+    ]
+
+
+def test_nullable_dataframe_shares_memory(records: StarRecords) -> None:
+    df = records.to_dataframe()
+
+    assert df["mode"].isna().tolist() == [True, False, True]
+    assert df["status"].cat.categories.tolist() == list(STATUSES)
+    assert np.shares_memory(df["mass"].array._data, records["mass"])
+
+
+def test_stars_to_dataframe_keeps_partially_missing_columns() -> None:
+    df = stars_to_dataframe(
+        [HybridStar(10.0, 12.0, 1.5), HybridStar(20.0, 11.0, 2.0, 1, -0.1, 3.0, 0.2)]
+    )
+
+    assert list(df.columns) == [
+        "central_pressure",
+        "radius",
+        "mass",
+        "mode",
+        "omega_squared",
+        "core_radius",
+        "core_mass",
+    ]
+    pd.testing.assert_series_equal(
+        df["mode"], pd.Series([np.nan, 1.0], name="mode")
+    )
+
+
+def test_invalid_records() -> None:
+    records = StarRecords()
+    with pytest.raises(ValueError):
+        records.append(central_pressure=10.0, status="exploded")
+    with pytest.raises(ValueError):
+        records.append(status="timed_out")
+
+
+def test_arrow_table(records: StarRecords) -> None:
+    pa = pytest.importorskip("pyarrow")
+    table = records.to_arrow()
+
+    assert table.column_names == [*records.present(), "status"]
+    assert table["mode"].to_pylist() == [None, 0, None]
+    assert table["radius"].null_count == 1
+    assert table["status"].type == pa.dictionary(pa.int8(), pa.string())
+    assert table["status"].to_pylist() == ["ok", "ok", "not_converged"]
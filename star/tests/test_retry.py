@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+from ...equationsofstate.gpp import GPP
+from ...equationsofstate.massless_mit_bm import MasslessMITBM
+from ..factory import StarFactory, StarStabilityFactory
+from ..retry import (
+    create_stellar_family_with_retries,
+    flipped_omega_squared_guess,
+    relax_tolerances,
+    stiff_method,
+    try_create_star,
+)
+from ..failures import failure_reason
+from ..stability import (
+    CentralRadOscInput,
+    EigenfrequencyNotConvergedError,
+    RadialOscillationsIntegrationError,
+)
+from ..tov_solver import BoundaryNotFoundError, TOVInput
+
+CENTRAL_PRESSURES = (30.0, 800.0)
+
+
+@pytest.fixture()
+def fac() -> StarFactory:
+    # the lightest star does not fit in MAX_RADIUS
+    return StarFactory(TOVInput(GPP("SLY4"), MAX_RADIUS=11.0))
+
+
+def test_failure_reasons() -> None:
+    assert failure_reason(BoundaryNotFoundError()) == "boundary_not_found"
+    assert failure_reason(RadialOscillationsIntegrationError()) == "radial_oscillations"
+    assert failure_reason(EigenfrequencyNotConvergedError()) == "not_converged"
+    assert failure_reason(ValueError()) is None
+    assert failure_reason(KeyError()) is None
+
+
+def test_invalid_inputs_are_not_failures(fac: StarFactory) -> None:
+    with pytest.raises(ValueError):
+        try_create_star(fac, -1.0)
+
+
+def test_failures_do_not_abort_the_family(fac: StarFactory) -> None:
+    df = create_stellar_family_with_retries(fac, CENTRAL_PRESSURES, retries=())
+    assert np.isnan(df["radius"][0]) & (df["radius"][1] < 11.0)
+    assert (df["failure"][0] == "boundary_not_found") & df["failure"].isna()[1]
+    assert list(df["retries"]) == [0, 0]
+
+
+def test_only_failed_stars_are_retried(fac: StarFactory) -> None:
+    df = create_stellar_family_with_retries(fac, CENTRAL_PRESSURES)
+    assert df["radius"][0] > 11.0
+    assert df["failure"].isna().all()
+    assert list(df["retries"]) == [2, 0]
+
+
+def test_retries_copy_the_factory() -> None:
+    fac = StarStabilityFactory(CentralRadOscInput(TOVInput(MasslessMITBM())), -1e-3)
+    relaxed = relax_tolerances(fac)
+    stiff = stiff_method(fac)
+
+    assert relaxed.central_ro_in.INT_REL_TOL == 10 * fac.central_ro_in.INT_REL_TOL
+    assert np.isclose(relaxed.star_fac.tov_input.RELATIVE_TOLERANCE, 1e-5)
+    assert (stiff.central_ro_in.method, stiff.star_fac.tov_input.method) == ("auto",) * 2
+    assert flipped_omega_squared_guess(fac).omega_squared_guess == 1e-3
+    assert (fac.central_ro_in.method, fac.omega_squared_guess) == ("DOP853", -1e-3)
+    assert flipped_omega_squared_guess(StarFactory(TOVInput(MasslessMITBM()))) is None
+
+
+def test_budget_failures_are_timed_out() -> None:
+    fac = StarFactory(TOVInput(GPP("SLY4"), MAX_RHS_EVALUATIONS=100))
+    df = create_stellar_family_with_retries(fac, CENTRAL_PRESSURES, retries=())
+    assert list(df["failure"]) == ["timed_out"] * 2
+
+
+def test_family_deadline(fac: StarFactory) -> None:
+    df = create_stellar_family_with_retries(fac, CENTRAL_PRESSURES, deadline=1e-6)
+    assert list(df["failure"]) == ["timed_out"] * 2
+    assert list(df["retries"]) == [0, 0]
@@ -0,0 +1,92 @@
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Iterator
+import pytest
+from ...equationsofstate.massless_mit_bm import MasslessMITBM
+from ..constellation import create_stellar_family
+from ..factory import StarFactory
+from ..service import ServiceClient, ServiceError, StarService
+from ..tov_solver import TOVInput
+
+
+@dataclass
+class GatedFactory:
+    """Factory whose stars are solved once 'gate' is set."""
+
+    fac: StarFactory
+    gate: threading.Event
+
+    def create_star(self, central_pressure: float) -> Any:
+        self.gate.wait()
+        return self.fac.create_star(central_pressure)
+
+
+@pytest.fixture()
+def fac() -> StarFactory:
+    return StarFactory(TOVInput(MasslessMITBM()))
+
+
+@pytest.fixture()
+def client(fac: StarFactory) -> Iterator[ServiceClient]:
+    with StarService({"mit": fac}) as service:
+        server = service.serve(("127.0.0.1", 0))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        yield ServiceClient(f"http://127.0.0.1:{server.server_port}")
+        server.shutdown()
+
+
+def test_repeated_stars_are_cached(fac: StarFactory) -> None:
+    with StarService({"mit": fac}, cache_size=2) as service:
+        # the second star is solved once, while the first is in flight
+        service.create_stars("mit", [100.0, 100.0, 200.0])
+        assert service.hits == 1
+        service.create_star("mit", 100.0)
+        assert service.hits == 2
+        service.create_star("mit", 300.0)
+        assert list(service.cache) == [
+            ("mit", 0, "central_pressure", 100.0),
+            ("mit", 0, "central_pressure", 300.0),
+        ]
+        service.register("mit", StarFactory(TOVInput(MasslessMITBM(60))))
+        assert not service.cache
+
+
+def test_registering_during_a_solve(fac: StarFactory) -> None:
+    gate = threading.Event()
+    new_fac = StarFactory(TOVInput(MasslessMITBM(60)))
+    with StarService({"mit": GatedFactory(fac, gate)}, ThreadPoolExecutor) as service:
+        with ThreadPoolExecutor(2) as requests:
+            old = requests.submit(service.create_star, "mit", 100.0)
+            while not service.in_flight:
+                time.sleep(0.01)
+            service.register("mit", new_fac)
+            new = requests.submit(service.create_star, "mit", 100.0)
+            try:
+                # not the solve of the old factory, still waiting for the gate
+                assert new.result(timeout=10) == new_fac.create_star(100.0)
+            finally:
+                gate.set()
+
+        assert old.result() == fac.create_star(100.0)
+        assert service.create_star("mit", 100.0) == new_fac.create_star(100.0)
+        assert list(service.cache) == [("mit", 1, "central_pressure", 100.0)]
+
+
+def test_family_over_http(fac: StarFactory, client: ServiceClient) -> None:
+    central_pressures = [100.0, 300.0, 500.0]
+
+    assert client.factories() == ["mit"]
+    assert client.create_stellar_family("mit", central_pressures).equals(
+        create_stellar_family(fac, central_pressures)
+    )
+    assert client.create_star("mit", 300.0)["central_pressure"] == 300.0
+    assert client.star_with_mass("mit", 1.0)["mass"] == pytest.approx(1.0, rel=1e-3)
+
+
+def test_errors_over_http(client: ServiceClient) -> None:
+    with pytest.raises(ServiceError, match="Unknown factory"):
+        client.create_star("sly4", 100.0)
+    with pytest.raises(ServiceError, match="Unknown method"):
+        client.call("delete")
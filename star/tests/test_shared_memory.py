@@ -0,0 +1,61 @@
+import pickle
+import numpy as np
+import pytest
+from ...equationsofstate.gpp import GPP
+from ...equationsofstate.interpolate import TabulatedEOS, tabulate_eos
+from ..constellation import create_stars
+from ..factory import StarFactory, StarStabilityFactory
+from .. import shared_memory
+from ..shared_memory import (
+    PROFILE_COLUMNS,
+    SharedProfiles,
+    create_stars_with_profiles,
+    published_eos,
+)
+from ..stability import CentralRadOscInput
+from ..tov_solver import TOVInput
+
+
+@pytest.fixture()
+def eos() -> TabulatedEOS:
+    pressures = np.geomspace(1e-10, 2e3, 2000)
+    return TabulatedEOS(pressures, tabulate_eos(GPP("SLY4"), pressures))
+
+
+def test_published_eos_is_pickled_by_name(eos: TabulatedEOS) -> None:
+    with published_eos(eos) as shared:
+        assert len(pickle.dumps(shared)) < len(pickle.dumps(eos)) / 100
+        attached = pickle.loads(pickle.dumps(shared))
+        assert attached.energy_density_from(100.0) == eos.energy_density_from(100.0)
+
+    assert shared.name not in shared_memory._attached
+    assert shared.name not in shared_memory._attached_eoss
+
+
+def test_stars_of_published_eos(eos: TabulatedEOS) -> None:
+    central_pressures = [100.0, 500.0]
+    with published_eos(eos) as shared:
+        stars = create_stars(StarFactory(TOVInput(shared)), central_pressures)
+
+    assert stars == create_stars(StarFactory(TOVInput(eos)), central_pressures)
+
+
+def test_profiles_through_shared_memory() -> None:
+    fac = StarStabilityFactory(CentralRadOscInput(TOVInput(GPP("SLY4"))), -1e-3)
+    with SharedProfiles(2) as profiles:
+        stars, ips = create_stars_with_profiles(fac, [100.0, 500.0], profiles)
+        fac.create_star(500.0)
+        expected = fac.set_internal_profiles()
+
+        assert stars[1] == fac.create_star(500.0)
+    for col in PROFILE_COLUMNS:
+        assert np.array_equal(getattr(ips[1], col), getattr(expected, col))
+
+
+def test_profiles_that_do_not_fit_are_returned() -> None:
+    fac = StarFactory(TOVInput(GPP("SLY4")))
+    with SharedProfiles(1, max_points=len(PROFILE_COLUMNS)) as profiles:
+        _, (ip,) = create_stars_with_profiles(fac, [100.0], profiles)
+
+    assert len(ip.radial_coord) > len(PROFILE_COLUMNS)
+    assert ip.xi is None
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from ...equationsofstate.gpp import GPP
+from ...equationsofstate.massless_mit_bm import MasslessMITBM
+from ..factory import StarStabilityFactory
+from ..stability import CentralRadOscInput
+from ..tov_solver import (
+    TOVInput,
+    ivp_method,
+    mass_derivative,
+    pressure_derivative,
+    solve_tov,
+    time_metric_fn_derivative,
+    tov_jacobian,
+)
+
+
+def test_invalid_method() -> None:
+    with pytest.raises(ValueError):
+        assert TOVInput(MasslessMITBM(), method="RK4")
+    with pytest.raises(ValueError):
+        assert CentralRadOscInput(TOVInput(MasslessMITBM()), method="RK4")
+
+
+def test_ivp_method() -> None:
+    assert ivp_method("auto", np.eye) == {"method": "LSODA", "jac": np.eye}
+    assert ivp_method("DOP853", np.eye) == {"method": "DOP853"}
+    assert ivp_method("Radau") == {"method": "Radau"}
+
+
+def test_tov_jacobian() -> None:
+    eos = GPP("SLY4")
+
+    def rhs(r: float, y: np.ndarray) -> np.ndarray:
+        v, m, p = y
+        e = eos.energy_density_from(p)
+        dvdr = time_metric_fn_derivative(r, p, m)
+        return np.array([dvdr, mass_derivative(r, e), pressure_derivative(e, p, dvdr)])
+
+    r, y = (5.0, np.array([-0.3, 0.4, 80.0]))
+    e, dedp = (eos.energy_density_from(y[2]), 1 / eos.sound_speed_squared_from(y[2]))
+    jacobian = tov_jacobian(r, y[1], y[2], e, dedp)
+    steps = np.array([1e-6, 1e-6, 1e-4])
+    finite_differences = np.column_stack(
+        [(rhs(r, y + dy) - rhs(r, y - dy)) / (2 * h) for dy, h in zip(np.diag(steps), steps)]
+    )
+    assert np.allclose(jacobian, finite_differences, rtol=1e-6, atol=1e-12)
+
+
+@pytest.mark.parametrize("method", ["Radau", "BDF", "LSODA", "auto"])
+def test_stiff_tov_solutions(method: str) -> None:
+    eos = GPP("SLY4")
+    explicit = solve_tov(TOVInput(eos, RELATIVE_TOLERANCE=1e-10), 300.0)
+    implicit = solve_tov(TOVInput(eos, RELATIVE_TOLERANCE=1e-8, method=method), 300.0)
+    assert np.isclose(implicit.t_events[0][0], explicit.t_events[0][0], rtol=1e-5)
+    assert np.isclose(implicit.y_events[0][0][1], explicit.y_events[0][0][1], rtol=1e-5)
+    assert implicit.njev > 0
+
+
+def test_stiff_radial_oscillations() -> None:
+    def omega_squared(method: str) -> float:
+        fac = StarStabilityFactory(
+            CentralRadOscInput(
+                TOVInput(GPP("SLY4")), method=method, INT_ABS_TOL=1e-9, INT_REL_TOL=1e-6
+            ),
+            1e-4,
+        )
+        return fac.create_star(300.0).omega_squared
+
+    assert np.isclose(omega_squared("auto"), omega_squared("DOP853"), rtol=1e-4)
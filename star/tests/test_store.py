@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from ...equationsofstate.gpp import GPP
+from ..constellation import create_family
+from ..factory import StarFactory
+from ..family import StellarFamily
+from ..store import ResultStore
+from ..tov_solver import TOVInput
+
+CENTRAL_PRESSURES = np.geomspace(10, 1500, 12)
+
+
+@pytest.fixture(scope="module")
+def families() -> dict[str, StellarFamily]:
+    return {
+        eos: create_family(StarFactory(TOVInput(GPP(eos))), CENTRAL_PRESSURES)
+        for eos in ("SLY4", "H4")
+    }
+
+
+@pytest.fixture()
+def store(families: dict[str, StellarFamily], tmp_path) -> ResultStore:
+    store = ResultStore(str(tmp_path / "store"))
+    for eos, family in families.items():
+        store.write_family({"eos": eos}, family)
+    return store
+
+
+def test_query_on_summaries(store: ResultStore) -> None:
+    # R_1.4 of SLy4 is ~11.6 km, that of H4 ~13.9 km; both M_max ~2 M_sun
+    assert list(store.partitions("M_max > 1.9 and R_1_4 < 13")["eos"]) == ["SLY4"]
+    assert list(store.partitions("R_1_4 > 13")["eos"]) == ["H4"]
+    assert store.partitions("M_max > 2.5")["eos"].empty
+
+
+def test_select_stars(store: ResultStore, families: dict[str, StellarFamily]) -> None:
+    stars = store.select("eos == 'SLY4'", "mass > 2.5", columns=["mass"])
+
+    assert list(stars.columns) == ["central_pressure", "mass", "partition", "eos"]
+    assert np.array_equal(
+        stars["mass"], families["SLY4"]["mass"][families["SLY4"]["mass"] > 2.5]
+    )
+
+
+def test_rewritten_partition_replaces_it(
+    store: ResultStore, families: dict[str, StellarFamily]
+) -> None:
+    shorter = StellarFamily.from_dataframe(families["SLY4"].to_dataframe().iloc[:3])
+    store.write_family({"eos": "SLY4"}, shorter)
+
+    partition = store.partitions("eos == 'SLY4'")["partition"].iloc[0]
+    assert len(store.index()) == 2
+    assert len(store.family(partition)) == 3
+
+
+def test_profiles_round_trip(tmp_path) -> None:
+    fac = StarFactory(TOVInput(GPP("SLY4")))
+    stars, profiles = [], []
+    for pc in (100.0, 500.0):
+        stars.append(fac.create_star(pc))
+        profiles.append(fac.set_internal_profiles())
+    store = ResultStore(str(tmp_path))
+    partition = store.write_family(
+        {"eos": "SLY4"}, StellarFamily.from_stars(stars), profiles
+    )
+
+    for profile, stored in zip(profiles, store.profiles(partition)):
+        assert np.array_equal(profile.pressures, stored.pressures)
+        assert np.array_equal(profile.time_metric_fn, stored.time_metric_fn)
+        assert stored.xi is None
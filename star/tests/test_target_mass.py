@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from typing import Any
+from ...equationsofstate.gpp import GPP
+from ...equationsofstate.massless_mit_bm import MasslessMITBM
+from ..conversionfactors import M_SUN_IN_KM
+from .. import target_mass
+from ..factory import StarFactory
+from ..target_mass import (
+    MaximumMassExceededError,
+    central_pressure_for_mass,
+    maximum_mass,
+    solve_for_mass,
+)
+from ..tov_solver import TOVInput, solve_tov
+
+
+@pytest.fixture()
+def tov_input() -> TOVInput:
+    return TOVInput(GPP("SLY4"))
+
+
+def test_solve_for_mass(tov_input: TOVInput) -> None:
+    targets = [1.4 * M_SUN_IN_KM, 2.0 * M_SUN_IN_KM]
+    stars = solve_for_mass(StarFactory(tov_input), targets)
+    assert np.allclose(stars["mass"], targets, rtol=1e-6)
+
+
+def test_newton_with_sensitivities(tov_input: TOVInput) -> None:
+    target = 1.4 * M_SUN_IN_KM
+    central_pressure = central_pressure_for_mass(
+        TOVInput(GPP("SLY4"), sensitivities=True), target
+    )
+    assert np.isclose(
+        StarFactory(tov_input).create_star(central_pressure).mass, target, rtol=1e-6
+    )
+
+
+def test_target_on_stable_branch(tov_input: TOVInput) -> None:
+    # a guess beyond the maximum mass must not end on the unstable branch
+    central_pressure = central_pressure_for_mass(tov_input, 2.0 * M_SUN_IN_KM, 3000.0)
+    assert central_pressure < np.exp(maximum_mass(tov_input)[1])
+
+
+def test_target_above_maximum_mass(tov_input: TOVInput) -> None:
+    with pytest.raises(MaximumMassExceededError):
+        assert central_pressure_for_mass(tov_input, 2.2 * M_SUN_IN_KM)
+
+
+def test_loose_tolerances_converge_in_a_few_solves(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[float] = []
+
+    def counted_solve_tov(tov_input: TOVInput, central_pressure: float) -> Any:
+        calls.append(central_pressure)
+        return solve_tov(tov_input, central_pressure)
+
+    monkeypatch.setattr(target_mass, "solve_tov", counted_solve_tov)
+    central_pressure_for_mass(
+        TOVInput(MasslessMITBM(57), RELATIVE_TOLERANCE=1e-3), 1.4 * M_SUN_IN_KM
+    )
+    # stops at the TOV tolerance instead of chasing integration noise
+    assert len(calls) <= 5
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+from typing import Any
+from ...equationsofstate.css import CSS
+from ...equationsofstate.gpp import GPP
+from ...equationsofstate.eos import EquationOfState
+from ...equationsofstate.massless_mit_bm import MasslessMITBM
+from ...hybrid_star.hybrid_eos import HybridEOS
+from ..tov_solver import TOVInput, solve_tov
+
+TIGHT_TOLERANCES: dict[str, Any] = dict(
+    RELATIVE_TOLERANCE=1e-11, ABSOLUTE_TOLERANCE=[1e-12, 1e-12, 1e-22]
+)
+
+
+def finite_difference(eos: EquationOfState, central_pressure: float) -> tuple[float, float]:
+    h: float = 3e-3 * central_pressure
+    plus = solve_tov(TOVInput(eos, **TIGHT_TOLERANCES), central_pressure + h)
+    minus = solve_tov(TOVInput(eos, **TIGHT_TOLERANCES), central_pressure - h)
+    return (
+        (plus.t_events[0][0] - minus.t_events[0][0]) / (2 * h),
+        (plus.y_events[0][0][1] - minus.y_events[0][0][1]) / (2 * h),
+    )
+
+
+def test_invalid_sensitivities_tov_input() -> None:
+    with pytest.raises(ValueError):
+        assert TOVInput(CSS(400, 100, 0.5, 20), formulation="enthalpy", sensitivities=True)
+
+
+@pytest.mark.parametrize(
+    "eos, central_pressure", [(CSS(400, 100, 0.5, 20), 100.0), (GPP("SLY4"), 100.0)]
+)
+def test_central_pressure_gradients(eos: EquationOfState, central_pressure: float) -> None:
+    tov_solution = solve_tov(TOVInput(eos, sensitivities=True), central_pressure)
+    dRdpc, dMdpc = finite_difference(eos, central_pressure)
+    assert np.isclose(tov_solution.radius_gradient[0], dRdpc, rtol=1e-3)
+    assert np.isclose(tov_solution.mass_gradient[0], dMdpc, rtol=1e-3)
+
+
+def test_eos_parameter_gradients() -> None:
+    tov_solution = solve_tov(TOVInput(CSS(400, 100, 0.5, 20), sensitivities=True), 100.0)
+    h: float = 1e-3
+    plus = solve_tov(TOVInput(CSS(400, 100, 0.5 + h, 20), **TIGHT_TOLERANCES), 100.0)
+    minus = solve_tov(TOVInput(CSS(400, 100, 0.5 - h, 20), **TIGHT_TOLERANCES), 100.0)
+    i = tov_solution.sensitivity_parameters.index("sound_speed_squared")
+    assert np.isclose(
+        tov_solution.mass_gradient[i],
+        (plus.y_events[0][0][1] - minus.y_events[0][0][1]) / (2 * h),
+        rtol=1e-3,
+    )
+
+
+def test_hybrid_eos_parameter_gradients() -> None:
+    def hybrid_tov_input(bag_press: float, **kwargs: Any) -> TOVInput:
+        hybrid_eos = HybridEOS(MasslessMITBM(57), MasslessMITBM(bag_press), 100)
+        return TOVInput(hybrid_eos, interface_pressures=(100,), **kwargs)
+
+    tov_solution = solve_tov(hybrid_tov_input(70, sensitivities=True), 300.0)
+    h: float = 1e-2
+    plus = solve_tov(hybrid_tov_input(70 + h, **TIGHT_TOLERANCES), 300.0)
+    minus = solve_tov(hybrid_tov_input(70 - h, **TIGHT_TOLERANCES), 300.0)
+    i = tov_solution.sensitivity_parameters.index("eos2.BAG_PRESS")
+    assert np.isclose(
+        tov_solution.radius_gradient[i],
+        (plus.t_events[0][0] - minus.t_events[0][0]) / (2 * h),
+        rtol=1e-3,
+    )
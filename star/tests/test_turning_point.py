@@ -0,0 +1,27 @@
+import numpy as np
+import pandas as pd
+from ...equationsofstate.gpp import GPP
+from ..factory import StarStabilityFactory
+from ..stability import CentralRadOscInput
+from ..tov_solver import TOVInput
+from ..turning_point import create_classified_family, near_turning_points
+
+
+def test_near_turning_points() -> None:
+    stable = np.array([True, True, True, False, False, False])
+    assert near_turning_points(stable, 1).tolist() == [
+        False, False, True, True, False, False
+    ]
+
+
+def test_no_turning_points() -> None:
+    assert not near_turning_points(np.ones(5, dtype=bool), 2).any()
+
+
+def test_create_classified_family() -> None:
+    fac = StarStabilityFactory(CentralRadOscInput(TOVInput(GPP("SLY4"))), 1e-4)
+    family: pd.DataFrame = create_classified_family(fac, np.geomspace(300, 4000, 10))
+    oscillated = family["stability_method"] == "radial_oscillations"
+    assert oscillated.sum() == 2
+    assert family["stable"].tolist() == [True] * 4 + [False] * 6
+    assert (family.loc[oscillated, "omega_squared"] > 0).tolist() == [True, False]
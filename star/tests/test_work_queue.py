@@ -0,0 +1,87 @@
+import os
+import time
+import pytest
+from ...equationsofstate.gpp import GPP
+from ...equationsofstate.massless_mit_bm import MasslessMITBM
+from ..constellation import create_stellar_family
+from ..factory import StarFactory
+from ..retry import create_stellar_family_with_retries
+from ..tov_solver import TOVInput
+from ..work_queue import WorkQueueExecutor
+
+
+def sleep_for(seconds: float) -> float:
+    time.sleep(seconds)
+    return seconds
+
+
+def sleep_once(path: str, seconds: float) -> float:
+    """Sleeps on the first run only, leaving 'path' behind."""
+    if not os.path.exists(path):
+        open(path, "w").close()
+        time.sleep(seconds)
+    return seconds
+
+
+def wait_for(path: str) -> None:
+    while not os.path.exists(path):
+        time.sleep(0.01)
+
+
+def test_tasks_are_balanced_dynamically() -> None:
+    # a slow task must not hold back the tasks submitted after it
+    with WorkQueueExecutor(local_workers=2) as executor:
+        slow = executor.submit(sleep_for, 1.0)
+        fast = [executor.submit(sleep_for, 0.01) for _ in range(20)]
+        assert all(f.result() == 0.01 for f in fast)
+        assert not slow.done()
+
+    assert slow.result() == 1.0
+
+
+def test_exceptions_are_raised_by_futures() -> None:
+    with WorkQueueExecutor(local_workers=1) as executor:
+        future = executor.submit(sleep_for, "not a number")
+
+    with pytest.raises(TypeError):
+        future.result()
+
+
+def test_tasks_of_killed_workers_are_requeued(tmp_path) -> None:
+    path = str(tmp_path / "started")
+    with WorkQueueExecutor(local_workers=1) as executor:
+        future = executor.submit(sleep_once, path, 60.0)
+        wait_for(path)
+        next(iter(executor.workers.values())).kill()
+
+        assert future.result(timeout=30) == 60.0
+
+
+def test_shutdown_without_wait(tmp_path) -> None:
+    path = str(tmp_path / "started")
+    executor = WorkQueueExecutor(local_workers=1)
+    future = executor.submit(sleep_once, path, 60.0)
+    wait_for(path)
+    start = time.time()
+    executor.shutdown(wait=False)
+
+    assert time.time() - start < 1.0
+    assert future.cancelled()
+
+
+def test_family_with_work_queue() -> None:
+    fac = StarFactory(TOVInput(MasslessMITBM()))
+    central_pressures = [100.0, 300.0, 500.0]
+
+    assert create_stellar_family(fac, central_pressures, WorkQueueExecutor).equals(
+        create_stellar_family(fac, central_pressures)
+    )
+
+
+def test_retries_with_work_queue() -> None:
+    fac = StarFactory(TOVInput(GPP("SLY4"), MAX_RADIUS=11.0))
+    df = create_stellar_family_with_retries(
+        fac, [30.0, 800.0], executor=WorkQueueExecutor
+    )
+
+    assert df["failure"].isna().all()
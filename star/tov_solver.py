@@ -1,15 +1,41 @@
+import time
 import functools
 import numpy as np
-from scipy.integrate import solve_ivp
-from dataclasses import dataclass, field
-from typing import Any, Callable, Iterable
+from scipy.integrate import OdeSolution, quad, solve_ivp
+from scipy.optimize import OptimizeResult, brentq
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Iterable, Optional, Protocol
 
 from . import conversionfactors as cf
 from ..equationsofstate.eos import EquationOfState
+from ..equationsofstate.interpolate import RIPEOS, TabulatedEOS
 
 Array = np.ndarray
 Event = Callable[[float, Array], float]
 
+FORMULATIONS: tuple[str, ...] = ("radius", "enthalpy")
+LOG_PRESSURE_FLOOR: float = -70.0
+CENTRAL_ENTHALPY_STEP: float = 1e-4
+SURFACE_PRESSURE_LEVEL: float = 1e-12
+INTEGRATION_METHODS: tuple[str, ...] = ("DOP853", "Radau", "BDF", "LSODA", "auto")
+# first step of a segment restarted at an interface, relative to its radius
+RESTART_STEP_FRACTION: float = 1e-3
+
+
+class Envelope(Protocol):
+    """Precomputed crust, see star.envelope.CrustEnvelope."""
+
+    transition_pressure: float
+
+    def covers(self, radius: float, mass: float) -> bool:
+        """Whether the crust base (radius, mass) is tabulated."""
+
+    def crust_from(self, radius: float, mass: float) -> tuple[float, float, float]:
+        """Crust thickness, mass and time metric function increment."""
+
+    def matches(self, eos: EquationOfState) -> bool:
+        """Whether 'eos' is the crust EOS below the transition pressure."""
+
 
 @dataclass(slots=True)
 class TOVInput:
@@ -21,6 +47,13 @@ class TOVInput:
     RELATIVE_TOLERANCE: float = 1e-6
     ABSOLUTE_TOLERANCE: list[float] = field(default_factory=lambda: [1e-4, 1e-4, 1e-15])
     events: Iterable[Event] = field(default_factory=tuple)
+    interface_pressures: tuple[float, ...] = field(default_factory=tuple)
+    formulation: str = "radius"
+    envelope: Optional[Envelope] = None
+    sensitivities: bool = False
+    method: str = "DOP853"
+    MAX_WALL_TIME: Optional[float] = None
+    MAX_RHS_EVALUATIONS: Optional[int] = None
 
     def __post_init__(self) -> None:
         if self.MIN_RADIUS <= 0.0:
@@ -30,15 +63,94 @@ class TOVInput:
             )
         if self.MAX_RADIUS <= self.MIN_RADIUS:
             raise ValueError("Maximum radius has to be larger than minimum radius.")
+        if self.formulation not in FORMULATIONS:
+            raise ValueError(f"TOV formulation must be one of {FORMULATIONS}.")
+        if self.method not in INTEGRATION_METHODS:
+            raise ValueError(f"Integration method must be one of {INTEGRATION_METHODS}.")
+        check_budget(self.MAX_WALL_TIME, self.MAX_RHS_EVALUATIONS)
+        if (self.envelope is not None) and (self.formulation == "enthalpy"):
+            raise ValueError("Crust envelopes are only available in radius formulation.")
+        if (self.envelope is not None) and (not self.envelope.matches(self.eos)):
+            raise ValueError(
+                "The crust EOS of the envelope must match the EOS "
+                + "below its transition pressure."
+            )
+        if self.sensitivities and (
+            (self.envelope is not None) or (self.formulation == "enthalpy")
+        ):
+            raise ValueError(
+                "Sensitivities are only available in radius formulation "
+                + "and without crust envelopes."
+            )
+
+
+def check_budget(max_wall_time: Optional[float], max_rhs_evaluations: Optional[int]) -> None:
+    if (max_wall_time is not None) and (max_wall_time <= 0):
+        raise ValueError("Maximum wall time has to be larger than zero.")
+    if (max_rhs_evaluations is not None) and (max_rhs_evaluations <= 0):
+        raise ValueError("Maximum number of RHS evaluations has to be larger than zero.")
+
+
+@dataclass
+class IntegrationBudget:
+    """Wall-clock time [s] and RHS evaluation budget shared by the
+    integrations of a star, enforced at every RHS evaluation.
+    None means unlimited."""
+
+    MAX_WALL_TIME: Optional[float] = None
+    MAX_RHS_EVALUATIONS: Optional[int] = None
+    rhs_evaluations: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        self.start: float = time.monotonic()
+
+    @property
+    def unlimited(self) -> bool:
+        return (self.MAX_WALL_TIME is None) and (self.MAX_RHS_EVALUATIONS is None)
+
+    def charge(self) -> None:
+        self.rhs_evaluations += 1
+        if (self.MAX_RHS_EVALUATIONS is not None) and (
+            self.rhs_evaluations > self.MAX_RHS_EVALUATIONS
+        ):
+            raise IntegrationBudgetExceededError(
+                f"More than {self.MAX_RHS_EVALUATIONS} RHS evaluations."
+            )
+        if (self.MAX_WALL_TIME is not None) and (
+            time.monotonic() - self.start > self.MAX_WALL_TIME
+        ):
+            raise IntegrationBudgetExceededError(
+                f"The integration took longer than {self.MAX_WALL_TIME} s."
+            )
+
+    def budgeted(self, fun: Callable[..., Any]) -> Callable[..., Any]:
+        """RHS charging the budget before each evaluation."""
+        if self.unlimited:
+            return fun
+
+        def budgeted_fun(*args: Any) -> Any:
+            self.charge()
+            return fun(*args)
+
+        return budgeted_fun
 
 
 def solve_tov(tov_input: TOVInput, central_pressure: float) -> Any:
     """Solves the TOV equations for a given central pressure and EOS.
+    Each solve has the budget set by TOVInput.MAX_WALL_TIME and
+    MAX_RHS_EVALUATIONS, raising an IntegrationBudgetExceededError when
+    it is exceeded.
     Returns a bunch object, see solve_ivp documentation for more details."""
 
     if central_pressure <= 0:
         raise ValueError("Central pressure has to be a larger than zero.")
 
+    if tov_input.formulation == "enthalpy":
+        return solve_tov_enthalpy(tov_input, central_pressure)
+
+    if tov_input.sensitivities:
+        return solve_tov_sensitivities(tov_input, central_pressure)
+
     def compute_taylor_expansion_at_center() -> tuple[float, float, float]:
         """Taylor expansion near the stellar center (r ~ 0)."""
         r0: float = tov_input.MIN_RADIUS
@@ -98,16 +210,33 @@ def solve_tov(tov_input: TOVInput, central_pressure: float) -> Any:
 
         return (dvdr, dmdr, dpdr)
 
-    tov_integration: Any = solve_ivp(
-        tov_equations,
-        (tov_input.MIN_RADIUS, tov_input.MAX_RADIUS),
-        initial_integration_vector,
-        method="DOP853",
-        dense_output=True,
-        rtol=tov_input.RELATIVE_TOLERANCE,
-        atol=tov_input.ABSOLUTE_TOLERANCE,
-        events=(boundary_event, *tov_input.events),
-    )
+    def tov_equations_jacobian(r: float, y: Array) -> Array:
+        v, m, p = y
+        e: float = tov_input.eos.energy_density_from(pressure=p)
+        dedp: float = 1 / tov_input.eos.sound_speed_squared_from(pressure=p)
+        return tov_jacobian(r, m, p, e, dedp)
+
+    def integrate_segment(
+        radial_interval: tuple[float, float],
+        integration_vector: Array,
+        interface_events: tuple[Event, ...],
+    ) -> Any:
+        # the automatic first step of a restarted segment is of the order of
+        # MAX_RADIUS, whose trial stages overshoot to 2m/r > 1
+        restarted: bool = radial_interval[0] > tov_input.MIN_RADIUS
+        return solve_ivp(
+            budget.budgeted(tov_equations),
+            radial_interval,
+            integration_vector,
+            **ivp_method(tov_input.method, tov_equations_jacobian),
+            dense_output=True,
+            rtol=tov_input.RELATIVE_TOLERANCE,
+            atol=tov_input.ABSOLUTE_TOLERANCE,
+            events=(boundary_event, *tov_input.events, *interface_events),
+            first_step=radial_interval[0] * RESTART_STEP_FRACTION if restarted else None,
+        )
+
+    budget = IntegrationBudget(tov_input.MAX_WALL_TIME, tov_input.MAX_RHS_EVALUATIONS)
 
     def check_integration_validity(success: bool, status: int) -> None:
         if not success:
@@ -122,11 +251,457 @@ def solve_tov(tov_input: TOVInput, central_pressure: float) -> Any:
                 + "Perhaps your TOVInput.MAXRADIUS is too small?"
             )
 
+    # the energy density is discontinuous at each interface, so the
+    # integration is restarted there from the exact junction conditions:
+    # v, m and p are continuous and p = p_interface on both sides.
+    crossed_interfaces: list[float] = sorted(
+        (p for p in tov_input.interface_pressures if p < central_pressure),
+        reverse=True,
+    )
+    segments: list[Any] = []
+    radius: float = tov_input.MIN_RADIUS
+    integration_vector = np.array(initial_integration_vector)
+
+    for interface_pressure in crossed_interfaces:
+        segment: Any = integrate_segment(
+            (radius, tov_input.MAX_RADIUS),
+            integration_vector,
+            (terminal_pressure_event(interface_pressure),),
+        )
+        check_integration_validity(segment.success, segment.status)
+        segments.append(segment)
+
+        radius = float(segment.t_events[-1][0])
+        integration_vector = np.array(segment.y_events[-1][0])
+        integration_vector[2] = interface_pressure
+
+    # with an envelope, the integration stops at the crust base
+    # and the crust is looked up instead of integrated
+    envelope: Optional[Envelope] = tov_input.envelope
+    reaches_envelope: bool = (envelope is not None) and (
+        envelope.transition_pressure < min([central_pressure, *crossed_interfaces])
+    )
+    crust_base_event: tuple[Event, ...] = (
+        (terminal_pressure_event(envelope.transition_pressure),)  # type: ignore
+        if reaches_envelope
+        else ()
+    )
+
+    tov_integration: Any = integrate_segment(
+        (radius, tov_input.MAX_RADIUS), integration_vector, crust_base_event
+    )
+
+    if reaches_envelope and tov_integration.t_events[-1].size:
+        base_radius = float(tov_integration.t_events[-1][0])
+        base: Array = np.array(tov_integration.y_events[-1][0])
+        base[2] = envelope.transition_pressure  # type: ignore
+
+        if envelope.covers(base_radius, base[1]):  # type: ignore
+            check_integration_validity(tov_integration.success, tov_integration.status)
+            merged = merge_segments(
+                [*segments, tov_integration], tov_input, len(crossed_interfaces)
+            )
+            return attach_envelope(merged, envelope, base_radius, base)  # type: ignore
+
+        segments.append(tov_integration)
+        tov_integration = integrate_segment(
+            (base_radius, tov_input.MAX_RADIUS), base, ()
+        )
+
     check_integration_validity(tov_integration.success, tov_integration.status)
 
+    if not (tov_input.interface_pressures or segments):
+        return tov_integration
+
+    return merge_segments(
+        [*segments, tov_integration], tov_input, len(crossed_interfaces)
+    )
+
+
+def merge_segments(
+    segments: list[Any], tov_input: TOVInput, n_crossed: int
+) -> OptimizeResult:
+    """Joins the TOV solutions of consecutive segments (center to surface)
+    in a single bunch object, with the same attributes as solve_ivp's.
+    The first 'n_crossed' segments end at an interface.
+    Events are ordered as: boundary, TOVInput.events, one per interface
+    (from the center outwards, empty if the interface is not crossed).
+    The number of RHS evaluations of each segment is kept in 'segments_nfev'."""
+    mantle: Any = segments[-1]
+    n_events: int = 1 + len(tuple(tov_input.events))
+
+    def interface_events(attr: str) -> list[Array]:
+        crossed: list[Array] = [getattr(seg, attr)[-1] for seg in segments[:n_crossed]]
+        n_missing: int = len(tov_input.interface_pressures) - len(crossed)
+        return [np.empty((0,) if attr == "t_events" else (0, 3))] * n_missing + crossed
+
+    def merge_events(attr: str) -> list[Array]:
+        return [
+            np.concatenate([getattr(seg, attr)[i] for seg in segments])
+            if i
+            else getattr(mantle, attr)[0]
+            for i in range(n_events)
+        ] + interface_events(attr)
+
+    return OptimizeResult(
+        t=np.concatenate([segments[0].t] + [seg.t[1:] for seg in segments[1:]]),
+        y=np.hstack([segments[0].y] + [seg.y[:, 1:] for seg in segments[1:]]),
+        sol=OdeSolution(
+            np.concatenate([segments[0].sol.ts] + [s.sol.ts[1:] for s in segments[1:]]),
+            [interp for seg in segments for interp in seg.sol.interpolants],
+        ),
+        t_events=merge_events("t_events"),
+        y_events=merge_events("y_events"),
+        nfev=sum(seg.nfev for seg in segments),
+        njev=sum(seg.njev for seg in segments),
+        nlu=sum(seg.nlu for seg in segments),
+        segments_nfev=[seg.nfev for seg in segments],
+        status=mantle.status,
+        message=mantle.message,
+        success=all(seg.success for seg in segments),
+    )
+
+
+def attach_envelope(
+    tov_integration: OptimizeResult,
+    envelope: Envelope,
+    base_radius: float,
+    base: Array,
+) -> OptimizeResult:
+    """Sets the star's boundary from the crust looked up in the envelope.
+    Profiles ('t', 'y', 'sol') only cover the core, up to the crust base."""
+    v, m, _ = base
+    thickness, crust_mass, dv = envelope.crust_from(base_radius, m)
+
+    tov_integration.t_events[0] = np.array([base_radius + thickness])
+    tov_integration.y_events[0] = np.array([[v + dv, m + crust_mass, 0.0]])
+    tov_integration.update(
+        crust_thickness=thickness,
+        crust_mass=crust_mass,
+        status=1,
+        message="The star's boundary was obtained from the crust envelope.",
+    )
     return tov_integration
 
 
+def terminal_pressure_event(pressure: float) -> Event:
+    """Terminal event stopping the integration when p(r) reaches 'pressure'."""
+    event = functools.partial(interface_event, pressure)
+    event.terminal = True  # type: ignore
+    event.direction = -1  # type: ignore
+    return event
+
+
+def solve_tov_enthalpy(tov_input: TOVInput, central_pressure: float) -> Any:
+    """Solves the TOV equations using the pseudo-enthalpy h, dh = dp/(e + p),
+    as the independent variable (Lindblom, ApJ 398, 569 (1992)).
+    The integration runs from h_c to h = 0, so the surface is reached
+    exactly without any event. Returns a bunch object with the same
+    attributes as solve_tov (the radius as 't', and (v, m, p) as 'y'),
+    but without dense output: 'sol' is None, profiles are given on 't'."""
+    crossed_interfaces: list[float] = sorted(
+        (p for p in tov_input.interface_pressures if p < central_pressure),
+        reverse=True,
+    )
+    node_pressures: list[float] = [central_pressure, *crossed_interfaces]
+    node_enthalpies: Array = pseudo_enthalpies(tov_input.eos, node_pressures[::-1])[::-1]
+    central_enthalpy = float(node_enthalpies[0])
+
+    def tov_equations_enthalpy(h: float, z: Array) -> tuple[float, float, float]:
+        """TOV equations for radius, mass and pressure as functions of h.
+        The time metric function is v = h_c - h."""
+        r, m, p = z
+        e: float = tov_input.eos.energy_density_from(pressure=p)
+
+        drdh: float = -1 / time_metric_fn_derivative(r, p, m)
+        dmdh: float = mass_derivative(r, e) * drdh
+        dpdh: float = e + p
+
+        return (drdh, dmdh, dpdh)
+
+    def in_radius(event: Event) -> Event:
+        def event_in_enthalpy(h: float, z: Array) -> float:
+            return event(z[0], np.array([central_enthalpy - h, z[1], z[2]]))
+
+        event_in_enthalpy.terminal = getattr(event, "terminal", False)  # type: ignore
+        event_in_enthalpy.direction = getattr(event, "direction", 0)  # type: ignore
+        return event_in_enthalpy
+
+    def compute_expansion_at_center() -> tuple[float, Array]:
+        """Expansion near the stellar center (h ~ h_c), Lindblom (1992) eq. (12),
+        starting where the leading order radius equals MIN_RADIUS or where
+        h_c - h = CENTRAL_ENTHALPY_STEP * h_c, whichever is larger."""
+        p0: float = central_pressure
+        e0: float = tov_input.eos.energy_density_from(pressure=p0) * cf.MEV_FM3_TO_KM_2
+        cs2: float = tov_input.eos.sound_speed_squared_from(pressure=p0)
+        p0 *= cf.MEV_FM3_TO_KM_2
+        dedh: float = (e0 + p0) / cs2
+
+        dh: float = max(
+            2 * np.pi / 3 * (e0 + 3 * p0) * tov_input.MIN_RADIUS**2,
+            CENTRAL_ENTHALPY_STEP * central_enthalpy,
+        )
+        r0: float = np.sqrt(3 * dh / (2 * np.pi * (e0 + 3 * p0)))
+        r0 *= 1 - (e0 - 3 * p0 - 0.6 * dedh) / (4 * (e0 + 3 * p0)) * dh
+        m0: float = 4 * np.pi / 3 * e0 * r0**3 * (1 - 0.6 * dedh / e0 * dh)
+        pc: float = central_pressure - (e0 + p0) / cf.MEV_FM3_TO_KM_2 * dh
+
+        return (central_enthalpy - dh, np.array([r0, m0, pc]))
+
+    budget = IntegrationBudget(tov_input.MAX_WALL_TIME, tov_input.MAX_RHS_EVALUATIONS)
+    events: tuple[Event, ...] = tuple(in_radius(ev) for ev in tov_input.events)
+    enthalpy, integration_vector = compute_expansion_at_center()
+    segments: list[Any] = []
+
+    for interface_pressure, interface_enthalpy in zip(
+        [*crossed_interfaces, 0.0], [*node_enthalpies[1:], 0.0]
+    ):
+        segment: Any = solve_ivp(
+            budget.budgeted(tov_equations_enthalpy),
+            (enthalpy, float(interface_enthalpy)),
+            integration_vector,
+            **ivp_method(tov_input.method),
+            rtol=tov_input.RELATIVE_TOLERANCE,
+            atol=(tov_input.MIN_RADIUS, tov_input.MIN_RADIUS, tov_input.ABSOLUTE_TOLERANCE[2]),
+            events=events,
+        )
+        if not segment.success:
+            raise TOVIntegrationError(
+                "The integration of the TOV eqs. was not successfull..."
+            )
+        segments.append(segment)
+
+        enthalpy = float(interface_enthalpy)
+        integration_vector = np.array(segment.y[:, -1])
+        integration_vector[2] = interface_pressure
+
+    def in_radius_coords(h: Array, z: Array) -> Array:
+        return np.vstack([central_enthalpy - h, z[1], z[2]])
+
+    def merge_events(i: int) -> tuple[Array, Array]:
+        h_ev = np.concatenate([seg.t_events[i] for seg in segments])
+        z_ev = np.concatenate([seg.y_events[i] for seg in segments]).reshape(-1, 3)
+        return (z_ev[:, 0], in_radius_coords(h_ev, z_ev.T).T)
+
+    def node_event(seg: Any) -> tuple[Array, Array]:
+        return (seg.y[0, -1:], in_radius_coords(seg.t[-1:], seg.y[:, -1:]).T)
+
+    n_missing: int = len(tov_input.interface_pressures) - len(crossed_interfaces)
+    all_events: list[tuple[Array, Array]] = (
+        [node_event(segments[-1])]
+        + [merge_events(i) for i in range(len(events))]
+        + [(np.empty(0), np.empty((0, 3)))] * n_missing
+        + [node_event(seg) for seg in segments[:-1]]
+    )
+
+    return OptimizeResult(
+        t=np.concatenate([segments[0].y[0]] + [seg.y[0, 1:] for seg in segments[1:]]),
+        y=np.hstack(
+            [in_radius_coords(segments[0].t, segments[0].y)]
+            + [in_radius_coords(seg.t[1:], seg.y[:, 1:]) for seg in segments[1:]]
+        ),
+        t_events=[t_ev for t_ev, _ in all_events],
+        y_events=[y_ev for _, y_ev in all_events],
+        sol=None,
+        central_enthalpy=central_enthalpy,
+        nfev=sum(seg.nfev for seg in segments),
+        njev=sum(seg.njev for seg in segments),
+        nlu=sum(seg.nlu for seg in segments),
+        segments_nfev=[seg.nfev for seg in segments],
+        status=1,
+        message="The surface h = 0 was reached.",
+        success=True,
+    )
+
+
+def solve_tov_sensitivities(tov_input: TOVInput, central_pressure: float) -> Any:
+    """Solves the TOV equations and then their first-order sensitivity
+    (variational) equations, dS/dr = J S + df/dtheta, along the TOV solution.
+    S holds the derivatives of (v, m, p) w.r.t. the central pressure and the
+    EOS parameters of 'energy_density_gradient_from'.
+    At each pressure where e(p) jumps, S jumps by (f- - f+) dr_jump/dtheta.
+    The surface is approached up to p = SURFACE_PRESSURE_LEVEL * p_c, and the
+    thin outer layer is added using its pseudo-enthalpy, so that dR/dtheta
+    is also well defined for soft (e -> 0) surfaces.
+    Returns solve_tov's bunch object with 'sensitivity_parameters',
+    'radius_gradient' [km], 'mass_gradient' [km] and 'sensitivity_nfev'."""
+    eos: EquationOfState = tov_input.eos
+    tov_integration: Any = solve_tov(
+        replace(tov_input, sensitivities=False), central_pressure
+    )
+    radius = float(tov_integration.t_events[0][0])
+    parameters: tuple[str, ...] = (
+        "central_pressure",
+        *eos.energy_density_gradient_from(central_pressure),
+    )
+
+    def tov_rhs(r: float, y: Array, e: float) -> Array:
+        v, m, p = y
+        dvdr: float = time_metric_fn_derivative(r, p, m)
+        return np.array([dvdr, mass_derivative(r, e), pressure_derivative(e, p, dvdr)])
+
+    def sensitivity_equations(r: float, s: Array) -> Array:
+        v, m, p = tov_integration.sol(r)
+        e: float = eos.energy_density_from(pressure=p)
+        dedp: float = 1 / eos.sound_speed_squared_from(pressure=p)
+        dedtheta = np.array([0.0, *eos.energy_density_gradient_from(p).values()])
+
+        dvdr: float = time_metric_fn_derivative(r, p, m)
+        forcing: Array = np.outer([0.0, mass_derivative(r, 1.0), -dvdr], dedtheta)
+
+        return (tov_jacobian(r, m, p, e, dedp) @ s.reshape(3, -1) + forcing).ravel()
+
+    def sensitivity_jacobian(r: float, s: Array) -> Array:
+        v, m, p = tov_integration.sol(r)
+        e: float = eos.energy_density_from(pressure=p)
+        dedp: float = 1 / eos.sound_speed_squared_from(pressure=p)
+        return np.kron(tov_jacobian(r, m, p, e, dedp), np.eye(len(parameters)))
+
+    def radius_at(pressure: float, r_min: float) -> float:
+        return brentq(lambda r: tov_integration.sol(r)[2] - pressure, r_min, radius)
+
+    surface_level: float = SURFACE_PRESSURE_LEVEL * central_pressure
+    jump_pressures: list[float] = sorted(
+        {
+            p
+            for p in (*tov_input.interface_pressures, *eos.discontinuity_pressures())
+            if surface_level < p < central_pressure
+        },
+        reverse=True,
+    )
+
+    budget = IntegrationBudget(tov_input.MAX_WALL_TIME, tov_input.MAX_RHS_EVALUATIONS)
+    r: float = tov_input.MIN_RADIUS
+    sensitivity: Array = np.zeros((3, len(parameters)))
+    sensitivity[2, 0] = 1.0
+    nfev: int = 0
+
+    for jump_pressure in [*jump_pressures, surface_level]:
+        r_jump: float = radius_at(jump_pressure, r)
+        segment: Any = solve_ivp(
+            budget.budgeted(sensitivity_equations),
+            (r, r_jump),
+            sensitivity.ravel(),
+            **ivp_method(tov_input.method, sensitivity_jacobian),
+            rtol=tov_input.RELATIVE_TOLERANCE,
+            atol=tov_input.ABSOLUTE_TOLERANCE[2],
+        )
+        if not segment.success:
+            raise TOVIntegrationError(
+                "The integration of the sensitivity eqs. was not successfull..."
+            )
+        nfev += segment.nfev
+        r, sensitivity = r_jump, segment.y[:, -1].reshape(3, -1)
+
+        y: Array = tov_integration.sol(r)
+        y[2] = jump_pressure
+        f_minus: Array = tov_rhs(r, y, eos.energy_density_from(jump_pressure * (1 + 1e-10)))
+        dr_jump: Array = -sensitivity[2] / f_minus[2]
+        if jump_pressure != surface_level:
+            f_plus = tov_rhs(r, y, eos.energy_density_from(jump_pressure * (1 - 1e-10)))
+            sensitivity = sensitivity + np.outer(f_minus - f_plus, dr_jump)
+
+    # thin outer layer: R - r = h(p_level) / (dv/dr), with dv/dr = m/r^2/(1 - 2m/r)
+    m: float = y[1]
+    dm_level: Array = sensitivity[1] + f_minus[1] * dr_jump
+    exp_lambda: float = 1 - 2 * m / r
+    dvdr: float = m / r**2 / exp_lambda
+    ddvdr_dr: float = -2 * m / r**3 / exp_lambda - dvdr * 2 * m / r**2 / exp_lambda
+    ddvdr_dm: float = 1 / r**2 / exp_lambda + dvdr * 2 / r / exp_lambda
+    layer_enthalpy = float(pseudo_enthalpies(eos, [surface_level])[0])
+
+    radius_gradient: Array = dr_jump - layer_enthalpy / dvdr**2 * (
+        ddvdr_dr * dr_jump + ddvdr_dm * dm_level
+    )
+    mass_gradient: Array = dm_level + f_minus[1] * (radius_gradient - dr_jump)
+
+    tov_integration.update(
+        sensitivity_parameters=parameters,
+        radius_gradient=radius_gradient,
+        mass_gradient=mass_gradient,
+        sensitivity_nfev=nfev,
+    )
+    return tov_integration
+
+
+def tov_jacobian(r: float, m: float, p: float, e: float, dedp: float) -> Array:
+    """Jacobian of the TOV equations, d(dv/dr, dm/dr, dp/dr)/d(v, m, p)."""
+    exp_lambda: float = 1 - 2 * m / r
+    dvdr: float = time_metric_fn_derivative(r, p, m)
+    ddvdr_dm: float = 1 / r**2 / exp_lambda + dvdr * 2 / r / exp_lambda
+    ddvdr_dp: float = 4 * np.pi * r * cf.MEV_FM3_TO_KM_2 / exp_lambda
+
+    return np.array(
+        [
+            [0.0, ddvdr_dm, ddvdr_dp],
+            [0.0, 0.0, mass_derivative(r, dedp)],
+            [
+                0.0,
+                -(e + p) * ddvdr_dm,
+                -(dedp + 1) * dvdr - (e + p) * ddvdr_dp,
+            ],
+        ]
+    )
+
+
+def ivp_method(
+    method: str, jacobian: Optional[Callable[..., Array]] = None
+) -> dict[str, Any]:
+    """solve_ivp keyword arguments for one of INTEGRATION_METHODS.
+    The implicit methods (Radau, BDF) and LSODA get the analytic Jacobian,
+    if any, instead of estimating it by finite differences.
+    "auto" selects LSODA, which starts with the nonstiff Adams method and
+    switches to BDF where it detects stiffness (e.g. in the crust, as p -> 0,
+    and around soft phase transitions), and back."""
+    ivp_kwargs: dict[str, Any] = {"method": "LSODA" if method == "auto" else method}
+    if (jacobian is not None) and (ivp_kwargs["method"] != "DOP853"):
+        ivp_kwargs["jac"] = jacobian
+
+    return ivp_kwargs
+
+
+def pseudo_enthalpies(eos: EquationOfState, pressures: list[float]) -> Array:
+    """Pseudo-enthalpy h(p) = int_0^p dp'/(e + p') at each of the (increasing)
+    'pressures', integrating in log(p) between consecutive pressures so that
+    the integrand never straddles a phase-transition interface.
+    Tables are not extrapolated: for tabulated EOSs, h is measured from the
+    lowest tabulated pressure."""
+
+    def integrand(log_p: float) -> float:
+        p: float = np.exp(log_p)
+        return p / (eos.energy_density_from(p) + p)
+
+    log_p0: float = float(np.log(pressures[0]))
+    log_lowest: float = log_p0 + LOG_PRESSURE_FLOOR
+    lowest_pressure: Optional[float] = lowest_tabulated_pressure(eos)
+    if lowest_pressure is not None:
+        log_lowest = min(max(log_lowest, float(np.log(lowest_pressure))), log_p0)
+
+    log_nodes: list[float] = [log_lowest, *[float(np.log(p)) for p in pressures]]
+
+    return np.cumsum(
+        [
+            quad(integrand, lower, upper, epsrel=1e-10, limit=200)[0]
+            for lower, upper in zip(log_nodes[:-1], log_nodes[1:])
+        ]
+    )
+
+
+def lowest_tabulated_pressure(eos: EquationOfState) -> Optional[float]:
+    """Lowest pressure of a tabulated EOS, or of the outer phase of a hybrid
+    EOS, None if it is not tabulated."""
+    while hasattr(eos, "eos1"):
+        eos = eos.eos1  # type: ignore
+    if isinstance(eos, (RIPEOS, TabulatedEOS)):
+        return float(eos.pressures[0])
+    return None
+
+
+def interface_event(interface_pressure: float, r: float, y: Array) -> float:
+    """Event to locate a phase-transition interface, p(r) = p_interface."""
+    return y[2] - interface_pressure
+
+
 @functools.lru_cache
 def time_metric_fn_derivative(r: float, p: float, m: float) -> float:
     exp_lambda: float = np.exp(-2 * radial_metric_fn(r, m))
@@ -154,3 +729,7 @@ class TOVIntegrationError(Exception):
 
 class BoundaryNotFoundError(Exception):
     pass
+
+
+class IntegrationBudgetExceededError(Exception):
+    pass
@@ -0,0 +1,68 @@
+from typing import Any, Iterable
+
+import numpy as np
+import pandas as pd
+
+from .constellation import create_stellar_family
+from .factory import StarStabilityFactory
+from .tov_solver import Array
+
+TURNING_POINT_NEIGHBOURS: int = 1
+STABILITY_METHODS: tuple[str, ...] = ("turning_point", "radial_oscillations")
+
+
+def create_classified_family(
+    fac: StarStabilityFactory,
+    central_pressures: Iterable[float],
+    neighbours: int = TURNING_POINT_NEIGHBOURS,
+) -> pd.DataFrame:
+    """Creates a family of stars/hybrid stars and classifies their stability
+    with the turning-point criterion (stable where dM/dp_c > 0), solving the
+    radial oscillations only for the stars that need them:
+    the 'neighbours' closest stars on each side of a turning point, and the
+    hybrid stars with slow conversions, for which the criterion fails.
+    Adds the columns 'stable' and 'stability_method' (see STABILITY_METHODS);
+    omega_squared and mode are NaN for stars classified by turning points."""
+    central_pressures = np.sort(np.fromiter(central_pressures, dtype=float))
+    family: pd.DataFrame = create_stellar_family(fac.star_fac, central_pressures)
+
+    dMdlogpc: Array = np.gradient(family["mass"], np.log(central_pressures))
+    family["stable"] = dMdlogpc > 0
+    family["stability_method"] = STABILITY_METHODS[0]
+
+    needs_oscillations: Array = near_turning_points(
+        family["stable"].to_numpy(), neighbours
+    ) | turning_point_criterion_fails(fac, family)
+
+    if needs_oscillations.any():
+        oscillated: pd.DataFrame = create_stellar_family(
+            fac, central_pressures[needs_oscillations]
+        )
+        oscillated.index = family.index[needs_oscillations]
+        for col in ("mode", "omega_squared"):
+            family[col] = oscillated[col]
+        family.loc[needs_oscillations, "stable"] = oscillated["omega_squared"] > 0
+        family.loc[needs_oscillations, "stability_method"] = STABILITY_METHODS[1]
+
+    return family
+
+
+def near_turning_points(stable: Array, neighbours: int) -> Array:
+    """Mask of the stars within 'neighbours' stars of a stability change."""
+    changes: Array = np.flatnonzero(stable[1:] != stable[:-1])
+    mask = np.zeros_like(stable, dtype=bool)
+    for i in changes:
+        mask[max(i + 1 - neighbours, 0) : i + 1 + neighbours] = True
+
+    return mask
+
+
+def turning_point_criterion_fails(fac: Any, family: pd.DataFrame) -> Array:
+    """Hybrid stars with a quark core and slow conversions at the interface
+    can be stable beyond the maximum mass, where dM/dp_c < 0."""
+    if (getattr(fac, "conversion_speed", None) != "slow") or (
+        "core_radius" not in family
+    ):
+        return np.zeros(len(family), dtype=bool)
+
+    return (family["core_radius"] > 0).to_numpy()
@@ -0,0 +1,301 @@
+import os
+import sys
+import time
+import uuid
+import queue
+import pickle
+import threading
+import multiprocessing
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+from concurrent.futures import Executor, Future
+from multiprocessing.managers import BaseManager
+
+AUTHKEY_VARIABLE: str = "WORK_QUEUE_AUTHKEY"
+RECONNECT_INTERVAL: float = 1.0
+HEARTBEAT_INTERVAL: float = 1.0
+# a worker silent for this long [s] is lost, and its task is requeued
+WORKER_TIMEOUT: float = 30.0
+# a task whose workers are lost more often than this fails
+MAX_REQUEUES: int = 2
+
+Task = tuple[int, bytes]
+
+
+class WorkerLostError(RuntimeError):
+    pass
+
+
+class TaskBoard:
+    """Tasks of the work queue server, with the task held by each worker,
+    so that the task of a lost worker can be requeued. Taking a task and
+    recording its holder is atomic, since both happen in the server."""
+
+    def __init__(self) -> None:
+        self.tasks: "queue.Queue[Task]" = queue.Queue()
+        self.held: dict[str, Task] = {}
+        self.seen: dict[str, float] = {}
+        self.lock = threading.Lock()
+
+    def put(self, task: Task) -> None:
+        self.tasks.put(task)
+
+    def take(self, worker_id: str) -> Task:
+        task: Task = self.tasks.get()
+        with self.lock:
+            self.held[worker_id] = task
+            self.seen[worker_id] = time.time()
+        return task
+
+    def beat(self, worker_id: str) -> None:
+        with self.lock:
+            self.seen[worker_id] = time.time()
+
+    def done(self, worker_id: str) -> None:
+        with self.lock:
+            self.held.pop(worker_id, None)
+
+    def silent(self, timeout: float) -> list[str]:
+        """Workers holding a task, silent for more than 'timeout' [s]."""
+        now: float = time.time()
+        with self.lock:
+            return [w for w in self.held if now - self.seen[w] > timeout]
+
+    def release(self, worker_id: str) -> Optional[Task]:
+        """Task held by a lost worker, if any, no longer held by it."""
+        with self.lock:
+            self.seen.pop(worker_id, None)
+            return self.held.pop(worker_id, None)
+
+
+# board and results of the work queue server, only used in its own process
+_board: TaskBoard = TaskBoard()
+_results: "queue.Queue[Any]" = queue.Queue()
+
+
+def task_board() -> TaskBoard:
+    return _board
+
+
+def result_queue() -> "queue.Queue[Any]":
+    return _results
+
+
+class WorkQueueServer(BaseManager):
+    pass
+
+
+WorkQueueServer.register("board", callable=task_board)
+WorkQueueServer.register("results", callable=result_queue)
+
+
+class WorkQueueClient(BaseManager):
+    pass
+
+
+WorkQueueClient.register("board")
+WorkQueueClient.register("results")
+
+
+@dataclass
+class WorkQueueExecutor(Executor):
+    """Executor whose tasks are run by workers connected through TCP to a
+    work queue served at 'address', from this machine or from any node of
+    a cluster (see run_worker). Each worker takes the next task as soon as
+    it finishes the previous one, so the load is balanced dynamically:
+    heterogeneous tasks (e.g. hybrid stars with radial oscillations next to
+    plain TOV stars) never wait behind a statically assigned chunk.
+    Starts 'local_workers' worker processes on this machine; remote workers
+    must be given the same 'authkey' (random by default, i.e. only local
+    workers). Tasks and results are pickled, so functions and arguments
+    must be picklable, as with ProcessPoolExecutor. Cancelling a future
+    only discards its result, since its task may already be running.
+    The task of a worker that dies (or of a remote worker silent for
+    WORKER_TIMEOUT) is requeued, and the local workers are replaced; a task
+    lost more than MAX_REQUEUES times fails with a WorkerLostError."""
+
+    address: tuple[str, int] = ("127.0.0.1", 0)
+    authkey: Optional[bytes] = None
+    local_workers: int = field(default_factory=lambda: os.cpu_count() or 1)
+
+    def __post_init__(self) -> None:
+        if self.local_workers < 0:
+            raise ValueError("local_workers must be non-negative.")
+        if self.authkey is None:
+            self.authkey = os.urandom(32)
+
+        self.server = WorkQueueServer(self.address, self.authkey)
+        self.server.start()
+        self.address = self.server.address  # type: ignore
+        self.board: Any = self.server.board()  # type: ignore
+        self.results: Any = self.server.results()  # type: ignore
+
+        self.futures: dict[int, Future] = {}
+        self.requeues: dict[int, int] = {}
+        self.lock = threading.Lock()
+        self.next_id: int = 0
+        self.closing: bool = False
+        self.workers: dict[str, multiprocessing.Process] = {}
+        for _ in range(self.local_workers):
+            self.start_worker()
+        self.collector = threading.Thread(target=self.collect, daemon=True)
+        self.collector.start()
+
+    def start_worker(self) -> None:
+        worker_id: str = uuid.uuid4().hex
+        self.workers[worker_id] = multiprocessing.Process(
+            target=run_worker,
+            args=(self.address, self.authkey),
+            kwargs={"worker_id": worker_id},
+            daemon=True,
+        )
+        self.workers[worker_id].start()
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        future: Future = Future()
+        with self.lock:
+            task_id, self.next_id = (self.next_id, self.next_id + 1)
+            self.futures[task_id] = future
+        self.board.put((task_id, pickle.dumps((fn, args, kwargs))))
+
+        return future
+
+    def collect(self) -> None:
+        """Resolves the futures as the results arrive, until None, and
+        requeues the tasks of the lost workers in between."""
+        while True:
+            try:
+                result: Any = self.results.get(timeout=HEARTBEAT_INTERVAL)
+            except queue.Empty:
+                result = ()
+            if result is None:
+                return
+            if result:
+                task_id, payload = result
+                self.resolve(task_id, *pickle.loads(payload))
+            self.requeue_lost_tasks()
+
+    def resolve(self, task_id: int, succeeded: bool, value: Any) -> None:
+        with self.lock:
+            future: Optional[Future] = self.futures.pop(task_id, None)
+            self.requeues.pop(task_id, None)
+        # None if the task was requeued and already ran elsewhere
+        if (future is None) or not future.set_running_or_notify_cancel():
+            return
+        if succeeded:
+            future.set_result(value)
+        else:
+            future.set_exception(value)
+
+    def requeue_lost_tasks(self) -> None:
+        with self.lock:
+            if self.closing:
+                return
+            dead: list[str] = [w for w, p in self.workers.items() if not p.is_alive()]
+            for worker_id in dead:
+                del self.workers[worker_id]
+                self.start_worker()
+
+        for worker_id in dead + self.board.silent(WORKER_TIMEOUT):
+            task: Optional[Task] = self.board.release(worker_id)
+            if task is None:
+                continue
+            with self.lock:
+                self.requeues[task[0]] = self.requeues.get(task[0], 0) + 1
+                lost: bool = self.requeues[task[0]] > MAX_REQUEUES
+            if lost:
+                error = WorkerLostError("The workers running the task were lost.")
+                self.resolve(task[0], False, error)
+            else:
+                self.board.put(task)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Without 'wait', the outstanding futures are cancelled (they could
+        not be resolved once the server is gone) and the server and local
+        workers are stopped in the background."""
+        with self.lock:
+            pending: list[Future] = list(self.futures.values())
+        if cancel_futures or not wait:
+            for future in pending:
+                future.cancel()
+        if wait:
+            for future in pending:
+                if not future.cancelled():
+                    future.exception()
+            self.stop()
+        else:
+            threading.Thread(target=self.stop, daemon=True).start()
+
+    def stop(self) -> None:
+        with self.lock:
+            self.closing = True
+        self.results.put(None)
+        self.collector.join()
+        self.server.shutdown()
+        # idle workers stop when the server goes away; the others run
+        # tasks whose futures were cancelled
+        for worker in self.workers.values():
+            worker.terminate()
+            worker.join()
+
+
+def run_task(payload: bytes) -> bytes:
+    """Pickled (True, result) or (False, exception) of a pickled task."""
+    try:
+        fn, args, kwargs = pickle.loads(payload)
+        outcome: tuple[bool, Any] = (True, fn(*args, **kwargs))
+    except Exception as error:
+        outcome = (False, error)
+    try:
+        return pickle.dumps(outcome)
+    except Exception as error:
+        return pickle.dumps((False, RuntimeError(f"Unpicklable outcome: {error!r}")))
+
+
+def run_worker(
+    address: tuple[str, int],
+    authkey: bytes,
+    persistent: bool = False,
+    worker_id: Optional[str] = None,
+) -> None:
+    """Runs the tasks of the work queue at 'address', one at a time, until
+    the queue is shut down, sending a heartbeat every HEARTBEAT_INTERVAL.
+    A 'persistent' worker then waits for the next work queue at the same
+    address (e.g. the next family of an ensemble), retrying to connect
+    every RECONNECT_INTERVAL seconds. Each connection has its own worker
+    id, unless 'worker_id' is given."""
+    while True:
+        stopped = threading.Event()
+        try:
+            client = WorkQueueClient(address, authkey)
+            client.connect()
+            board, results = (client.board(), client.results())  # type: ignore
+            connection_id: str = worker_id or uuid.uuid4().hex
+            threading.Thread(
+                target=send_heartbeats, args=(board, connection_id, stopped), daemon=True
+            ).start()
+            while True:
+                task_id, payload = board.take(connection_id)
+                results.put((task_id, run_task(payload)))
+                board.done(connection_id)
+        except (ConnectionError, EOFError):
+            if not persistent:
+                return
+        finally:
+            stopped.set()
+        time.sleep(RECONNECT_INTERVAL)
+
+
+def send_heartbeats(board: Any, worker_id: str, stopped: threading.Event) -> None:
+    try:
+        while not stopped.wait(HEARTBEAT_INTERVAL):
+            board.beat(worker_id)
+    except (ConnectionError, EOFError):
+        pass
+
+
+if __name__ == "__main__":
+    # worker of a remote node: python -m <package>.star.work_queue host port
+    # with the authkey of the WorkQueueExecutor in $WORK_QUEUE_AUTHKEY
+    host, port = sys.argv[1:3]
+    run_worker((host, int(port)), os.environ[AUTHKEY_VARIABLE].encode(), persistent=True)
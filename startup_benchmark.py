@@ -0,0 +1,59 @@
+import sys
+import time
+import functools
+import subprocess
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from .equationsofstate.massless_mit_bm import MasslessMITBM
+from .star.constellation import ExecutorFactory, create_stars, preloaded_pool
+from .star.factory import StarFactory
+from .star.tov_solver import TOVInput
+
+MODULES: tuple[str, ...] = tuple(
+    f"{__package__}.{module}"
+    for module in ("star.constellation", "star.factory", "hybrid_star.factory")
+)
+REPEATS: int = 5
+
+
+def import_time(module: str) -> float:
+    """Time [s] to import 'module' in a fresh interpreter."""
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return float(output.stdout)
+
+
+def time_to_star(executor: ExecutorFactory) -> float:
+    """Time [s] to create a single star on a new pool, i.e. a short job."""
+    start = time.perf_counter()
+    create_stars(StarFactory(TOVInput(MasslessMITBM())), [100.0], executor)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Prints the import time of each of MODULES and the time to the first
+    star on each kind of new pool, the best of REPEATS runs."""
+    for module in MODULES:
+        best = min(import_time(module) for _ in range(REPEATS))
+        print(f"import {module}: {best:.3f} s")
+
+    for name, executor in (
+        ("ProcessPoolExecutor", ProcessPoolExecutor),
+        (
+            "spawning ProcessPoolExecutor",
+            functools.partial(
+                ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn")
+            ),
+        ),
+        ("preloaded_pool", preloaded_pool),
+    ):
+        best = min(time_to_star(executor) for _ in range(REPEATS))
+        print(f"one star on a new {name}: {best:.3f} s")
+
+
+if __name__ == "__main__":
+    # from the directory holding the package: python -m <package>.startup_benchmark
+    main()